@@ -0,0 +1,341 @@
+"""Performance Benchmark Suite
+Times the hot paths of the multi-asset runner on fixed-size synthetic
+datasets, so performance changes can be tracked from commit to commit:
+
+- create_data_feed: CSV parsing and the binary .npy cache (feed run alone)
+- strategy[ASSET]: a full SunriseOgle backtest for each asset profile
+  (plus the first asset with sparse evaluation)
+- aggregate_portfolio_results: equity alignment plus portfolio metrics
+- generate_monthly_statistics: the monthly tables from in-memory trades
+- sequential[N assets]: run_sequential_backtest for one asset and for
+  all of them, measured once; its peak memory should stay flat as the
+  number of assets grows, as each asset's engine is released after it runs
+
+Every benchmark reports its wall time (best of --repeat runs), throughput
+(bars, rows or trades per second) and the tracemalloc peak of one extra,
+separately measured run. The datasets come from synthetic_data.py with a
+fixed seed, so two runs with the same --bars and --seed process exactly
+the same bars.
+
+Results are written as JSON. ``compare`` checks a run against a saved
+baseline and exits with status 1 when a benchmark got slower, or uses more
+memory, beyond the threshold.
+
+Usage:
+    python benchmark.py run --output results/benchmarks/baseline.json
+    python benchmark.py run --bars 50000 --repeat 5
+    python benchmark.py compare results/benchmarks/latest.json results/benchmarks/baseline.json --threshold 10
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime as dt
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.append(str(BASE_DIR / 'strategies'))
+
+DEFAULT_OUTPUT_DIR = BASE_DIR / 'results' / 'benchmarks'
+DEFAULT_BARS = 20000
+DEFAULT_SEED = 42
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 10.0  # Percent
+STARTING_CASH = 100000
+
+DATASET_START = '2024-01-01'
+
+
+def measure(fn, repeat, setup=None):
+    """Time ``fn`` ``repeat`` times and trace one more call's memory
+
+    ``fn`` returns the number of units (bars, rows, trades) it processed.
+    ``setup`` runs untimed before every call.
+
+    Returns:
+        dict: wall_s (best run), mean_s, units, per_s and peak_mb
+    """
+    walls = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        units = fn()
+        walls.append(time.perf_counter() - start)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    wall = min(walls)
+    return {
+        'wall_s': wall,
+        'mean_s': sum(walls) / len(walls),
+        'units': units,
+        'per_s': units / wall if wall > 0 else 0.0,
+        'peak_mb': peak / 2 ** 20,
+    }
+
+
+@contextlib.contextmanager
+def _patched(module, **values):
+    """Temporarily override module-level settings"""
+    saved = {name: getattr(module, name) for name in values}
+    for name, value in values.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(module, name, value)
+
+
+def _environment(bars, seed, repeat):
+    import backtrader as bt
+    import pandas as pd
+
+    return {
+        'timestamp': dt.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'backtrader': bt.__version__,
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'bars': bars,
+        'seed': seed,
+        'repeat': repeat,
+    }
+
+
+def run_benchmarks(bars=DEFAULT_BARS, seed=DEFAULT_SEED, repeat=DEFAULT_REPEAT, assets=None, verbose=True):
+    """Run the benchmark suite in a scratch directory
+
+    Args:
+        bars: Bars per asset in the synthetic datasets
+        seed: Dataset random seed
+        repeat: Timed runs per benchmark (the best one is reported)
+        assets: Asset names to backtest (default: every runner asset)
+        verbose: Print each result as it completes
+
+    Returns:
+        dict: 'environment' metadata and 'benchmarks' (name -> measure() dict)
+    """
+    import backtrader as bt
+    import sunrise_ogle_multi_asset as runner
+    from data_cache import load_ohlcv_cache
+    from synthetic_data import write_symbol
+
+    asset_names = list(assets or runner.ASSETS)
+    benchmarks = {}
+
+    def record(name, unit, fn, setup=None, runs=None):
+        # Strategy and report output would swamp the benchmark table
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = measure(fn, runs or repeat, setup)
+        result['unit'] = unit
+        benchmarks[name] = result
+        if verbose:
+            print(f"  {name:<30} {result['wall_s']:>8.3f}s  {result['per_s']:>12,.0f} {unit}/s  "
+                  f"{result['peak_mb']:>8.1f} MB")
+
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='sunrise_bench_') as workdir:
+        workdir = Path(workdir)
+        data_dir = workdir / 'data'
+        for name in asset_names:
+            write_symbol(data_dir / runner.ASSETS[name]['data_file'], name, DATASET_START, bars=bars, seed=seed)
+
+        # Strategies write their journals relative to the working directory
+        os.chdir(workdir)
+        try:
+            feed_file = runner.ASSETS[asset_names[0]]['data_file']
+
+            def run_feed(use_cache):
+                def fn():
+                    cerebro = bt.Cerebro(stdstats=False)
+                    data = runner.create_data_feed(feed_file, use_cache=use_cache, data_dir=data_dir)
+                    cerebro.adddata(data)
+                    cerebro.run()
+                    return len(data)
+                return fn
+
+            load_ohlcv_cache(data_dir / feed_file)  # Build the cache outside the timings
+            record('create_data_feed[csv]', 'bars', run_feed(False))
+            record('create_data_feed[npy]', 'bars', run_feed(True))
+
+            # Sparse evaluation on the first asset (same trades, fewer evaluated bars)
+            sparse_default = runner.SPARSE_EVALUATION
+            runner.SPARSE_EVALUATION = True
+            try:
+                name = asset_names[0]
+                record(f'strategy[{name},sparse]', 'bars',
+                       lambda: len(runner.run_single_asset_backtest(
+                           name, runner.ASSETS[name], None, None, STARTING_CASH,
+                           phase_timing=False, data_dir=data_dir)['data']))
+            finally:
+                runner.SPARSE_EVALUATION = sparse_default
+
+            results = {}
+            for name in asset_names:
+                def run_strategy(name=name):
+                    result = runner.run_single_asset_backtest(
+                        name, runner.ASSETS[name], None, None, STARTING_CASH,
+                        phase_timing=False, data_dir=data_dir)
+                    results[name] = runner.summarize_backtest_result(result)
+                    return len(result['data'])
+
+                record(f'strategy[{name}]', 'bars', run_strategy)
+
+            summaries = [results[name] for name in asset_names]
+
+            def run_aggregation():
+                equity = runner.build_portfolio_equity(summaries, freq=runner.PORTFOLIO_EQUITY_FREQ)
+                runner.aggregate_portfolio_results(summaries, equity)
+                return len(equity)
+
+            record('aggregate_portfolio_results', 'rows', run_aggregation)
+
+            def run_monthly_statistics():
+                runner.generate_monthly_statistics(summaries)
+                return len(runner.closed_trades_frame(summaries))
+
+            record('generate_monthly_statistics', 'trades', run_monthly_statistics)
+
+            def run_sequential(names):
+                def fn():
+                    _, summaries = runner.run_sequential_backtest(
+                        assets=names, headless=True, checkpoint_dir=None,
+                        monte_carlo_paths=0, phase_timing=False)
+                    return sum(summary['bars'] for summary in summaries)
+                return fn
+
+            # One run each is enough for the memory peak
+            with _patched(runner, DATA_DIR=data_dir, TEMP_REPORTS_DIR=workdir / 'temp_reports',
+                          FROMDATE=DATASET_START, TODATE=None):
+                for names in ([asset_names[0]], asset_names):
+                    record(f'sequential[{len(names)} assets]', 'bars',
+                           run_sequential(names), runs=1)
+        finally:
+            os.chdir(previous_cwd)
+
+    return {'environment': _environment(bars, seed, repeat), 'benchmarks': benchmarks}
+
+
+def compare_results(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """Per-benchmark changes of ``current`` against ``baseline``
+
+    A benchmark regresses when its wall time or tracemalloc peak grew by
+    more than ``threshold`` percent.
+
+    Returns:
+        list: One dict per benchmark present in both runs (name, the
+        percentage changes and 'regressions', a list of metric names)
+    """
+    rows = []
+    for name, base in baseline['benchmarks'].items():
+        if name not in current['benchmarks']:
+            continue
+        cur = current['benchmarks'][name]
+        row = {'name': name, 'regressions': []}
+        for metric in ('wall_s', 'peak_mb', 'per_s'):
+            before, after = base[metric], cur[metric]
+            row[metric] = (after, before, (after / before - 1.0) * 100.0 if before else 0.0)
+        for metric in ('wall_s', 'peak_mb'):
+            if row[metric][2] > threshold:
+                row['regressions'].append(metric)
+        rows.append(row)
+    return rows
+
+
+def print_comparison(rows, current, baseline, threshold):
+    for key in ('bars', 'seed'):
+        if current['environment'].get(key) != baseline['environment'].get(key):
+            print(f"[WARNING] {key} differs: {current['environment'].get(key)} vs baseline "
+                  f"{baseline['environment'].get(key)}; results are not comparable")
+
+    print(f"{'BENCHMARK':<30} {'WALL':>9} {'CHANGE':>8} {'PEAK MB':>9} {'CHANGE':>8} {'THROUGHPUT':>10}")
+    for row in rows:
+        wall, peak, rate = row['wall_s'], row['peak_mb'], row['per_s']
+        flag = '  <-- REGRESSION' if row['regressions'] else ''
+        print(f"{row['name']:<30} {wall[0]:>8.3f}s {wall[2]:>+7.1f}% {peak[0]:>9.1f} {peak[2]:>+7.1f}% "
+              f"{rate[2]:>+9.1f}%{flag}")
+
+    regressed = [row['name'] for row in rows if row['regressions']]
+    if regressed:
+        print(f"\n[REGRESSION] {len(regressed)} benchmark(s) beyond {threshold:.1f}%: {', '.join(regressed)}")
+    else:
+        print(f"\n[OK] No regressions beyond {threshold:.1f}%")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="SunriseOgle performance benchmarks")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="Run the benchmark suite and save the results")
+    run.add_argument('--bars', type=int, default=DEFAULT_BARS,
+                     help=f"Bars per asset in the synthetic datasets (default: {DEFAULT_BARS})")
+    run.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                     help=f"Dataset random seed (default: {DEFAULT_SEED})")
+    run.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                     help=f"Timed runs per benchmark, best one reported (default: {DEFAULT_REPEAT})")
+    run.add_argument('--assets', type=lambda s: [a.strip().upper() for a in s.split(',') if a.strip()],
+                     help="Comma-separated assets to backtest (default: all)")
+    run.add_argument('--output', help="JSON output file (default: results/benchmarks/benchmark_<time>.json)")
+    run.add_argument('--baseline', help="Compare against this baseline JSON after the run")
+    run.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                     help=f"Regression threshold in percent (default: {DEFAULT_THRESHOLD})")
+
+    compare = commands.add_parser('compare', help="Compare a benchmark run against a baseline")
+    compare.add_argument('current', help="Benchmark JSON to check")
+    compare.add_argument('baseline', help="Baseline benchmark JSON")
+    compare.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                         help=f"Regression threshold in percent (default: {DEFAULT_THRESHOLD})")
+    return parser.parse_args(argv)
+
+
+def _load(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.command == 'run':
+        print(f"Benchmarking {args.bars:,} bars per asset (seed {args.seed}, best of {args.repeat})")
+        current = run_benchmarks(args.bars, args.seed, args.repeat, args.assets)
+        output = Path(args.output) if args.output else (
+            DEFAULT_OUTPUT_DIR / f"benchmark_{dt.now().strftime('%Y%m%d_%H%M%S')}.json")
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print(f"\nResults: {output}")
+        if not args.baseline:
+            return 0
+        baseline = _load(args.baseline)
+        print()
+    else:
+        current, baseline = _load(args.current), _load(args.baseline)
+
+    rows = compare_results(current, baseline, args.threshold)
+    print_comparison(rows, current, baseline, args.threshold)
+    return 1 if any(row['regressions'] for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,305 @@
+"""Binary Columnar Cache for 5-Minute CSV Feeds
+Converts the GenericCSVData layout (Date,Time,Open,High,Low,Close,Volume)
+into a compact NumPy file on first load and serves later runs from a
+memory-mapped copy through a Backtrader feed, skipping strptime parsing.
+
+The cache is keyed by the source CSV's mtime and size, so editing or
+replacing a data file transparently triggers a rebuild.
+
+Partial loads: the cached datenum column is sorted, so a fromdate/todate
+window is located by binary search (date_range_slice) and NumpyOHLCVData
+only converts those rows. Plain CSV feeds get the same from IndexedCSVData:
+a sidecar offset index (the date and byte offset of every INDEX_STRIDE-th
+row, built once by scanning the file for line breaks) lets a date-filtered
+load seek to the rows it needs instead of parsing the file from the top.
+"""
+
+import io
+import math
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import backtrader as bt
+import numpy as np
+
+CACHE_DIRNAME = '.npy_cache'
+CACHE_VERSION = 1
+
+# Structured record stored per bar: epoch seconds, Backtrader date number
+# (precomputed exactly like bt.date2num) and OHLCV as float64
+CACHE_DTYPE = np.dtype([
+    ('epoch', '<i8'),
+    ('datenum', '<f8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+])
+
+# Sidecar CSV offset index: one entry per INDEX_STRIDE rows
+INDEX_STRIDE = 256
+INDEX_DTYPE = np.dtype([
+    ('datenum', '<f8'),
+    ('offset', '<i8'),
+])
+
+# Partial loads read this much extra on both sides; the feed's own
+# fromdate/todate filter still decides which bars are used
+_RANGE_MARGIN = timedelta(days=1)
+
+_SECONDS_PER_DAY = 86400
+_EPOCH_ORDINAL = 719163  # date(1970, 1, 1).toordinal()
+
+
+def _cache_path(csv_path, cache_dir=None, kind=''):
+    """Return the cache file path for a CSV, keyed by its mtime and size"""
+    csv_path = Path(csv_path)
+    stat = csv_path.stat()
+    cache_dir = Path(cache_dir) if cache_dir else csv_path.parent / CACHE_DIRNAME
+    key = f"v{CACHE_VERSION}_{stat.st_mtime_ns}_{stat.st_size}"
+    return cache_dir / f"{csv_path.stem}.{kind}{key}.npy"
+
+
+def _save_atomic(array, cache_file, stale_pattern):
+    """Write ``array`` to ``cache_file``, dropping older files matching ``stale_pattern``"""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # Drop caches built from older versions of the same CSV
+    for stale in cache_file.parent.glob(stale_pattern):
+        if stale != cache_file:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+    # Write atomically so concurrent workers never read a partial file
+    tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_file, 'wb') as f:
+        np.save(f, array)
+    os.replace(tmp_file, cache_file)
+
+
+def _epoch_to_datenum(epoch):
+    """Convert naive epoch seconds to Backtrader date numbers
+
+    Mirrors bt.date2num, which sums (ordinal, hour/24, minute/1440,
+    second/86400) with math.fsum, so results are bit-identical to the
+    values GenericCSVData would produce.
+    """
+    days, seconds = np.divmod(epoch, _SECONDS_PER_DAY)
+    hours, rem = np.divmod(seconds, 3600)
+    minutes, secs = np.divmod(rem, 60)
+    terms = zip(
+        (days + _EPOCH_ORDINAL).astype(np.float64).tolist(),
+        (hours / 24.0).tolist(),
+        (minutes / 1440.0).tolist(),
+        (secs / 86400.0).tolist(),
+    )
+    return np.array([math.fsum(t) for t in terms], dtype=np.float64)
+
+
+def _build_cache(csv_path, cache_file):
+    """Parse the CSV once and write the structured NumPy cache file"""
+    import pandas as pd
+
+    frame = pd.read_csv(
+        csv_path,
+        dtype={0: str, 1: str},
+        float_precision='round_trip',  # match float(str) used by GenericCSVData
+    )
+    stamps = pd.to_datetime(
+        frame.iloc[:, 0] + 'T' + frame.iloc[:, 1],
+        format='%Y%m%dT%H:%M:%S'
+    )
+    epoch = stamps.to_numpy(dtype='datetime64[s]').astype(np.int64)
+
+    records = np.empty(len(frame), dtype=CACHE_DTYPE)
+    records['epoch'] = epoch
+    records['datenum'] = _epoch_to_datenum(epoch)
+    for column, field in zip(frame.columns[2:7], ('open', 'high', 'low', 'close', 'volume')):
+        records[field] = frame[column].to_numpy(dtype=np.float64)
+
+    _save_atomic(records, cache_file, f"{Path(csv_path).stem}.v*.npy")
+
+
+def load_ohlcv_cache(csv_path, cache_dir=None):
+    """Load (building if needed) the memory-mapped OHLCV records for a CSV
+
+    Args:
+        csv_path: Path to the source CSV file
+        cache_dir: Optional cache directory (default: <csv dir>/.npy_cache)
+
+    Returns:
+        numpy.ndarray: Read-only memory-mapped structured array (CACHE_DTYPE)
+    """
+    csv_path = Path(csv_path)
+    cache_file = _cache_path(csv_path, cache_dir)
+    if not cache_file.exists():
+        _build_cache(csv_path, cache_file)
+    return np.load(cache_file, mmap_mode='r')
+
+
+def date_range_slice(datenums, fromdate=None, todate=None):
+    """Rows of a sorted date number column within [fromdate, todate]
+
+    Args:
+        datenums: Sorted Backtrader date numbers (e.g. records['datenum'])
+        fromdate: Optional first datetime (inclusive)
+        todate: Optional last datetime (inclusive)
+
+    Returns:
+        slice: Row range, found by binary search
+    """
+    start = 0 if fromdate is None else int(np.searchsorted(datenums, bt.date2num(fromdate), side='left'))
+    end = len(datenums) if todate is None else int(np.searchsorted(datenums, bt.date2num(todate), side='right'))
+    return slice(start, max(start, end))
+
+
+def _widen(fromdate, todate):
+    """Date bounds widened by _RANGE_MARGIN (None stays open-ended)"""
+    return (fromdate - _RANGE_MARGIN if fromdate is not None else None,
+            todate + _RANGE_MARGIN if todate is not None else None)
+
+
+def _build_csv_index(csv_path, index_file, row_datenum, stride):
+    """Scan the CSV for line starts and index every ``stride``-th row"""
+    raw = Path(csv_path).read_bytes()
+    newlines = np.flatnonzero(np.frombuffer(raw, dtype=np.uint8) == ord('\n'))
+    # Rows start after each line break (the first line is the header)
+    starts = newlines + 1
+    starts = starts[starts < len(raw)][::stride]
+
+    index = np.empty(len(starts), dtype=INDEX_DTYPE)
+    index['offset'] = starts
+    line_ends = np.searchsorted(newlines, starts).tolist()
+    for i, (start, end) in enumerate(zip(starts.tolist(), line_ends)):
+        stop = int(newlines[end]) if end < len(newlines) else len(raw)
+        index['datenum'][i] = row_datenum(raw[start:stop].decode().rstrip('\r'))
+
+    _save_atomic(index, index_file, f"{Path(csv_path).stem}.idx_v*.npy")
+    return index
+
+
+def load_csv_index(csv_path, row_datenum, cache_dir=None, stride=INDEX_STRIDE):
+    """Load (building if needed) the sidecar offset index of a CSV
+
+    Args:
+        csv_path: Path to the source CSV file (rows sorted by time)
+        row_datenum: Callable parsing one CSV row (str) into a date number
+        cache_dir: Optional cache directory (default: <csv dir>/.npy_cache)
+        stride: Rows per index entry when building
+
+    Returns:
+        numpy.ndarray: INDEX_DTYPE records (date number, byte offset)
+    """
+    index_file = _cache_path(csv_path, cache_dir, kind='idx_')
+    if index_file.exists():
+        return np.load(index_file)
+    return _build_csv_index(csv_path, index_file, row_datenum, stride)
+
+
+def read_csv_range(csv_path, row_datenum, fromdate=None, todate=None, header=True, cache_dir=None):
+    """Text of the CSV rows around [fromdate, todate], read through the offset index
+
+    Returns the header line (when ``header``) followed by every row in the
+    range, plus up to _RANGE_MARGIN and one index stride of rows on either
+    side; the feed's own date filter drops those.
+    """
+    index = load_csv_index(csv_path, row_datenum, cache_dir)
+    lo, hi = _widen(fromdate, todate)
+    # Last indexed row before the range and first indexed row after it
+    first = 0 if lo is None else max(int(np.searchsorted(index['datenum'], bt.date2num(lo), side='left')) - 1, 0)
+    last = len(index) if hi is None else int(np.searchsorted(index['datenum'], bt.date2num(hi), side='right'))
+
+    with open(csv_path, 'rb') as f:
+        text = f.readline() if header else b''
+        if len(index):
+            f.seek(int(index['offset'][first]))
+            if last < len(index):
+                text += f.read(int(index['offset'][last]) - int(index['offset'][first]))
+            else:
+                text += f.read()
+    return text.decode()
+
+
+class IndexedCSVData(bt.feeds.GenericCSVData):
+    """GenericCSVData that only parses the rows around fromdate/todate
+
+    Same parameters and bars as GenericCSVData. When a date filter is set
+    and ``dtformat`` is a format string, the rows are located through the
+    sidecar offset index (see read_csv_range); otherwise the whole file is
+    parsed as usual.
+    """
+
+    params = (('cache_dir', None),)
+
+    def start(self):
+        p = self.p
+        if (self.f is None and (p.fromdate is not None or p.todate is not None)
+                and isinstance(p.dtformat, str) and not hasattr(p.dataname, 'readline')):
+            self.f = io.StringIO(read_csv_range(p.dataname, self._row_datenum, p.fromdate, p.todate,
+                                                header=p.headers, cache_dir=p.cache_dir))
+        super(IndexedCSVData, self).start()
+
+    def _row_datenum(self, line):
+        """Date number of a CSV row, parsed like GenericCSVData._loadline"""
+        p = self.p
+        tokens = line.split(p.separator)
+        dtfield, dtformat = tokens[p.datetime], p.dtformat
+        if p.time >= 0:
+            dtfield += 'T' + tokens[p.time]
+            dtformat += 'T' + p.tmformat
+        return bt.date2num(datetime.strptime(dtfield, dtformat))
+
+
+class NumpyOHLCVData(bt.feed.DataBase):
+    """Backtrader feed serving bars from a cached OHLCV structured array
+
+    Pass the array returned by load_ohlcv_cache() as ``dataname``. The
+    fromdate/todate filters are applied by bt.feed.DataBase as usual.
+    Set ``filename`` to the source CSV so strategies that inspect
+    ``data._dataname`` (asset detection, trade reports) see the same path
+    as with GenericCSVData.
+    """
+
+    params = (('filename', None),)
+
+    def __init__(self):
+        if self.p.filename:
+            self._dataname = self.p.filename
+
+    def start(self):
+        super(NumpyOHLCVData, self).start()
+        records = self.p.dataname
+        # Only the rows around the date filter, located by binary search
+        records = records[date_range_slice(records['datenum'], *_widen(self.p.fromdate, self.p.todate))]
+        # Plain lists make per-bar access much cheaper than numpy scalars
+        self._columns = (
+            records['datenum'].tolist(),
+            records['open'].tolist(),
+            records['high'].tolist(),
+            records['low'].tolist(),
+            records['close'].tolist(),
+            records['volume'].tolist(),
+        )
+        self._size = len(records)
+        self._idx = 0
+
+    def _load(self):
+        idx = self._idx
+        if idx >= self._size:
+            return False
+        self._idx = idx + 1
+
+        datenum, opens, highs, lows, closes, volumes = self._columns
+        lines = self.lines
+        lines.datetime[0] = datenum[idx]
+        lines.open[0] = opens[idx]
+        lines.high[0] = highs[idx]
+        lines.low[0] = lows[idx]
+        lines.close[0] = closes[idx]
+        lines.volume[0] = volumes[idx]
+        lines.openinterest[0] = float('NaN')  # GenericCSVData nullvalue
+        return True
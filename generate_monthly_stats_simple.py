@@ -1,78 +1,62 @@
 """Simple Monthly Statistics Generator
-Reads trade report files and generates monthly statistics.
+Loads the structured trade journals and generates monthly statistics.
 Can be run independently after backtests complete.
+
+The journals below the reports directory (run directories included) are
+ingested into a persistent SQLite index (strategies/trade_index.py), so
+each invocation only parses the journals that are new or changed since the
+last one and computes the tables from the stored trades.
+
+Usage:
+    python generate_monthly_stats_simple.py
+    python generate_monthly_stats_simple.py temp_reports/20250725_183012_3f9a1c
+    python generate_monthly_stats_simple.py --rebuild-index
 """
 
-import pandas as pd
+import argparse
+import sys
 from pathlib import Path
-from collections import defaultdict
 import calendar
 
-def generate_monthly_statistics_from_reports(temp_reports_dir, starting_cash=100000):
-    """Generate monthly statistics by parsing trade report files
+sys.path.append(str(Path(__file__).resolve().parent / 'strategies'))
+from monthly_stats import monthly_cube, yearly_summary
+from trade_index import TradeIndex
+
+def generate_monthly_statistics_from_reports(temp_reports_dir, starting_cash=100000, index_path=None,
+                                             rebuild_index=False):
+    """Generate monthly statistics from the strategies' trade journals
     
     Args:
-        temp_reports_dir: Path to directory containing trade report files
+        temp_reports_dir: Path to directory containing trade journal files
         starting_cash: Initial portfolio balance
+        index_path: Trade index database (default: <temp_reports_dir>/.trade_index.sqlite)
+        rebuild_index: Re-read every journal instead of only new or changed ones
     """
     print(f"\n" + "="*100)
-    print(f"MONTHLY STATISTICS ANALYSIS (from trade reports)")
+    print(f"MONTHLY STATISTICS ANALYSIS (from trade journals)")
     print(f"="*100)
     
     temp_reports_path = Path(temp_reports_dir)
-    all_trades = []
     
-    # Parse all trade report files
-    if temp_reports_path.exists():
-        for report_file in temp_reports_path.glob('*_trades_*.txt'):
-            asset_name = report_file.stem.split('_trades_')[0]
-            
-            try:
-                with open(report_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                    # Extract trade entries
-                    entries = content.split('ENTRY #')
-                    
-                    for entry in entries[1:]:  # Skip first split (header)
-                        try:
-                            lines = entry.split('\n')
-                            trade_data = {'asset': asset_name}
-                            
-                            for line in lines:
-                                if line.startswith('Time:'):
-                                    time_str = line.split('Time:')[1].strip()
-                                    trade_data['entry_time'] = pd.to_datetime(time_str)
-                                elif line.startswith('Exit Time:'):
-                                    time_str = line.split('Exit Time:')[1].strip()
-                                    trade_data['exit_time'] = pd.to_datetime(time_str)
-                                elif line.startswith('PnL:'):
-                                    pnl_str = line.split('PnL:')[1].strip().replace('$', '').replace(',', '')
-                                    trade_data['pnl'] = float(pnl_str)
-                                elif line.startswith('Direction:'):
-                                    trade_data['direction'] = line.split('Direction:')[1].strip()
-                            
-                            if 'entry_time' in trade_data and 'pnl' in trade_data:
-                                all_trades.append(trade_data)
-                        except Exception as e:
-                            continue
-                            
-            except Exception as e:
-                print(f"[WARNING] Could not parse {report_file.name}: {e}")
-                continue
-    
-    if not all_trades:
-        print("[INFO] No trade report files found or no trades to analyze")
-        print(f"[INFO] Trade reports should be in: {temp_reports_path}")
+    # Closed trades from the trade index, after ingesting new or changed journals
+    with TradeIndex(temp_reports_path, index_path) as index:
+        if rebuild_index:
+            index.rebuild()
+        counts = index.sync()
+        df = index.trades()
+        journals = index.journal_count()
+    print(f"[INFO] Trade index: {journals} journals ({counts['added']} new, {counts['updated']} changed, "
+          f"{counts['removed']} removed)")
+    
+    if df.empty:
+        print("[INFO] No trade journals found or no trades to analyze")
+        print(f"[INFO] Trade journals should be in: {temp_reports_path}")
         return
     
-    # Convert to DataFrame
-    df = pd.DataFrame(all_trades)
-    df['year_month'] = df['entry_time'].dt.to_period('M')
-    df['year'] = df['entry_time'].dt.year
-    df['month'] = df['entry_time'].dt.month
-    df['date'] = df['entry_time'].dt.date
-    df['is_winner'] = df['pnl'] > 0
+    # One row per month (counts, P&L, returns on the accumulated balance)
+    cube = monthly_cube(df, starting_cash)
+    years = yearly_summary(cube, starting_cash)
+    month_names = [calendar.month_abbr[month] for month in cube['month']]
     
     # ================================================================
     # TABLE 1: MONTHLY ENTRY STATISTICS
@@ -81,41 +65,15 @@ def generate_monthly_statistics_from_reports(temp_reports_dir, starting_cash=100
     print(f"{'Year':<6} {'Month':<10} {'Total':>8} {'Winners':>8} {'Losers':>8} {'Max/Day':>8}")
     print(f"-" * 60)
     
-    monthly_entries = df.groupby('year_month').agg({
-        'pnl': 'count',
-        'is_winner': ['sum', lambda x: (~x).sum()],
-        'date': lambda x: x.value_counts().max()
-    }).reset_index()
-    
-    monthly_entries.columns = ['year_month', 'total', 'winners', 'losers', 'max_daily']
-    monthly_entries['year'] = monthly_entries['year_month'].dt.year
-    monthly_entries['month'] = monthly_entries['year_month'].dt.month
-    
-    yearly_totals = defaultdict(lambda: {'total': 0, 'winners': 0, 'losers': 0, 'max_daily': 0})
-    
-    for _, row in monthly_entries.iterrows():
-        year = row['year']
-        month = row['month']
-        month_name = calendar.month_abbr[month]
-        
-        total = int(row['total'])
-        winners = int(row['winners'])
-        losers = int(row['losers'])
-        max_daily = int(row['max_daily'])
-        
-        yearly_totals[year]['total'] += total
-        yearly_totals[year]['winners'] += winners
-        yearly_totals[year]['losers'] += losers
-        yearly_totals[year]['max_daily'] = max(yearly_totals[year]['max_daily'], max_daily)
-        
+    for month_name, year, total, winners, losers, max_daily in zip(
+            month_names, *(cube[column].tolist() for column in ('year', 'total', 'winners', 'losers', 'max_daily'))):
         print(f"{year:<6} {month_name:<10} {total:>8} {winners:>8} {losers:>8} {max_daily:>8}")
     
     # Print yearly totals
     print(f"-" * 60)
-    for year in sorted(yearly_totals.keys()):
-        data = yearly_totals[year]
-        print(f"{year:<6} {'TOTAL':<10} {data['total']:>8} {data['winners']:>8} "
-              f"{data['losers']:>8} {data['max_daily']:>8}")
+    for year, total, winners, losers, max_daily in years[['total', 'winners', 'losers', 'max_daily']].itertuples():
+        print(f"{year:<6} {'TOTAL':<10} {total:>8} {winners:>8} "
+              f"{losers:>8} {max_daily:>8}")
     
     # ================================================================
     # TABLE 2: MONTHLY PROFITABILITY (%)
@@ -124,35 +82,19 @@ def generate_monthly_statistics_from_reports(temp_reports_dir, starting_cash=100
     print(f"{'Year':<6} {'Month':<10} {'PnL ($)':>12} {'Return (%)':>12} {'Cumulative':>12}")
     print(f"-" * 60)
     
-    monthly_pnl = df.groupby('year_month')['pnl'].sum().reset_index()
-    monthly_pnl['year'] = monthly_pnl['year_month'].dt.year
-    monthly_pnl['month'] = monthly_pnl['year_month'].dt.month
-    
-    cumulative_balance = starting_cash
-    yearly_returns = defaultdict(float)
-    
-    for _, row in monthly_pnl.iterrows():
-        year = row['year']
-        month = row['month']
-        month_name = calendar.month_abbr[month]
-        monthly_profit = row['pnl']
-        
-        monthly_return = (monthly_profit / cumulative_balance) * 100 if cumulative_balance > 0 else 0
-        cumulative_balance += monthly_profit
-        yearly_returns[year] += monthly_return
-        
+    for month_name, year, monthly_profit, monthly_return, cumulative_balance in zip(
+            month_names, *(cube[column].tolist() for column in ('year', 'pnl', 'return_pct', 'balance'))):
         print(f"{year:<6} {month_name:<10} ${monthly_profit:>10,.2f} {monthly_return:>11.2f}% "
               f"${cumulative_balance:>10,.2f}")
     
     # Print yearly totals
     print(f"-" * 60)
-    for year in sorted(yearly_returns.keys()):
-        year_return = yearly_returns[year]
+    for year, year_return in years['return_pct'].items():
         print(f"{year:<6} {'TOTAL':<10} {'':<12} {year_return:>11.2f}% {'':<12}")
     
     print(f"="*100)
-    print(f"[INFO] Monthly statistics generated from {len(all_trades)} trades")
-    print(f"[INFO] Data source: Trade report files in {temp_reports_path}")
+    print(f"[INFO] Monthly statistics generated from {len(df)} trades")
+    print(f"[INFO] Data source: Trade journals in {temp_reports_path} (indexed in {index.path.name})")
     print(f"[INFO] This data can be exported for further analysis")
 
 
@@ -161,4 +103,16 @@ if __name__ == '__main__':
     BASE_DIR = Path(__file__).resolve().parent
     TEMP_REPORTS_DIR = BASE_DIR / 'temp_reports'
     
-    generate_monthly_statistics_from_reports(TEMP_REPORTS_DIR, starting_cash=100000)
+    parser = argparse.ArgumentParser(description='Monthly statistics from archived trade journals')
+    parser.add_argument('reports_dir', nargs='?', default=TEMP_REPORTS_DIR,
+                        help='Journal directory, scanned recursively (default: temp_reports/)')
+    parser.add_argument('--starting-cash', type=float, default=100000,
+                        help='Initial portfolio balance (default: 100000)')
+    parser.add_argument('--index', metavar='PATH',
+                        help='Trade index database (default: <reports_dir>/.trade_index.sqlite)')
+    parser.add_argument('--rebuild-index', action='store_true',
+                        help='Re-read every journal instead of only new or changed ones')
+    args = parser.parse_args()
+    
+    generate_monthly_statistics_from_reports(args.reports_dir, starting_cash=args.starting_cash,
+                                             index_path=args.index, rebuild_index=args.rebuild_index)
@@ -0,0 +1,544 @@
+"""SunriseOgle Parameter Sweep Optimizer
+Grid or random search over strategy parameters for one or more assets,
+distributed across a process pool. Each worker loads its asset's price
+arrays once (through the binary data cache) and reuses them, plus the
+cached EMA/ATR series, for every combination it evaluates.
+
+Results stream into a CSV table (one row per combination, flushed as soon
+as it completes) with profit factor, Sharpe, max drawdown and trade count.
+Every combination has a stable id, so re-running the same command after an
+interruption skips the rows already written and only evaluates the rest.
+
+Search space file (JSON), keyed by asset:
+
+    {
+        "EURUSD": {
+            "long_atr_min_threshold": [0.0002, 0.0003, 0.0004],
+            "long_pullback_max_candles": {"min": 1, "max": 3},
+            "window_price_offset_multiplier": {"min": 0.0, "max": 0.02, "step": 0.005},
+            "entry_start_hour": [0, 4, 7]
+        }
+    }
+
+A list gives the candidate values. A {"min", "max"[, "step"]} range is
+expanded with its step for grid search (integer ranges default to step 1)
+and sampled uniformly for random search.
+
+Backends:
+- vector (default): signal_engine.py, trade-for-trade identical to Backtrader
+- backtrader: full Cerebro run per combination (slow, for final checks)
+
+Usage:
+    python optimizer.py --space sweep.json --workers 8
+    python optimizer.py --space sweep.json --asset EURUSD --random 500 --seed 7
+"""
+
+import argparse
+import contextlib
+import csv
+import hashlib
+import io
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime as dt
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.append(str(BASE_DIR / 'strategies'))
+
+from portfolio_metrics import max_drawdown, sharpe_ratio
+
+DEFAULT_OUTPUT_DIR = BASE_DIR / 'results' / 'optimizer'
+BACKENDS = ('vector', 'backtrader')
+LEVERAGE = 30.0
+
+METRIC_COLUMNS = [
+    'trades', 'profit_factor', 'sharpe_ratio', 'max_drawdown_pct',
+    'net_pnl', 'return_pct', 'win_rate', 'elapsed_s', 'error',
+]
+
+# Per-process state populated by _init_worker()
+_WORKER = {}
+
+
+# =============================================================================
+# SEARCH SPACE
+# =============================================================================
+
+def load_search_space(path):
+    """Load a JSON search space file ({asset: {param: spec}})"""
+    with open(path, 'r', encoding='utf-8') as f:
+        space = json.load(f)
+    if not isinstance(space, dict) or not all(isinstance(v, dict) for v in space.values()):
+        raise ValueError(f"{path}: expected an object of {{asset: {{param: values}}}}")
+    return space
+
+
+def _is_int_range(spec):
+    return all(isinstance(spec.get(k, 0), int) and not isinstance(spec.get(k, 0), bool)
+               for k in ('min', 'max', 'step'))
+
+
+def _grid_values(name, spec):
+    """Expand one parameter spec into its list of grid values"""
+    if isinstance(spec, list):
+        if not spec:
+            raise ValueError(f"{name}: empty value list")
+        return spec
+    if isinstance(spec, dict) and 'min' in spec and 'max' in spec:
+        lo, hi = spec['min'], spec['max']
+        if _is_int_range(spec):
+            return list(range(lo, hi + 1, spec.get('step', 1)))
+        if 'step' not in spec:
+            raise ValueError(f"{name}: float ranges need a 'step' for grid search")
+        count = int(math.floor((hi - lo) / spec['step'] + 1e-9)) + 1
+        return [round(lo + n * spec['step'], 12) for n in range(count)]
+    return [spec]
+
+
+def _random_value(name, spec, rng):
+    """Draw one value for a parameter spec"""
+    if isinstance(spec, list):
+        return rng.choice(spec)
+    if isinstance(spec, dict) and 'min' in spec and 'max' in spec:
+        lo, hi, step = spec['min'], spec['max'], spec.get('step')
+        if _is_int_range(spec):
+            return rng.randrange(lo, hi + 1, step or 1)
+        if step:
+            return round(lo + rng.randint(0, int(math.floor((hi - lo) / step + 1e-9))) * step, 12)
+        return rng.uniform(lo, hi)
+    return spec
+
+
+def generate_combinations(space, samples=None, seed=0):
+    """Build the parameter combinations for one asset's search space
+
+    Args:
+        space: Dict param -> spec (list or {"min", "max", "step"})
+        samples: None for the full grid, otherwise the number of random draws
+        seed: Random seed (the same seed always yields the same combinations)
+
+    Returns:
+        list: Parameter dicts (duplicates removed, order preserved)
+    """
+    names = sorted(space)
+    if samples is None:
+        grids = [_grid_values(name, space[name]) for name in names]
+        combos = [dict(zip(names, values)) for values in itertools.product(*grids)]
+    else:
+        rng = random.Random(seed)
+        combos = [{name: _random_value(name, space[name], rng) for name in names}
+                  for _ in range(samples)]
+
+    unique = {}
+    for combo in combos:
+        unique.setdefault(combo_id(combo), combo)
+    return list(unique.values())
+
+
+def combo_id(params, context=()):
+    """Stable identifier of a parameter combination (plus run context)"""
+    payload = json.dumps([params, list(context)], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+def _trade_metrics(pnls, initial_value, final_value):
+    """Profit factor, win rate and returns from closed-trade P&L values"""
+    pnls = np.asarray(pnls, dtype=np.float64)
+    gross_profit = float(pnls[pnls > 0].sum())
+    gross_loss = float(abs(pnls[pnls < 0].sum()))
+    if gross_loss > 0:
+        profit_factor = gross_profit / gross_loss
+    elif gross_profit > 0:
+        profit_factor = float('inf')
+    else:
+        profit_factor = 0.0
+    return {
+        'trades': len(pnls),
+        'profit_factor': profit_factor,
+        'net_pnl': final_value - initial_value,
+        'return_pct': (final_value - initial_value) / initial_value * 100.0,
+        # TradeAnalyzer counts break-even trades as won
+        'win_rate': float((pnls >= 0).mean() * 100.0) if len(pnls) else 0.0,
+    }
+
+
+def engine_equity_curve(prices, result, starting_cash):
+    """Broker value per bar for a signal-engine run
+
+    Reproduces BackBroker.get_value(): starting cash plus realized P&L plus
+    the open position marked to the close. Sliced from the strategy's first
+    next() bar, like the strategy's own equity recorder.
+    """
+    close = prices['close']
+    equity = np.zeros(len(close))
+    trades = list(result['trades'])
+    if result['open_trade'] is not None:
+        trades.append(result['open_trade'])
+
+    for trade in trades:
+        sign = 1.0 if trade['direction'] == 'LONG' else -1.0
+        exit_bar = trade.get('exit_bar', len(close))
+        segment = slice(trade['fill_bar'], exit_bar)
+        equity[segment] += sign * trade['size'] * (close[segment] - trade['entry_price'])
+        if 'pnl' in trade:
+            equity[exit_bar:] += trade['pnl']
+
+    return (equity + starting_cash)[result['first_bar']:]
+
+
+# =============================================================================
+# WORKERS
+# =============================================================================
+
+def _init_worker(asset_name, fromdate, todate, starting_cash, backend):
+    """Process initializer: load the asset's data once for all combinations"""
+    import sunrise_ogle_multi_asset as runner
+    import signal_engine
+
+    asset_config = runner.ASSETS[asset_name]
+    data_path = BASE_DIR / 'data' / asset_config['data_file']
+    _WORKER.clear()
+    _WORKER.update({
+        'asset': asset_name,
+        'asset_config': asset_config,
+        'fromdate': fromdate,
+        'todate': todate,
+        'cash': starting_cash * asset_config['allocation'],
+        'backend': backend,
+    })
+    if backend == 'vector':
+        _WORKER['prices'] = signal_engine.load_price_arrays(
+            data_path,
+            dt.strptime(fromdate, '%Y-%m-%d') if fromdate else None,
+            dt.strptime(todate, '%Y-%m-%d') if todate else None,
+        )
+    else:
+        from data_cache import load_ohlcv_cache
+        _WORKER['records'] = load_ohlcv_cache(data_path)
+
+
+def _base_strategy_kwargs(asset_config):
+    """Strategy kwargs matching the runner's run_single_asset_backtest()"""
+    return {
+        'plot_result': False,
+        'use_forex_position_calc': True,
+        'forex_instrument': asset_config['forex_instrument'],
+        'verbose_debug': False,
+        'print_signals': False,
+    }
+
+
+def run_vector(prices, asset_config, cash, params, indicators=None):
+    """Evaluate one combination with the signal engine
+
+    Args:
+        prices: Dict from signal_engine.load_price_arrays() (or a slice of it)
+        asset_config: Entry of sunrise_ogle_multi_asset.ASSETS
+        cash: Broker starting cash
+        params: Strategy parameter overrides
+        indicators: Optional signal_engine.compute_indicators() result
+
+    Returns:
+        tuple: (metrics dict, equity curve, equity datenums)
+    """
+    import signal_engine
+
+    kwargs = dict(_base_strategy_kwargs(asset_config), **params)
+    engine_params = signal_engine.strategy_params(asset_config['strategy_class'], **kwargs)
+    result = signal_engine.run_signal_engine(prices, engine_params, cash, leverage=LEVERAGE,
+                                             indicators=indicators)
+    equity = engine_equity_curve(prices, result, cash)
+    final_value = float(equity[-1]) if len(equity) else cash
+
+    metrics = _trade_metrics([t['pnl'] for t in result['trades']], cash, final_value)
+    metrics['sharpe_ratio'] = sharpe_ratio(equity)
+    metrics['max_drawdown_pct'] = max_drawdown(equity)
+    return metrics, equity, prices['datenum'][result['first_bar']:]
+
+
+def run_backtrader(records, asset_config, cash, fromdate, todate, params):
+    """Evaluate one combination with a full Cerebro run
+
+    Args:
+        records: Structured array from data_cache.load_ohlcv_cache()
+        asset_config: Entry of sunrise_ogle_multi_asset.ASSETS
+        cash: Broker starting cash
+        fromdate: Start datetime (None = first bar)
+        todate: End datetime, inclusive (None = last bar)
+        params: Strategy parameter overrides
+
+    Returns:
+        tuple: (metrics dict, equity curve, equity datenums)
+    """
+    import backtrader as bt
+    from data_cache import NumpyOHLCVData
+
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(NumpyOHLCVData(
+        dataname=records,
+        timeframe=bt.TimeFrame.Minutes,
+        compression=5,
+        fromdate=fromdate,
+        todate=todate,
+    ))
+    cerebro.broker.setcash(cash)
+    cerebro.broker.setcommission(leverage=LEVERAGE)
+    kwargs = dict(_base_strategy_kwargs(asset_config), use_precomputed_indicators=True)
+    kwargs.update(params)
+    cerebro.addstrategy(asset_config['strategy_class'], **kwargs)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        strategy = cerebro.run()[0]
+
+    pnls = [trade.pnlcomm for by_id in strategy._trades.values()
+            for trades in by_id.values() for trade in trades if trade.isclosed]
+    equity = strategy._equity.values
+    metrics = _trade_metrics(pnls, cash, cerebro.broker.getvalue())
+    metrics['sharpe_ratio'] = sharpe_ratio(equity)
+    metrics['max_drawdown_pct'] = max_drawdown(equity)
+    return metrics, equity, strategy._equity.datenums
+
+
+def _evaluate_vector(params):
+    w = _WORKER
+    return run_vector(w['prices'], w['asset_config'], w['cash'], params)[0]
+
+
+def _evaluate_backtrader(params):
+    w = _WORKER
+    return run_backtrader(
+        w['records'], w['asset_config'], w['cash'],
+        dt.strptime(w['fromdate'], '%Y-%m-%d') if w['fromdate'] else None,
+        dt.strptime(w['todate'], '%Y-%m-%d') if w['todate'] else None,
+        params,
+    )[0]
+
+
+def _evaluate(cid, params):
+    """Evaluate one combination in the current worker, never raising"""
+    t0 = time.perf_counter()
+    row = {'combo_id': cid}
+    row.update(params)
+    try:
+        if _WORKER['backend'] == 'vector':
+            row.update(_evaluate_vector(params))
+        else:
+            row.update(_evaluate_backtrader(params))
+        row['error'] = ''
+    except Exception as e:
+        row['error'] = f"{type(e).__name__}: {e}"
+    row['elapsed_s'] = round(time.perf_counter() - t0, 4)
+    return row
+
+
+def bounded_map(executor, fn, tasks, depth):
+    """Submit ``fn(*task)`` for every task, keeping at most ``depth`` in flight
+
+    Yields results in completion order. The bounded queue keeps memory flat
+    on very large sweeps.
+    """
+    queue = iter(tasks)
+    in_flight = {executor.submit(fn, *task) for task in itertools.islice(queue, depth)}
+    while in_flight:
+        finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in finished:
+            yield future.result()
+        for task in itertools.islice(queue, len(finished)):
+            in_flight.add(executor.submit(fn, *task))
+
+
+# =============================================================================
+# RESULTS TABLE
+# =============================================================================
+
+def _completed_ids(output_path):
+    """Combination ids already present in a results table"""
+    if not output_path.exists():
+        return set()
+    with open(output_path, 'r', newline='', encoding='utf-8') as f:
+        return {row['combo_id'] for row in csv.DictReader(f) if row.get('combo_id')}
+
+
+def _open_results_writer(output_path, columns):
+    """Open the results CSV for appending, checking the header on resume"""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    exists = output_path.exists() and output_path.stat().st_size > 0
+    if exists:
+        with open(output_path, 'r', newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), [])
+        if header != columns:
+            raise ValueError(f"{output_path} was written for a different search space; "
+                             f"use another --output-dir or remove the file")
+    handle = open(output_path, 'a', newline='', encoding='utf-8')
+    writer = csv.DictWriter(handle, fieldnames=columns, extrasaction='ignore')
+    if not exists:
+        writer.writeheader()
+        handle.flush()
+    return handle, writer
+
+
+def export_parquet(csv_path):
+    """Write a Parquet copy of a results CSV (requires pyarrow or fastparquet)"""
+    import pandas as pd
+
+    parquet_path = csv_path.with_suffix('.parquet')
+    try:
+        pd.read_csv(csv_path).to_parquet(parquet_path, index=False)
+    except ImportError as e:
+        print(f"[WARN] Parquet export skipped ({e})")
+        return None
+    return parquet_path
+
+
+# =============================================================================
+# SWEEP
+# =============================================================================
+
+def run_sweep(asset_name, space, fromdate, todate, starting_cash, output_dir=DEFAULT_OUTPUT_DIR,
+              backend='vector', samples=None, seed=0, workers=None):
+    """Run (or resume) a parameter sweep for one asset
+
+    Args:
+        asset_name: Asset key from sunrise_ogle_multi_asset.ASSETS
+        space: Dict param -> spec for this asset
+        fromdate: Start date string (YYYY-MM-DD)
+        todate: End date string (YYYY-MM-DD)
+        starting_cash: Total portfolio cash (split by asset allocation)
+        output_dir: Directory for the results table
+        backend: 'vector' (signal engine) or 'backtrader'
+        samples: None for grid search, otherwise number of random draws
+        seed: Random search seed
+        workers: Worker processes (default: CPU count, 1 = in-process)
+
+    Returns:
+        Path: Results CSV path
+    """
+    import sunrise_ogle_multi_asset as runner
+
+    strategy_class = runner.ASSETS[asset_name]['strategy_class']
+    known = dict(strategy_class.params._getitems())
+    unknown = sorted(set(space) - set(known))
+    if unknown:
+        raise ValueError(f"{asset_name}: unknown strategy parameter(s): {', '.join(unknown)}")
+
+    combos = generate_combinations(space, samples=samples, seed=seed)
+    context = (asset_name, backend, fromdate, todate, starting_cash)
+    mode = 'grid' if samples is None else f'random{samples}_seed{seed}'
+    output_path = Path(output_dir) / f"{asset_name}_{backend}_{mode}.csv"
+    columns = ['combo_id'] + sorted(space) + METRIC_COLUMNS
+
+    done = _completed_ids(output_path)
+    pending = [(combo_id(c, context), c) for c in combos]
+    pending = [(cid, c) for cid, c in pending if cid not in done]
+    print(f"[SWEEP] {asset_name} ({backend}, {mode}): {len(combos)} combinations, "
+          f"{len(combos) - len(pending)} already done, {len(pending)} to run")
+    if not pending:
+        return output_path
+
+    workers = workers or os.cpu_count() or 1
+    init_args = (asset_name, fromdate, todate, starting_cash, backend)
+    handle, writer = _open_results_writer(output_path, columns)
+    t0 = time.perf_counter()
+    completed = 0
+
+    def _record(row):
+        nonlocal completed
+        writer.writerow(row)
+        handle.flush()
+        completed += 1
+        if completed % 100 == 0 or completed == len(pending):
+            rate = completed / max(time.perf_counter() - t0, 1e-9)
+            print(f"  {completed}/{len(pending)} done ({rate:.1f}/s)")
+
+    try:
+        if workers == 1:
+            _init_worker(*init_args)
+            for cid, params in pending:
+                _record(_evaluate(cid, params))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=init_args) as executor:
+                for row in bounded_map(executor, _evaluate, pending, workers * 4):
+                    _record(row)
+    finally:
+        handle.close()
+
+    return output_path
+
+
+def print_top_results(output_path, rank_by='profit_factor', top=10, min_trades=1):
+    """Print the best rows of a results table"""
+    import pandas as pd
+
+    table = pd.read_csv(output_path)
+    table = table[(table['error'].isna()) & (table['trades'] >= min_trades)]
+    if table.empty:
+        print("  No successful combinations with enough trades")
+        return
+    best = table.sort_values(rank_by, ascending=(rank_by == 'max_drawdown_pct')).head(top)
+    print(f"\n[TOP {len(best)}] by {rank_by} ({output_path.name})")
+    print(best.drop(columns=['combo_id', 'error', 'elapsed_s']).to_string(index=False))
+
+
+def parse_args(argv=None):
+    """Parse command line options for the optimizer"""
+    import sunrise_ogle_multi_asset as runner
+
+    parser = argparse.ArgumentParser(description='Parallel, resumable SunriseOgle parameter sweep')
+    parser.add_argument('--space', required=True, help='JSON search space file ({asset: {param: spec}})')
+    parser.add_argument('--asset', action='append', choices=list(runner.ASSETS.keys()),
+                        help='Asset to optimize (repeatable, default: every asset in the space file)')
+    parser.add_argument('--random', type=int, metavar='N',
+                        help='Random search with N samples instead of the full grid')
+    parser.add_argument('--seed', type=int, default=0, help='Random search seed (default: 0)')
+    parser.add_argument('--backend', choices=BACKENDS, default='vector')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count, 1 = in-process)')
+    parser.add_argument('--fromdate', default=runner.FROMDATE)
+    parser.add_argument('--todate', default=runner.TODATE)
+    parser.add_argument('--cash', type=float, default=runner.STARTING_CASH,
+                        help='Total portfolio cash, split by asset allocation')
+    parser.add_argument('--output-dir', default=str(DEFAULT_OUTPUT_DIR))
+    parser.add_argument('--rank-by', default='profit_factor',
+                        choices=['profit_factor', 'sharpe_ratio', 'max_drawdown_pct', 'net_pnl', 'trades'])
+    parser.add_argument('--min-trades', type=int, default=10,
+                        help='Minimum trades for a row to be ranked (default: 10)')
+    parser.add_argument('--parquet', action='store_true',
+                        help='Also export each results table as Parquet')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    search_space = load_search_space(args.space)
+    assets = args.asset or list(search_space)
+    missing = [a for a in assets if a not in search_space]
+    if missing:
+        sys.exit(f"[ERROR] No search space for: {', '.join(missing)}")
+
+    for asset in assets:
+        try:
+            path = run_sweep(asset, search_space[asset], args.fromdate, args.todate, args.cash,
+                             output_dir=args.output_dir, backend=args.backend,
+                             samples=args.random, seed=args.seed, workers=args.workers)
+        except KeyboardInterrupt:
+            print("\n[INTERRUPTED] Completed rows are saved; re-run the same command to resume")
+            sys.exit(130)
+        print_top_results(path, rank_by=args.rank_by, min_trades=args.min_trades)
+        if args.parquet:
+            parquet_path = export_parquet(path)
+            if parquet_path:
+                print(f"[SAVED] {parquet_path}")
@@ -0,0 +1,627 @@
+"""Vectorized SunriseOgle Signal Engine
+Standalone re-implementation of the 4-phase entry state machine
+(SCANNING -> ARMED_LONG/ARMED_SHORT -> WINDOW_OPEN) used by the
+strategy engine in strategies/sunrise_ogle_engine.py.
+
+All per-bar conditions (EMA crossovers, entry filters, pullback candles,
+invalidation signals, time filter) are evaluated once with NumPy array
+operations. A small loop then walks only the candidate signal bars through
+the state machine and resolves each trade's SL/TP exit with a vectorized
+forward search, mirroring Backtrader's BackBroker fill rules:
+
+- Entry: market order placed on the breakout bar, filled at the next open
+- Exits: stop and limit (OCO) orders active from the bar after the fill;
+  gaps fill at the open, the stop wins when both trigger on the same bar
+- Margin: orders are rejected when cash would go negative (leverage aware)
+
+Used to screen parameter sets far faster than full Cerebro runs. Run this
+module directly to cross-validate it against Backtrader trade by trade:
+
+    python signal_engine.py --asset EURUSD
+"""
+
+import argparse
+import math
+import sys
+from datetime import datetime as dt
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.append(str(BASE_DIR / 'strategies'))
+
+from indicator_cache import ema_series, atr_series
+
+MIN_TRIGGER_BODY = 0.00001
+
+# State machine states
+SCANNING, ARMED, WINDOW_OPEN = 0, 1, 2
+LONG, SHORT = 'LONG', 'SHORT'
+
+
+def strategy_params(strategy_class, **overrides):
+    """Resolve the effective engine parameters for a SunriseOgle strategy class
+
+    Mirrors the adjustments SunriseOgle.__init__ applies to its params
+    (contract size sync, long/short overrides).
+
+    Args:
+        strategy_class: SunriseOgle profile class (sunrise_ogle_engine.profile_strategy)
+        **overrides: Strategy keyword arguments (as passed to addstrategy)
+
+    Returns:
+        dict: Parameter name -> value
+    """
+    params = dict(strategy_class.params._getitems())
+    params.update(overrides)
+
+    if params.get('use_forex_position_calc'):
+        params['contract_size'] = params['forex_lot_size']
+    if params.get('long_enabled') is not None:
+        params['enable_long_trades'] = params['long_enabled']
+    if params.get('short_enabled') is not None:
+        params['enable_short_trades'] = params['short_enabled']
+    return params
+
+
+def load_price_arrays(data_path, fromdate=None, todate=None):
+    """Load OHLC arrays for a CSV through the binary data cache
+
+    Args:
+        data_path: Path to a GenericCSVData-layout CSV file
+        fromdate: Optional start datetime (inclusive, as Backtrader filters)
+        todate: Optional end datetime (inclusive)
+
+    Returns:
+        dict: 'open', 'high', 'low', 'close', 'datenum' and 'minute_of_day' arrays
+    """
+    from data_cache import date_range_slice, load_ohlcv_cache
+
+    records = load_ohlcv_cache(data_path)
+    records = records[date_range_slice(records['datenum'], fromdate, todate)]
+
+    return {
+        'open': np.ascontiguousarray(records['open']),
+        'high': np.ascontiguousarray(records['high']),
+        'low': np.ascontiguousarray(records['low']),
+        'close': np.ascontiguousarray(records['close']),
+        'datenum': np.ascontiguousarray(records['datenum']),
+        'minute_of_day': (records['epoch'] // 60) % 1440,
+    }
+
+
+def compute_indicators(prices, params):
+    """Compute the strategy EMAs and ATR (bit-identical to bt.ind.EMA/ATR)
+
+    Args:
+        prices: Dict from load_price_arrays()
+        params: Dict from strategy_params()
+
+    Returns:
+        dict: Indicator name -> float64 array (NaN during warmup)
+    """
+    close = prices['close']
+    indicators = {
+        name: np.array(ema_series(close, params[f'{name}_length']))
+        for name in ('ema_fast', 'ema_medium', 'ema_slow', 'ema_confirm',
+                     'ema_filter_price', 'ema_exit')
+    }
+    indicators['atr'] = np.array(
+        atr_series(prices['high'], prices['low'], close, params['atr_length']))
+    return indicators
+
+
+def _shift(values, fill):
+    """Return values[i-1] aligned on i (first element set to fill)"""
+    shifted = np.empty_like(values)
+    shifted[0] = fill
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def _time_filter_mask(minute_of_day, params):
+    """Vectorized _is_in_trading_time_range()"""
+    if not params['use_time_range_filter']:
+        return np.ones(len(minute_of_day), dtype=bool)
+    start = params['entry_start_hour'] * 60 + params['entry_start_minute']
+    end = params['entry_end_hour'] * 60 + params['entry_end_minute']
+    if start <= end:
+        return (minute_of_day >= start) & (minute_of_day <= end)
+    return (minute_of_day >= start) | (minute_of_day <= end)
+
+
+def precompute_conditions(prices, indicators, params):
+    """Evaluate every state-independent condition of the state machine at once
+
+    Args:
+        prices: Dict from load_price_arrays()
+        indicators: Dict from compute_indicators()
+        params: Dict from strategy_params()
+
+    Returns:
+        dict: Boolean masks and helper arrays keyed by condition name
+    """
+    p = params
+    o, c = prices['open'], prices['close']
+    fast, medium, slow = indicators['ema_fast'], indicators['ema_medium'], indicators['ema_slow']
+    confirm, price_filter = indicators['ema_confirm'], indicators['ema_filter_price']
+    atr = np.where(np.isnan(indicators['atr']), 0.0, indicators['atr'])
+
+    prev_confirm = _shift(confirm, np.nan)
+    cross_up = np.zeros(len(c), dtype=bool)
+    cross_down = np.zeros(len(c), dtype=bool)
+    for ema in (fast, medium, slow):
+        prev_ema = _shift(ema, np.nan)
+        cross_up |= (confirm > ema) & (prev_confirm <= prev_ema)
+        cross_down |= (confirm < ema) & (prev_confirm >= prev_ema)
+
+    prev_bull = _shift(c > o, False)
+    prev_bear = _shift(c < o, False)
+
+    def entry_filters(side):
+        """Filters shared by phase 1 and the final entry validation"""
+        ok = np.ones(len(c), dtype=bool)
+        if side == LONG:
+            if p['long_use_ema_order_condition']:
+                ok &= (confirm > fast) & (confirm > medium) & (confirm > slow)
+            if p['long_use_price_filter_ema']:
+                ok &= c > price_filter
+            if p['long_use_ema_below_price_filter']:
+                ok &= (fast < c) & (medium < c) & (slow < c)
+        else:
+            if p['short_use_ema_order_condition']:
+                ok &= (confirm < fast) & (confirm < medium) & (confirm < slow)
+            if p['short_use_price_filter_ema']:
+                ok &= c < price_filter
+            if p['short_use_ema_above_price_filter']:
+                ok &= (fast > c) & (medium > c) & (slow > c)
+        return ok
+
+    long_filters = entry_filters(LONG)
+    short_filters = entry_filters(SHORT)
+
+    long_signal = cross_up & long_filters
+    if p['long_use_candle_direction_filter']:
+        long_signal &= prev_bull
+    if p['long_use_atr_filter']:
+        long_signal &= (atr >= p['long_atr_min_threshold']) & (atr <= p['long_atr_max_threshold'])
+    if not p['enable_long_trades']:
+        long_signal[:] = False
+
+    short_signal = cross_down & short_filters
+    if p['short_use_candle_direction_filter']:
+        short_signal &= prev_bear
+    if p['short_use_atr_filter']:
+        short_signal &= (atr >= p['short_atr_min_threshold']) & (atr <= p['short_atr_max_threshold'])
+    if not p['enable_short_trades']:
+        short_signal[:] = False
+
+    # Strategy next() only starts once every indicator has its minimum period
+    first_bar = max(p['ema_fast_length'], p['ema_medium_length'], p['ema_slow_length'],
+                    p['ema_confirm_length'], p['ema_filter_price_length'],
+                    p['ema_exit_length'], p['atr_length'] + 1) - 1
+    long_signal[:first_bar] = False
+    short_signal[:first_bar] = False
+
+    return {
+        'first_bar': first_bar,
+        'atr': atr,
+        'confirm': confirm,
+        'prev_confirm': prev_confirm,
+        'long_signal': long_signal,
+        'short_signal': short_signal,
+        'signal_bars': np.flatnonzero(long_signal | short_signal),
+        'long_invalidation': prev_bear & cross_down,
+        'short_invalidation': prev_bull & cross_up,
+        'long_pullback': c < o,
+        'short_pullback': c > o,
+        'long_filters': long_filters,
+        'short_filters': short_filters,
+        'time_ok': _time_filter_mask(prices['minute_of_day'], p),
+    }
+
+
+def _angle(conditions, idx, scale):
+    """Confirm EMA slope angle in degrees (math module, as the strategies)"""
+    rise = (float(conditions['confirm'][idx]) - float(conditions['prev_confirm'][idx])) * scale
+    return math.degrees(math.atan(rise))
+
+
+def _find_exit(prices, start, direction, stop_level, take_level):
+    """Locate the first bar >= start where the SL/TP OCO pair fills
+
+    Returns:
+        tuple: (bar index, fill price, exit reason) or None if never filled
+    """
+    o, h, l = prices['open'], prices['high'], prices['low']
+    size = len(o)
+    chunk = 256
+    while start < size:
+        end = min(start + chunk, size)
+        so, sh, sl = o[start:end], h[start:end], l[start:end]
+        if direction == LONG:
+            stop_hit = (so <= stop_level) | (sl <= stop_level)
+            take_hit = (so >= take_level) | (sh >= take_level)
+        else:
+            stop_hit = (so >= stop_level) | (sh >= stop_level)
+            take_hit = (so <= take_level) | (sl <= take_level)
+        hits = np.flatnonzero(stop_hit | take_hit)
+        if len(hits):
+            k = int(hits[0])
+            idx = start + k
+            bar_open = float(so[k])
+            if stop_hit[k]:
+                # Stop order was submitted first, so it wins same-bar conflicts
+                gap = bar_open <= stop_level if direction == LONG else bar_open >= stop_level
+                return idx, (bar_open if gap else stop_level), 'STOP_LOSS'
+            gap = bar_open >= take_level if direction == LONG else bar_open <= take_level
+            return idx, (bar_open if gap else take_level), 'TAKE_PROFIT'
+        start = end
+        chunk *= 4
+    return None
+
+
+def run_signal_engine(prices, params, starting_cash, leverage=30.0, indicators=None):
+    """Run the vectorized SunriseOgle state machine over an asset's arrays
+
+    Args:
+        prices: Dict from load_price_arrays()
+        params: Dict from strategy_params()
+        starting_cash: Broker starting cash
+        leverage: Broker leverage (setcommission(leverage=...))
+        indicators: Optional precomputed dict from compute_indicators()
+
+    Returns:
+        dict: 'trades' (closed trades), 'open_trade' (or None), 'final_cash'
+        and 'first_bar' (first bar the strategy's next() runs on)
+    """
+    p = params
+    if indicators is None:
+        indicators = compute_indicators(prices, p)
+    cond = precompute_conditions(prices, indicators, p)
+
+    o, h, l, c = prices['open'], prices['high'], prices['low'], prices['close']
+    atr = cond['atr']
+    signal_bars = cond['signal_bars']
+    size = len(c)
+
+    trades = []
+    open_trade = None
+    cash = float(starting_cash)
+    last_atr_increment = None  # stale entry_atr_increment carried between trades
+
+    state = SCANNING
+    direction = None
+    trigger_bar = None
+    signal_atr = None
+    pullback_count = 0
+    window_start = window_expiry = None
+    window_top = window_bottom = None
+
+    i = cond['first_bar']
+    while i < size:
+        if state == SCANNING:
+            # Jump straight to the next bar with a crossover signal
+            k = int(np.searchsorted(signal_bars, i))
+            if k >= len(signal_bars):
+                break
+            i = int(signal_bars[k])
+            armed = None
+            if cond['long_signal'][i] and (not p['long_use_angle_filter'] or
+                                           p['long_min_angle'] <= _angle(cond, i, p['long_angle_scale_factor']) <= p['long_max_angle']):
+                armed = LONG
+            elif cond['short_signal'][i] and (not p['short_use_angle_filter'] or
+                                              # phase 1 measures both sides with the long scale factor
+                                              p['short_min_angle'] <= _angle(cond, i, p['long_angle_scale_factor']) <= p['short_max_angle']):
+                armed = SHORT
+            if armed is not None:
+                state, direction, pullback_count = ARMED, armed, 0
+                trigger_bar = i - 1
+                signal_atr = float(atr[i])
+            i += 1
+            continue
+
+        if state == ARMED:
+            invalidation = cond['long_invalidation'] if direction == LONG else cond['short_invalidation']
+            if invalidation[i]:
+                # Opposing crossover resets to SCANNING and the bar is re-scanned
+                state = SCANNING
+                continue
+            pullback = cond['long_pullback'] if direction == LONG else cond['short_pullback']
+            if pullback[i]:
+                pullback_count += 1
+                max_candles = p['long_pullback_max_candles'] if direction == LONG else p['short_pullback_max_candles']
+                if pullback_count >= max_candles:
+                    window_start = i
+                    if p['use_window_time_offset']:
+                        window_start = i + int(pullback_count * p['window_offset_multiplier'])
+                    window_periods = p['long_entry_window_periods'] if direction == LONG else p['short_entry_window_periods']
+                    window_expiry = window_start + window_periods
+                    price_offset = (float(h[i]) - float(l[i])) * p['window_price_offset_multiplier']
+                    window_top = float(h[i]) + price_offset
+                    window_bottom = float(l[i]) - price_offset
+                    state = WINDOW_OPEN
+            else:
+                state = SCANNING
+            i += 1
+            continue
+
+        # WINDOW_OPEN
+        if i < window_start:
+            i += 1
+            continue
+        if i > window_expiry:
+            state, pullback_count = ARMED, 0
+            i += 1
+            continue
+        if direction == LONG:
+            success = h[i] >= window_top
+            failure = not success and l[i] <= window_bottom
+        else:
+            success = l[i] <= window_bottom
+            failure = not success and h[i] >= window_top
+        if failure:
+            state, pullback_count = ARMED, 0
+        if not success:
+            i += 1
+            continue
+
+        # Breakout: every rejection below resets the state machine to SCANNING
+        state = SCANNING
+        entry_bar = i
+        i += 1
+
+        if not cond['time_ok'][entry_bar]:
+            continue
+
+        trigger_open, trigger_close = float(o[trigger_bar]), float(c[trigger_bar])
+        trigger_body_ok = abs(trigger_close - trigger_open) >= MIN_TRIGGER_BODY
+        if direction == LONG and p['long_use_candle_direction_filter']:
+            if not (trigger_close > trigger_open and trigger_body_ok):
+                continue
+        elif direction == SHORT and p['short_use_candle_direction_filter']:
+            if not (trigger_close < trigger_open and trigger_body_ok):
+                continue
+
+        side = 'long' if direction == LONG else 'short'
+        if not cond[f'{side}_filters'][entry_bar]:
+            continue
+        if p[f'{side}_use_angle_filter']:
+            angle = _angle(cond, entry_bar, p[f'{side}_angle_scale_factor'])
+            if not p[f'{side}_min_angle'] <= angle <= p[f'{side}_max_angle']:
+                continue
+        if p['validate_atr_increment'] and last_atr_increment is not None:
+            if p[f'{side}_use_atr_increment_filter'] and last_atr_increment >= 0:
+                if not p[f'{side}_atr_increment_min_threshold'] <= last_atr_increment <= p[f'{side}_atr_increment_max_threshold']:
+                    continue
+            if p[f'{side}_use_atr_decrement_filter'] and last_atr_increment < 0:
+                if not p[f'{side}_atr_decrement_min_threshold'] <= last_atr_increment <= p[f'{side}_atr_decrement_max_threshold']:
+                    continue
+
+        atr_now = float(atr[entry_bar])
+        if atr_now <= 0:
+            continue
+
+        signal_price = float(c[entry_bar])
+        if direction == LONG:
+            stop_level = float(l[entry_bar]) - atr_now * p['long_atr_sl_multiplier']
+            take_level = float(h[entry_bar]) + atr_now * p['long_atr_tp_multiplier']
+            raw_risk = signal_price - stop_level
+        else:
+            stop_level = float(h[entry_bar]) + atr_now * p['short_atr_sl_multiplier']
+            take_level = float(l[entry_bar]) - atr_now * p['short_atr_tp_multiplier']
+            raw_risk = stop_level - signal_price
+
+        if p['enable_risk_sizing']:
+            if raw_risk <= 0:
+                continue
+            risk_val = cash * p['risk_percent']
+            risk_per_contract = raw_risk * p['contract_size']
+            if risk_per_contract <= 0:
+                continue
+            contracts = max(int(risk_val / risk_per_contract), 1)
+        else:
+            contracts = int(p['size'])
+        if contracts <= 0:
+            continue
+        units = contracts * p['contract_size']
+
+        last_atr_increment = atr_now - signal_atr
+
+        # Market order fills at the next open after passing the margin check.
+        # Cash follows BackBroker with shortcash: longs lock notional/leverage,
+        # short sales credit the full notional.
+        fill_bar = entry_bar + 1
+        if fill_bar >= size:
+            break
+        if direction == LONG and cash - units * signal_price / leverage < 0.0:
+            i = fill_bar
+            continue
+
+        entry_price = float(o[fill_bar])
+        if direction == LONG:
+            open_cash = units * entry_price / leverage
+            cash -= open_cash
+        else:
+            open_cash = -(units * entry_price)
+            cash -= open_cash
+
+        trade = {
+            'direction': direction,
+            'signal_bar': trigger_bar + 1,
+            'entry_bar': entry_bar,
+            'fill_bar': fill_bar,
+            'entry_price': entry_price,
+            'stop_level': stop_level,
+            'take_level': take_level,
+            'size': units,
+        }
+
+        # Protective OCO orders are checked from the bar after the fill. A
+        # margin rejection of the take profit cancels the whole OCO group.
+        if direction == LONG:
+            stop_cash = cash + units * stop_level / leverage
+            take_cash = stop_cash + units * take_level
+        else:
+            stop_cash = cash - units * stop_level
+            take_cash = stop_cash - units * take_level / leverage
+        if stop_cash < 0.0 or take_cash < 0.0:
+            open_trade = trade
+            break
+
+        exit_info = _find_exit(prices, fill_bar + 1, direction, stop_level, take_level)
+        if exit_info is None:
+            open_trade = trade
+            break
+
+        exit_bar, exit_price, exit_reason = exit_info
+        if direction == LONG:
+            pnl = units * (exit_price - entry_price)
+        else:
+            pnl = -units * (exit_price - entry_price)
+        cash = cash + (open_cash + pnl)
+        trade.update({
+            'exit_bar': exit_bar,
+            'exit_price': exit_price,
+            'exit_reason': exit_reason,
+            'pnl': pnl,
+        })
+        trades.append(trade)
+
+        # Strategy is flat again on the exit bar and scans that same bar
+        i = exit_bar
+
+    return {'trades': trades, 'open_trade': open_trade, 'final_cash': cash,
+            'first_bar': cond['first_bar']}
+
+
+def cross_validate(engine_trades, backtrader_trades, tolerance=1e-9):
+    """Compare engine trades with Backtrader closed trades one by one
+
+    Args:
+        engine_trades: 'trades' list from run_signal_engine() with
+            'entry_time'/'exit_time' datetimes added
+        backtrader_trades: List of dicts with entry_time, exit_time,
+            entry_price and pnl from Backtrader's notify_trade
+        tolerance: Absolute tolerance for prices and P&L
+
+    Returns:
+        list: Human readable mismatch descriptions (empty when identical)
+    """
+    mismatches = []
+    if len(engine_trades) != len(backtrader_trades):
+        mismatches.append(f"trade count differs: engine={len(engine_trades)} backtrader={len(backtrader_trades)}")
+
+    for n, (ours, theirs) in enumerate(zip(engine_trades, backtrader_trades), start=1):
+        for key in ('entry_time', 'exit_time'):
+            if ours[key] != theirs[key]:
+                mismatches.append(f"trade #{n} {key}: engine={ours[key]} backtrader={theirs[key]}")
+        for key in ('entry_price', 'pnl'):
+            if abs(ours[key] - theirs[key]) > tolerance:
+                mismatches.append(f"trade #{n} {key}: engine={ours[key]:.6f} backtrader={theirs[key]:.6f}")
+    return mismatches
+
+
+def run_backtrader_trades(asset_name, fromdate, todate, starting_cash):
+    """Run the asset through Cerebro and collect its closed trades"""
+    import backtrader as bt
+    import sunrise_ogle_multi_asset as runner
+
+    class _ClosedTrades(bt.Analyzer):
+        def start(self):
+            self.trades = []
+
+        def notify_trade(self, trade):
+            if trade.isclosed:
+                self.trades.append({
+                    'entry_time': bt.num2date(trade.dtopen),
+                    'exit_time': bt.num2date(trade.dtclose),
+                    'entry_price': trade.price,
+                    'pnl': trade.pnlcomm,
+                })
+
+        def get_analysis(self):
+            return self.trades
+
+    asset_config = runner.ASSETS[asset_name]
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(runner.create_data_feed(asset_config['data_file'], fromdate, todate))
+    cerebro.broker.setcash(starting_cash * asset_config['allocation'])
+    cerebro.broker.setcommission(leverage=30.0)
+    cerebro.addstrategy(asset_config['strategy_class'], **_runner_strategy_kwargs(asset_config))
+    cerebro.addanalyzer(_ClosedTrades, _name='closed_trades')
+    strategy = cerebro.run()[0]
+    return strategy.analyzers.closed_trades.get_analysis()
+
+
+def _runner_strategy_kwargs(asset_config):
+    """Strategy kwargs used by sunrise_ogle_multi_asset.run_single_asset_backtest"""
+    return {
+        'plot_result': False,
+        'use_forex_position_calc': True,
+        'forex_instrument': asset_config['forex_instrument'],
+        'verbose_debug': False,
+        'print_signals': False,
+    }
+
+
+def run_engine_for_asset(asset_name, fromdate, todate, starting_cash, **param_overrides):
+    """Run the signal engine with the runner's configuration for one asset
+
+    Returns:
+        dict: run_signal_engine() result with entry/exit datetimes on trades
+    """
+    import backtrader as bt
+    import sunrise_ogle_multi_asset as runner
+
+    asset_config = runner.ASSETS[asset_name]
+    params = strategy_params(asset_config['strategy_class'],
+                             **_runner_strategy_kwargs(asset_config), **param_overrides)
+    prices = load_price_arrays(
+        BASE_DIR / 'data' / asset_config['data_file'],
+        dt.strptime(fromdate, '%Y-%m-%d') if fromdate else None,
+        dt.strptime(todate, '%Y-%m-%d') if todate else None,
+    )
+    result = run_signal_engine(prices, params, starting_cash * asset_config['allocation'])
+    for trade in result['trades']:
+        trade['entry_time'] = bt.num2date(prices['datenum'][trade['fill_bar']])
+        trade['exit_time'] = bt.num2date(prices['datenum'][trade['exit_bar']])
+    return result
+
+
+if __name__ == '__main__':
+    import contextlib
+    import io
+    import time
+
+    import sunrise_ogle_multi_asset as runner
+
+    parser = argparse.ArgumentParser(description='Cross-validate the vectorized signal engine against Backtrader')
+    parser.add_argument('--asset', action='append', choices=list(runner.ASSETS.keys()),
+                        help='Asset to validate (repeatable, default: all)')
+    parser.add_argument('--fromdate', default=runner.FROMDATE)
+    parser.add_argument('--todate', default=runner.TODATE)
+    args = parser.parse_args()
+
+    all_ok = True
+    for asset_name in args.asset or list(runner.ASSETS.keys()):
+        t0 = time.perf_counter()
+        engine_result = run_engine_for_asset(asset_name, args.fromdate, args.todate, runner.STARTING_CASH)
+        engine_time = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            bt_trades = run_backtrader_trades(asset_name, args.fromdate, args.todate, runner.STARTING_CASH)
+        bt_time = time.perf_counter() - t0
+
+        mismatches = cross_validate(engine_result['trades'], bt_trades)
+        status = '[OK]' if not mismatches else '[MISMATCH]'
+        speedup = bt_time / engine_time if engine_time > 0 else float('inf')
+        print(f"{status} {asset_name}: {len(engine_result['trades'])} trades | "
+              f"engine {engine_time:.3f}s vs backtrader {bt_time:.2f}s ({speedup:.0f}x)")
+        for mismatch in mismatches[:10]:
+            print(f"    {mismatch}")
+        all_ok = all_ok and not mismatches
+
+    sys.exit(0 if all_ok else 1)
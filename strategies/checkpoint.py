@@ -0,0 +1,206 @@
+"""End-of-run checkpoints for resuming SunriseOgle backtests.
+
+A strategy run with ``checkpoint=True`` captures its complete state at the
+last bar into ``strategy.checkpoint_state``:
+
+- indicator values (EMA/ATR recursions)
+- the entry state machine, pullback/window tracking and trade statistics
+- the open position, its Backtrader trade and the pending (OCO) orders
+- broker cash, analyzer state, the equity curve and the trade journal
+
+A later run over the same history with a later end date passes that state
+as ``resume_from`` and is fed from the checkpoint bar onward. The
+checkpoint bar only provides the one bar of history the strategy looks
+back on (``[-1]``); every later bar is processed exactly as in a full
+rerun, so trades, equity and analyzers match.
+
+Bar numbers (``len(self.data)``) restart in a resumed run, so attributes
+holding bar numbers are stored relative to the checkpoint bar.
+
+Requires preloaded data and one feed per strategy (per-asset runs).
+"""
+
+import copy
+import hashlib
+import os
+import pickle
+from datetime import date, datetime
+from pathlib import Path
+
+import backtrader as bt
+
+CHECKPOINT_VERSION = 1
+
+# Analyzer attributes that are plain state (rets dicts, running values)
+_PLAIN_TYPES = (bool, int, float, str, type(None), date, datetime, dict, list)
+_ANALYZER_REFS = frozenset(('params', 'p', '_children', '_parent', 'strategy', 'datas'))
+
+
+def history_fingerprint(records):
+    """Content fingerprint of the bars a checkpoint was built from.
+
+    Args:
+        records: Structured OHLCV array (data_cache.load_ohlcv_cache slice)
+    """
+    return hashlib.blake2b(records.tobytes(), digest_size=16).hexdigest()
+
+
+def save_checkpoint(path, checkpoint):
+    """Write a checkpoint dict atomically (pickle)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_file, 'wb') as f:
+        pickle.dump(dict(checkpoint, version=CHECKPOINT_VERSION), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, path)
+
+
+def load_checkpoint(path):
+    """Read a checkpoint written by save_checkpoint (None if missing or outdated)."""
+    try:
+        with open(path, 'rb') as f:
+            checkpoint = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if checkpoint.get('version') != CHECKPOINT_VERSION:
+        return None
+    return checkpoint
+
+
+def _analyzer_state(analyzer):
+    state = {
+        name: copy.deepcopy(value) for name, value in vars(analyzer).items()
+        if name not in _ANALYZER_REFS and not name.startswith('data') and isinstance(value, _PLAIN_TYPES)
+    }
+    return state, [_analyzer_state(child) for child in analyzer._children]
+
+
+def _restore_analyzer(analyzer, snapshot):
+    state, children = snapshot
+    analyzer.__dict__.update(copy.deepcopy(state))
+    for child, child_snapshot in zip(analyzer._children, children):
+        _restore_analyzer(child, child_snapshot)
+
+
+class CheckpointMixin:
+    """Mixin placed before ``bt.Strategy``; expects ``checkpoint`` and
+    ``resume_from`` params and these class attributes on the strategy:
+
+    - ``checkpoint_attrs``: instance attributes holding strategy state
+    - ``checkpoint_bar_attrs``: the subset holding bar numbers (ints or lists)
+    - ``checkpoint_indicators``: indicator attributes to reseed on resume
+    - ``checkpoint_orders``: attributes referencing the strategy's orders
+    """
+
+    checkpoint_attrs = ()
+    checkpoint_bar_attrs = ()
+    checkpoint_indicators = ()
+    checkpoint_orders = ()
+
+    def checkpoint_indicator(self, name, ind_cls, seeded_cls, *args, **kwargs):
+        """Create an indicator, seeded from ``resume_from`` when resuming."""
+        if self.p.resume_from is None:
+            return ind_cls(*args, **kwargs)
+        return seeded_cls(*args, seed=self.p.resume_from['indicators'][name], **kwargs)
+
+    # --- capture -------------------------------------------------------
+
+    def _next_analyzers(self, minperstatus, once=False):
+        # Runs after next() of the bar and before the analyzers see it
+        if self.p.checkpoint and minperstatus < 0 and len(self.data) == self.data.buflen():
+            self.checkpoint_state = self._capture_checkpoint()
+        super()._next_analyzers(minperstatus, once)
+
+    def _capture_checkpoint(self):
+        bar = len(self.data)
+        attrs = {name: copy.deepcopy(getattr(self, name))
+                 for name in self.checkpoint_attrs if hasattr(self, name)}
+        for name in self.checkpoint_bar_attrs:
+            if name in attrs:
+                attrs[name] = _shift_bars(attrs[name], -bar)
+
+        trades = self._trades[self.data][0]
+        open_trade = None
+        if trades and trades[-1].isopen:
+            open_trade = {k: v for k, v in vars(trades[-1]).items() if k not in ('data', 'history')}
+            open_trade['baropen'] -= bar
+
+        orders = []
+        ocos = self.broker._ocos
+        live = {getattr(self, name).ref: name for name in self.checkpoint_orders
+                if getattr(self, name, None) is not None and getattr(self, name).alive()}
+        for ref, name in sorted(live.items()):
+            order = getattr(self, name)
+            orders.append({
+                'attr': name,
+                'buy': order.isbuy(),
+                'size': abs(order.created.size),
+                'exectype': order.exectype,
+                'price': order.created.price,
+                'oco': live.get(ocos.get(ref)) if ocos.get(ref) != ref else None,
+            })
+
+        position = self.broker.getposition(self.data)
+        return {
+            'datenum': self.data.datetime[0],
+            'attrs': attrs,
+            'indicators': {name: float(getattr(self, name)[0]) for name in self.checkpoint_indicators},
+            'equity': self._equity.state(),
+            'trade_reports': copy.deepcopy(self.trade_reports),
+            'cash': self.broker.getcash(),
+            'position': dict(vars(position)) if position.size else None,
+            'open_trade': open_trade,
+            'orders': orders,
+            'analyzers': [_analyzer_state(analyzer) for analyzer in self.analyzers],
+        }
+
+    # --- restore -------------------------------------------------------
+
+    def start(self):
+        state = self.p.resume_from
+        if state is not None:
+            bar = 1  # len(self.data) at the checkpoint bar, the first bar of the resumed feed
+            for name, value in state['attrs'].items():
+                if name in self.checkpoint_bar_attrs:
+                    value = _shift_bars(value, bar)
+                setattr(self, name, copy.deepcopy(value))
+
+            self._equity.restore(state['equity'])
+            self.trade_reports[:] = copy.deepcopy(state['trade_reports'])
+
+            self.broker.cash = state['cash']
+            if state['position'] is not None:
+                position = bt.Position()
+                position.__dict__.update(state['position'])
+                self.broker.positions[self.data] = position
+            if state['open_trade'] is not None:
+                trade = bt.Trade(data=self.data, historyon=self._tradehistoryon)
+                trade.__dict__.update(state['open_trade'])
+                trade.baropen += bar
+                self._trades[self.data][0].append(trade)
+            self._resume_pending = True
+        super().start()
+
+    def prenext(self):
+        # The checkpoint bar: analyzers have been notified of its value but
+        # not yet updated, and orders submitted now are live from the next bar
+        if getattr(self, '_resume_pending', False):
+            self._resume_pending = False
+            state = self.p.resume_from
+            for analyzer, snapshot in zip(self.analyzers, state['analyzers']):
+                _restore_analyzer(analyzer, snapshot)
+            for spec in state['orders']:
+                submit = self.buy if spec['buy'] else self.sell
+                oco = getattr(self, spec['oco']) if spec['oco'] else None
+                setattr(self, spec['attr'], submit(size=spec['size'], exectype=spec['exectype'],
+                                                   price=spec['price'], oco=oco))
+        super().prenext()
+
+
+def _shift_bars(value, offset):
+    """Shift a bar number (or list of them) by ``offset``; None stays None."""
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [bar + offset for bar in value]
+    return value + offset
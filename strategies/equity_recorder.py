@@ -0,0 +1,121 @@
+"""Preallocated equity-curve recorder for SunriseOgle strategies.
+
+Replaces the per-bar ``list.append`` of portfolio values and Python
+datetimes: every ``next()`` writes one float64 value and the raw
+Backtrader date number into NumPy arrays sized from the feed length
+(grown geometrically when the length is not known up front, e.g. without
+preload). Datetimes are only materialised, vectorised, when the curve is
+read.
+
+Optional downsampling keeps every Nth bar (12 = hourly on 5-minute data);
+the most recent bar is always part of the curve so final values match.
+"""
+
+import numpy as np
+
+# Backtrader date number of 1970-01-01 (proleptic Gregorian ordinal)
+_EPOCH_DATENUM = 719163.0
+_US_PER_DAY = 86400 * 1000000
+_US_PER_SECOND = 1000000
+
+
+def datenums_to_datetime64(datenums):
+    """Convert Backtrader date numbers to datetime64[us].
+
+    Rounds like ``bt.num2date``: offsets within 10 microseconds of a whole
+    second are snapped to it, so bar timestamps come out exact.
+    """
+    us = np.rint((np.asarray(datenums, dtype=np.float64) - _EPOCH_DATENUM) * _US_PER_DAY).astype(np.int64)
+    frac = us % _US_PER_SECOND
+    us -= np.where(frac < 10, frac, 0)
+    us += np.where(frac > _US_PER_SECOND - 10, _US_PER_SECOND - frac, 0)
+    return us.view('datetime64[us]')
+
+
+class EquityRecorder:
+    """Portfolio value per bar in preallocated NumPy arrays.
+
+    Args:
+        capacity: Expected number of bars (e.g. ``data.buflen()`` after preload)
+        sample_every: Keep one sample every N bars (1 = every bar)
+    """
+
+    def __init__(self, capacity=0, sample_every=1):
+        self.sample_every = max(1, int(sample_every))
+        size = max(16, -(-int(capacity) // self.sample_every) + 1)
+        self._values = np.empty(size, dtype=np.float64)
+        self._datenums = np.empty(size, dtype=np.float64)
+        self._count = 0    # committed samples
+        self._bars = 0     # bars seen
+        self._pending = False  # last bar written but not yet committed
+
+    def record(self, datenum, value):
+        """Store the value for one bar (Backtrader date number + portfolio value)."""
+        n = self._count
+        if n >= len(self._values):
+            self._grow()
+        self._values[n] = value
+        self._datenums[n] = datenum
+        if self._bars % self.sample_every == 0:
+            self._count = n + 1
+            self._pending = False
+        else:
+            # Overwritten by the next bar until a sample boundary is reached
+            self._pending = True
+        self._bars += 1
+
+    def _grow(self):
+        size = len(self._values) * 2
+        self._values = np.resize(self._values, size)
+        self._datenums = np.resize(self._datenums, size)
+
+    def __len__(self):
+        return self._count + self._pending
+
+    @property
+    def bars(self):
+        """Number of bars recorded (before downsampling)."""
+        return self._bars
+
+    @property
+    def values(self):
+        """Portfolio values as a float64 array view."""
+        return self._values[:len(self)]
+
+    @property
+    def datenums(self):
+        """Backtrader date numbers as a float64 array view."""
+        return self._datenums[:len(self)]
+
+    @property
+    def timestamps(self):
+        """Sample timestamps as a datetime64[us] array."""
+        return datenums_to_datetime64(self.datenums)
+
+    def periods_per_year(self, bars_per_year):
+        """Annualisation factor for the recorded (possibly downsampled) curve."""
+        return bars_per_year / self.sample_every
+
+    def state(self):
+        """Samples and counters as plain values (for checkpoints)."""
+        return {
+            'sample_every': self.sample_every,
+            'values': self.values.copy(),
+            'datenums': self.datenums.copy(),
+            'count': self._count,
+            'bars': self._bars,
+            'pending': self._pending,
+        }
+
+    def restore(self, state):
+        """Continue recording after the samples of a ``state()`` snapshot."""
+        stored = len(state['values'])
+        size = stored + len(self._values)
+        self._values = np.empty(size, dtype=np.float64)
+        self._datenums = np.empty(size, dtype=np.float64)
+        self._values[:stored] = state['values']
+        self._datenums[:stored] = state['datenums']
+        self.sample_every = state['sample_every']
+        self._count = state['count']
+        self._bars = state['bars']
+        self._pending = state['pending']
@@ -0,0 +1,79 @@
+"""Feed binding for SunriseOgle strategies in a multi-feed Cerebro.
+
+In portfolio mode every asset's feed is loaded into one Cerebro with one
+shared broker, and one strategy instance per asset selects its feed with
+the ``dataname`` param. Backtrader defaults orders and ``position`` to
+``self.datas[0]`` and ticks the strategy clock on every feed, so
+``FeedBoundStrategyMixin``:
+
+- routes ``buy``/``sell``/``close``/``getposition``/``position`` to
+  ``self.data`` (the bound feed)
+- tells ``next()`` whether the bound feed produced a new bar
+- sizes against ``equity_allocation`` of the shared broker value
+- values the strategy as its allocated cash plus its own realized and
+  unrealized P&L, so per-asset equity curves stay meaningful
+
+With a single feed (and ``equity_allocation=1.0``) all of this reduces to
+the plain Backtrader behaviour.
+"""
+
+
+class FeedBoundStrategyMixin:
+    """Mixin placed before ``bt.Strategy``; expects ``dataname`` and
+    ``equity_allocation`` params on the strategy."""
+
+    def buy(self, data=None, *args, **kwargs):
+        return super().buy(self.data if data is None else data, *args, **kwargs)
+
+    def sell(self, data=None, *args, **kwargs):
+        return super().sell(self.data if data is None else data, *args, **kwargs)
+
+    def close(self, data=None, *args, **kwargs):
+        return super().close(self.data if data is None else data, *args, **kwargs)
+
+    def getposition(self, data=None, broker=None):
+        return super().getposition(self.data if data is None else data, broker)
+
+    position = property(getposition)
+
+    @property
+    def is_feed_bound(self):
+        """True when running as one of several strategies sharing a broker."""
+        return bool(self.p.dataname) and len(self.datas) > 1
+
+    def _bound_bar_is_new(self):
+        """True once per bar of the bound feed (always True with one feed)."""
+        bars = len(self.data)
+        if bars == getattr(self, '_bound_bars_seen', None):
+            return False
+        self._bound_bars_seen = bars
+        return True
+
+    def account_equity(self):
+        """Equity used for position sizing: this strategy's share of the broker value."""
+        return self.broker.get_value() * self.p.equity_allocation
+
+    def strategy_value(self):
+        """Value attributable to this strategy (broker value with a single feed)."""
+        if not self.is_feed_bound:
+            return self.broker.get_value()
+
+        if not hasattr(self, '_allocated_cash'):
+            self._allocated_cash = self.broker.startingcash * self.p.equity_allocation
+            self._realized_pnl = 0.0
+            self._closed_trade_idx = 0
+
+        # Closed trades are final; walk forward from the last open one
+        trades = self._trades[self.data][0]
+        while self._closed_trade_idx < len(trades) and trades[self._closed_trade_idx].isclosed:
+            self._realized_pnl += trades[self._closed_trade_idx].pnlcomm
+            self._closed_trade_idx += 1
+
+        value = self._allocated_cash + self._realized_pnl
+        if self._closed_trade_idx < len(trades):
+            value += trades[self._closed_trade_idx].pnlcomm  # partial closes of the open trade
+        position = self.getposition()
+        if position.size:
+            comminfo = self.broker.getcommissioninfo(self.data)
+            value += comminfo.profitandloss(position.size, position.price, self.data.close[0])
+        return value
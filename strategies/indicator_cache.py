@@ -0,0 +1,244 @@
+"""Precomputed EMA/ATR lines for SunriseOgle strategies.
+
+Opt-in replacement for ``bt.ind.EMA`` and ``bt.ind.ATR``: each series is
+computed once over the whole preloaded data array, cached per
+(data, indicator, period) and exposed to the strategy as a regular
+indicator line, so ``self.ema_fast[0]`` / ``self.atr[0]`` keep working.
+
+Values are bit-identical to Backtrader: the seeds use the same
+``math.fsum`` arithmetic mean and the recurrences apply the same
+``prev * alpha1 + value * alpha`` operations in the same order. Parameter
+sweeps that only change filter thresholds hit the cache instead of
+recomputing every indicator.
+
+``crossover_masks`` gives the bars where one line crosses another as
+boolean arrays, cached per (data, period pair), for strategies that look
+crossovers up instead of comparing line values on every bar.
+
+``SeededEMA``/``SeededATR`` continue a series from a checkpointed value
+at the first bar instead of seeding it from a mean, for runs resumed
+from a checkpoint (see checkpoint.py).
+
+Requires preloaded data (Cerebro's default ``preload=True``).
+"""
+
+import hashlib
+import math
+from array import array
+
+import backtrader as bt
+import numpy as np
+
+# (data fingerprint, kind, period...) -> list of values (NaN during warmup)
+# or, for crossovers, a pair of boolean arrays
+_SERIES_CACHE = {}
+
+
+def clear_indicator_cache():
+    """Drop all cached indicator series."""
+    _SERIES_CACHE.clear()
+
+
+def _fingerprint(*arrays):
+    """Content fingerprint of Backtrader line arrays (array.array('d'))."""
+    digest = hashlib.blake2b(digest_size=16)
+    for arr in arrays:
+        digest.update(memoryview(arr).cast('B'))
+    return (len(arrays[0]), digest.hexdigest())
+
+
+def _smoothed_series(values, period, alpha, first):
+    """Exponential smoothing seeded with the fsum mean, as Backtrader does.
+
+    Args:
+        values: Input values (list of floats)
+        period: Seed window length
+        alpha: Smoothing factor
+        first: Index of the first valid input value
+
+    Returns:
+        list: Smoothed values, NaN before the seed bar
+    """
+    size = len(values)
+    out = [float('nan')] * size
+    seed_idx = first + period - 1
+    if seed_idx >= size:
+        return out
+
+    alpha1 = 1.0 - alpha
+    prev = out[seed_idx] = math.fsum(values[first:seed_idx + 1]) / period
+    for i in range(seed_idx + 1, size):
+        out[i] = prev = prev * alpha1 + values[i] * alpha
+    return out
+
+
+def seeded_series(values, seed, alpha):
+    """Continue an exponential smoothing from ``seed`` at index 0.
+
+    Applies the same recurrence as ``_smoothed_series``, so a series
+    resumed from a checkpointed value matches the uninterrupted one.
+    """
+    out = [float('nan')] * len(values)
+    if not out:
+        return out
+
+    alpha1 = 1.0 - alpha
+    prev = out[0] = seed
+    for i in range(1, len(values)):
+        out[i] = prev = prev * alpha1 + values[i] * alpha
+    return out
+
+
+def _true_range(high, low, close):
+    """True range per bar (NaN on the first bar, which has no previous close)."""
+    h = np.frombuffer(high, dtype=np.float64)
+    l = np.frombuffer(low, dtype=np.float64)
+    c = np.frombuffer(close, dtype=np.float64)
+    true_range = np.full(len(c), np.nan)
+    if len(c) > 1:
+        prev_close = c[:-1]
+        true_range[1:] = (np.maximum(h[1:], prev_close) -
+                          np.minimum(l[1:], prev_close))
+    return true_range
+
+
+def ema_series(close, period):
+    """EMA values identical to bt.ind.EMA over a close array."""
+    key = (_fingerprint(close), 'ema', period)
+    series = _SERIES_CACHE.get(key)
+    if series is None:
+        series = _smoothed_series(close.tolist(), period, 2.0 / (1.0 + period), 0)
+        _SERIES_CACHE[key] = series
+    return series
+
+
+def atr_series(high, low, close, period):
+    """ATR values identical to bt.ind.ATR (Wilder smoothing of true range)."""
+    key = (_fingerprint(high, low, close), 'atr', period)
+    series = _SERIES_CACHE.get(key)
+    if series is None:
+        true_range = _true_range(high, low, close)
+        series = _smoothed_series(true_range.tolist(), period, 1.0 / period, 1)
+        _SERIES_CACHE[key] = series
+    return series
+
+
+def crossover_masks(close, period_a, period_b, a, b, variant=None):
+    """Bars where line ``a`` crosses above / below line ``b``.
+
+    Same rule as a per-bar ``a[0] > b[0] and a[-1] <= b[-1]`` check
+    (crossunder: ``<`` and ``>=``), including ``[-1]`` on the first bar
+    reading the last array element. Lines computed from the same close
+    array with the same periods share one cache entry.
+
+    Args:
+        close: Close array the lines were computed from (cache key)
+        period_a, period_b: Periods of the two lines (cache key)
+        a, b: Line arrays (array.array('d') or NumPy) covering the feed
+        variant: Extra cache key, e.g. the seeds of resumed lines
+
+    Returns:
+        tuple: (above, below) NumPy bool arrays
+    """
+    key = (_fingerprint(close), 'cross', period_a, period_b, variant)
+    masks = _SERIES_CACHE.get(key)
+    if masks is None:
+        a = np.asarray(a, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        prev_a, prev_b = np.roll(a, 1), np.roll(b, 1)
+        masks = ((a > b) & (prev_a <= prev_b), (a < b) & (prev_a >= prev_b))
+        _SERIES_CACHE[key] = masks
+    return masks
+
+
+class _PrecomputedLine(bt.Indicator):
+    """Indicator whose single line is copied from a precomputed series."""
+
+    params = (('period', 14),)
+
+    def _series(self):
+        raise NotImplementedError
+
+    def _ensure_series(self):
+        if getattr(self, '_values', None) is None:
+            self._values = self._series()
+        return self._values
+
+    def next(self):
+        self.lines[0][0] = self._ensure_series()[len(self) - 1]
+
+    def oncestart(self, start, end):
+        self.once(start, end)
+
+    def once(self, start, end):
+        values = self._ensure_series()
+        self.lines[0].array[start:end] = array('d', values[start:end])
+
+
+class PrecomputedEMA(_PrecomputedLine):
+    """Drop-in for bt.ind.EMA backed by a cached precomputed series."""
+
+    alias = ('PEMA',)
+    lines = ('ema',)
+
+    def __init__(self):
+        self.addminperiod(self.p.period)
+
+    def _series(self):
+        return ema_series(self.data.array, self.p.period)
+
+
+class PrecomputedATR(_PrecomputedLine):
+    """Drop-in for bt.ind.ATR backed by a cached precomputed series."""
+
+    alias = ('PATR',)
+    lines = ('atr',)
+
+    def __init__(self):
+        # True range needs the previous close, hence one extra bar
+        self.addminperiod(self.p.period + 1)
+
+    def _series(self):
+        d = self.data
+        return atr_series(d.high.array, d.low.array, d.close.array, self.p.period)
+
+
+class _SeededLine(_PrecomputedLine):
+    """Precomputed line continued from a checkpointed ``seed`` at bar 0.
+
+    The seed bar only provides history (``[-1]`` on the next bar), so the
+    line reports a minimum period of 2 but is filled from the first bar.
+    """
+
+    params = (('seed', float('nan')),)
+
+    def __init__(self):
+        self.addminperiod(2)
+
+    def prenext(self):
+        self.next()
+
+    def preonce(self, start, end):
+        self.once(start, end)
+
+
+class SeededEMA(_SeededLine):
+    """EMA resumed from a checkpointed value (see ``seeded_series``)."""
+
+    alias = ('SEMA',)
+    lines = ('ema',)
+
+    def _series(self):
+        return seeded_series(self.data.array.tolist(), self.p.seed, 2.0 / (1.0 + self.p.period))
+
+
+class SeededATR(_SeededLine):
+    """ATR resumed from a checkpointed value (see ``seeded_series``)."""
+
+    alias = ('SATR',)
+    lines = ('atr',)
+
+    def _series(self):
+        d = self.data
+        true_range = _true_range(d.high.array, d.low.array, d.close.array)
+        return seeded_series(true_range.tolist(), self.p.seed, 1.0 / self.p.period)
@@ -0,0 +1,137 @@
+"""Vectorized Monte Carlo resampling of closed-trade P&L sequences.
+
+A backtest is one ordering of its trades. Resampling the per-trade P&L
+values into many alternative sequences gives distributions (and confidence
+intervals) for the final equity, the maximum drawdown and the risk of ruin
+instead of single-path numbers:
+
+- ``bootstrap``: draw trades with replacement (same trade count per path)
+- ``shuffle``: permute the actual trades (same final equity on every path;
+  only the path, and therefore the drawdown, changes)
+
+Paths are generated as 2-D NumPy arrays (one row per path) in chunks of at
+most ``_CHUNK_ELEMENTS`` trades, so memory stays bounded for any number of
+paths. A seeded ``numpy.random.Generator`` makes every run reproducible.
+
+Conventions follow portfolio_metrics: drawdowns are positive percentages of
+the running peak, measured here at trade exits (the equity between exits is
+not known without the bars).
+"""
+
+import numpy as np
+
+METHODS = ('bootstrap', 'shuffle')
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Upper bound on path x trade elements materialized per chunk
+_CHUNK_ELEMENTS = 1 << 21
+
+
+def resample_trades(pnls, paths, method='bootstrap', rng=None):
+    """Resampled trade sequences as a (paths, trades) array.
+
+    Args:
+        pnls: Closed-trade P&L values in account currency
+        paths: Number of sequences to draw
+        method: 'bootstrap' (with replacement) or 'shuffle' (permutation)
+        rng: numpy.random.Generator (default: unseeded)
+    """
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, got {method!r}")
+    pnls = np.asarray(pnls, dtype=np.float64)
+    rng = rng if rng is not None else np.random.default_rng()
+    if method == 'bootstrap':
+        return pnls[rng.integers(0, len(pnls), size=(paths, len(pnls)))]
+    return rng.permuted(np.broadcast_to(pnls, (paths, len(pnls))), axis=1)
+
+
+def path_statistics(sequences, starting_cash, ruin_level=0.5):
+    """Final equity, maximum drawdown and ruin flag of every path.
+
+    Args:
+        sequences: (paths, trades) array of P&L values
+        starting_cash: Equity before the first trade
+        ruin_level: Ruin when equity falls to this fraction of starting_cash
+
+    Returns:
+        dict: 'final_equity', 'max_drawdown_pct', 'max_drawdown_amount'
+        and 'ruined' arrays (one value per path)
+    """
+    equity = np.empty((len(sequences), sequences.shape[1] + 1), dtype=np.float64)
+    equity[:, 0] = starting_cash
+    np.cumsum(sequences, axis=1, out=equity[:, 1:])
+    equity[:, 1:] += starting_cash
+
+    peaks = np.maximum.accumulate(equity, axis=1)
+    drawdown_amount = peaks - equity
+    return {
+        'final_equity': equity[:, -1].copy(),
+        'max_drawdown_pct': (drawdown_amount / peaks).max(axis=1) * 100.0,
+        'max_drawdown_amount': drawdown_amount.max(axis=1),
+        'ruined': (equity <= starting_cash * ruin_level).any(axis=1),
+    }
+
+
+def simulate(pnls, starting_cash, paths=10000, method='bootstrap', seed=0, ruin_level=0.5):
+    """Monte Carlo distributions of a trade P&L list.
+
+    Args:
+        pnls: Closed-trade P&L values in account currency (in trade order)
+        starting_cash: Equity before the first trade
+        paths: Number of resampled sequences
+        method: 'bootstrap' or 'shuffle'
+        seed: Random seed (the same seed always yields the same paths)
+        ruin_level: Ruin when equity falls to this fraction of starting_cash
+
+    Returns:
+        dict: path_statistics() arrays over all paths (empty without trades)
+    """
+    pnls = np.asarray(pnls, dtype=np.float64)
+    if len(pnls) == 0 or paths < 1:
+        return {
+            'final_equity': np.full(max(paths, 0), float(starting_cash)),
+            'max_drawdown_pct': np.zeros(max(paths, 0)),
+            'max_drawdown_amount': np.zeros(max(paths, 0)),
+            'ruined': np.zeros(max(paths, 0), dtype=bool),
+        }
+
+    rng = np.random.default_rng(seed)
+    chunk = max(1, _CHUNK_ELEMENTS // len(pnls))
+    parts = []
+    for start in range(0, paths, chunk):
+        sequences = resample_trades(pnls, min(chunk, paths - start), method, rng)
+        parts.append(path_statistics(sequences, starting_cash, ruin_level))
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+
+def summarize_distribution(values, percentiles=DEFAULT_PERCENTILES):
+    """Mean, standard deviation and percentiles of one distribution."""
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return {'mean': 0.0, 'std': 0.0, **{f'p{p}': 0.0 for p in percentiles}}
+    summary = {'mean': float(values.mean()), 'std': float(values.std())}
+    summary.update({f'p{p}': float(v) for p, v in zip(percentiles, np.percentile(values, percentiles))})
+    return summary
+
+
+def monte_carlo_report(pnls, starting_cash, paths=10000, method='bootstrap', seed=0,
+                       ruin_level=0.5, percentiles=DEFAULT_PERCENTILES):
+    """Summary of a simulation: distributions, risk of ruin and loss probability.
+
+    Returns:
+        dict: 'trades', 'paths', 'method', 'final_equity', 'return_pct',
+        'max_drawdown_pct' (summarize_distribution dicts), 'risk_of_ruin'
+        and 'probability_of_loss' (fractions of paths)
+    """
+    stats = simulate(pnls, starting_cash, paths, method, seed, ruin_level)
+    final_equity = stats['final_equity']
+    return {
+        'trades': len(pnls),
+        'paths': len(final_equity),
+        'method': method,
+        'final_equity': summarize_distribution(final_equity, percentiles),
+        'return_pct': summarize_distribution((final_equity / starting_cash - 1.0) * 100.0, percentiles),
+        'max_drawdown_pct': summarize_distribution(stats['max_drawdown_pct'], percentiles),
+        'risk_of_ruin': float(stats['ruined'].mean()) if len(final_equity) else 0.0,
+        'probability_of_loss': float((final_equity < starting_cash).mean()) if len(final_equity) else 0.0,
+    }
@@ -0,0 +1,89 @@
+"""Monthly trade statistics as one precomputed cube.
+
+``monthly_cube`` reduces a closed-trades DataFrame (journal columns, see
+trade_journal.py) to one row per calendar month with trades: entry counts,
+winners/losers, the busiest day, P&L, and the return relative to the
+balance accumulated up to that month. The console tables and the heatmaps
+all read from it, so the trades are grouped once, with pandas groupby and
+cumulative sums instead of per-month Python loops, and sweep outputs with
+hundreds of thousands of trades stay cheap.
+
+Months are keyed by the trade's entry time.
+"""
+
+import numpy as np
+
+CUBE_COLUMNS = ('total', 'winners', 'losers', 'max_daily', 'pnl', 'return_pct', 'balance')
+
+
+def monthly_cube(trades, starting_cash):
+    """Per-month statistics of closed trades
+
+    Args:
+        trades: DataFrame with 'entry_time' and 'pnl' columns (closed trades)
+        starting_cash: Balance the first month's return is relative to
+
+    Returns:
+        pandas.DataFrame: Indexed by month (pandas Period, ascending) with
+        'year', 'month' and CUBE_COLUMNS: entry counts, winners (pnl > 0),
+        losers (the rest), max entries on one day, P&L sum, return in percent
+        of the balance before the month (0 when that balance is not
+        positive) and the balance after it
+    """
+    import pandas as pd
+
+    entry_time = trades['entry_time']
+    month = entry_time.dt.to_period('M').rename('year_month')
+    winners = (trades['pnl'] > 0).rename('winners')
+
+    grouped = trades['pnl'].groupby(month)
+    cube = pd.DataFrame({
+        'total': grouped.size(),
+        'winners': winners.groupby(month).sum().astype(np.int64),
+        'pnl': grouped.sum(),
+    })
+    cube['losers'] = cube['total'] - cube['winners']
+    cube['max_daily'] = entry_time.groupby([month, entry_time.dt.normalize()]).size().groupby(level=0).max()
+
+    # Running balance, accumulated month by month in order
+    pnl = cube['pnl'].to_numpy(dtype=np.float64)
+    balances = np.cumsum(np.concatenate(([float(starting_cash)], pnl)))
+    before = balances[:-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cube['return_pct'] = np.where(before > 0, pnl / before * 100, 0.0)
+    cube['balance'] = balances[1:]
+
+    cube.insert(0, 'year', cube.index.year)
+    cube.insert(1, 'month', cube.index.month)
+    return cube[['year', 'month', *CUBE_COLUMNS]]
+
+
+def yearly_summary(cube, starting_cash):
+    """Per-year totals of a monthly cube
+
+    Returns:
+        pandas.DataFrame: Indexed by year with entry totals, winners, losers,
+        the max daily entries, the win rate (percent), the sum of the monthly
+        returns, the final balance and the year's growth over the previous
+        year's final balance (starting_cash for the first year or after a
+        year without trades)
+    """
+    years = cube.groupby('year').agg(
+        total=('total', 'sum'),
+        winners=('winners', 'sum'),
+        losers=('losers', 'sum'),
+        max_daily=('max_daily', 'max'),
+        return_pct=('return_pct', 'sum'),
+        balance=('balance', 'last'),
+    )
+    years['win_rate'] = years['winners'] / years['total'] * 100  # Every cube month has trades
+    previous = years['balance'].reindex(years.index - 1).to_numpy()
+    previous = np.where(np.isnan(previous) | (years.index == years.index.min()), starting_cash, previous)
+    years['growth_pct'] = (years['balance'].to_numpy() / previous - 1) * 100
+    return years
+
+
+def cube_matrix(cube, column):
+    """Year x month matrix (columns 1-12) of one cube column, 0 for months without trades"""
+    matrix = cube.pivot_table(index='year', columns='month', values=column, aggfunc='sum', fill_value=0)
+    return matrix.reindex(columns=range(1, 13), fill_value=0)
@@ -0,0 +1,125 @@
+"""Opt-in per-phase timing of the SunriseOgle hot path.
+
+With ``phase_timing=True`` the strategy records, per run:
+
+- cumulative time and call counts of each phase method (``timed_phases``)
+- a per-bar latency histogram of ``next()`` (power-of-two microsecond buckets)
+- the number of bars ``next()`` started in each ``entry_state``
+- the run's wall time, split into ``next()`` and everything else
+  (Backtrader engine, broker, indicators, analyzers)
+
+and writes it as JSON once ``stop()`` has run. Timing is installed at
+``start()`` by wrapping the methods on the instance, so with the option off
+the strategy runs its plain methods and pays nothing.
+
+Phases can nest (``_confirm_crosses`` runs inside ``_phase1_scan_for_signal``),
+so phase totals are inclusive and do not add up to the ``next()`` time;
+order/trade notifications are timed too but run outside ``next()``.
+"""
+
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Latency buckets: bucket n counts bars that took less than 2**n microseconds
+_HISTOGRAM_BUCKETS = 24
+
+
+class PhaseTimingMixin:
+    """Mixin placed before ``bt.Strategy``; expects ``phase_timing``,
+    ``phase_timing_file`` and ``report_dir`` params and a ``timed_phases``
+    class attribute mapping phase names to method names."""
+
+    timed_phases = {}
+
+    def start(self):
+        if self.p.phase_timing:
+            self._install_phase_timing()
+        super().start()
+
+    def _stop(self):
+        # After the strategy's own stop(), which does not chain to super()
+        super()._stop()
+        if self.p.phase_timing:
+            self._write_phase_timing()
+
+    def _install_phase_timing(self):
+        self._phase_calls = {name: 0 for name in self.timed_phases}
+        self._phase_ns = {name: 0 for name in self.timed_phases}
+        self._bar_histogram = [0] * _HISTOGRAM_BUCKETS
+        self._state_bars = {}
+        self._run_started_ns = time.perf_counter_ns()
+
+        for name, method_name in self.timed_phases.items():
+            setattr(self, method_name, self._timed(name, getattr(self, method_name)))
+
+        plain_next = self.next
+        histogram, state_bars = self._bar_histogram, self._state_bars
+        last_bucket = _HISTOGRAM_BUCKETS - 1
+        self._next_ns = 0
+
+        def timed_next():
+            state = self.entry_state
+            state_bars[state] = state_bars.get(state, 0) + 1
+            t0 = time.perf_counter_ns()
+            plain_next()
+            elapsed = time.perf_counter_ns() - t0
+            self._next_ns += elapsed
+            histogram[min((elapsed // 1000).bit_length(), last_bucket)] += 1
+
+        self.next = timed_next
+
+    def _timed(self, name, method):
+        calls, totals = self._phase_calls, self._phase_ns
+
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter_ns()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                totals[name] += time.perf_counter_ns() - t0
+                calls[name] += 1
+
+        return timed
+
+    def phase_timing_report(self):
+        """The collected timings as a plain dict (None when timing is off)"""
+        if not self.p.phase_timing:
+            return None
+        wall_ns = time.perf_counter_ns() - self._run_started_ns
+        bars = sum(self._bar_histogram)
+        return {
+            'asset': self.p.forex_instrument,
+            'bars': bars,
+            'wall_s': wall_ns / 1e9,
+            'next_s': self._next_ns / 1e9,
+            'engine_other_s': (wall_ns - self._next_ns) / 1e9,
+            'next_mean_us': self._next_ns / bars / 1e3 if bars else 0.0,
+            'phases': {
+                name: {
+                    'calls': self._phase_calls[name],
+                    'total_s': self._phase_ns[name] / 1e9,
+                    'mean_us': self._phase_ns[name] / self._phase_calls[name] / 1e3 if self._phase_calls[name] else 0.0,
+                    'share_of_next': self._phase_ns[name] / self._next_ns if self._next_ns else 0.0,
+                }
+                for name in self.timed_phases
+            },
+            'bar_latency_us': [
+                {'lt_us': 2 ** n, 'bars': count}
+                for n, count in enumerate(self._bar_histogram) if count
+            ],
+            'entry_state_bars': dict(sorted(self._state_bars.items())),
+        }
+
+    def _write_phase_timing(self):
+        report = self.phase_timing_report()
+        path = self.p.phase_timing_file
+        if path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = Path(self.p.report_dir or "temp_reports") / f"{self.p.forex_instrument}_phase_timing_{timestamp}.json"
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"⏱️ PHASE TIMING: {path}")
@@ -0,0 +1,228 @@
+"""Vectorized equity-curve metrics for SunriseOgle strategies and the runner.
+
+Every function takes an equity curve (portfolio value per sample, e.g.
+``EquityRecorder.values``) and works on NumPy arrays; only
+``align_equity_curves`` (multi-asset time alignment) needs pandas. Ratios use
+bar-to-bar simple returns annualized with ``periods_per_year`` (5-minute
+bars by default; pass ``EquityRecorder.periods_per_year(...)`` for
+downsampled curves) and no risk-free rate, as the strategies always have.
+
+Conventions:
+    - Drawdowns are positive percentages of the running peak (4.9 = 4.9%)
+    - Durations are counted in samples
+    - Too-short or flat curves give 0.0 rather than NaN/inf
+"""
+
+import numpy as np
+
+BARS_PER_YEAR_5M = 252 * 24 * 12  # 5-minute periods per year (252 trading days)
+
+# Minimum number of samples before Sharpe/Sortino are reported
+MIN_RATIO_SAMPLES = 11
+
+# Upper bound on elements materialized per chunk by the rolling drawdown
+_ROLLING_CHUNK_ELEMENTS = 1 << 22
+
+
+def _as_curve(values):
+    return np.asarray(values, dtype=np.float64)
+
+
+def simple_returns(values):
+    """Bar-to-bar simple returns of an equity curve."""
+    values = _as_curve(values)
+    if len(values) < 2:
+        return np.empty(0, dtype=np.float64)
+    return np.diff(values) / values[:-1]
+
+
+def drawdown_series(values):
+    """Drawdown from the running peak at every sample, in percent."""
+    values = _as_curve(values)
+    peaks = np.maximum.accumulate(values) if len(values) else values
+    return (peaks - values) / peaks * 100.0
+
+
+def max_drawdown(values):
+    """Largest peak-to-trough decline, in percent of the peak."""
+    if len(values) == 0:
+        return 0.0
+    return max(0.0, float(drawdown_series(values).max()))
+
+
+def max_drawdown_amount(values):
+    """Largest peak-to-trough decline in account currency."""
+    values = _as_curve(values)
+    if len(values) == 0:
+        return 0.0
+    return float((np.maximum.accumulate(values) - values).max())
+
+
+def max_drawdown_duration(values):
+    """Longest run of consecutive samples below a previous peak.
+
+    A drawdown still open at the end of the curve counts up to the last
+    sample.
+    """
+    values = _as_curve(values)
+    if len(values) == 0:
+        return 0
+    index = np.arange(len(values))
+    at_peak = values >= np.maximum.accumulate(values)
+    last_peak = np.maximum.accumulate(np.where(at_peak, index, 0))
+    return int((index - last_peak).max())
+
+
+def sharpe_ratio(values, periods_per_year=BARS_PER_YEAR_5M):
+    """Annualized Sharpe ratio of bar-to-bar returns."""
+    if len(values) < MIN_RATIO_SAMPLES:
+        return 0.0
+    returns = simple_returns(values)
+    std_return = np.std(returns)
+    if std_return <= 0:
+        return 0.0
+    return float((np.mean(returns) * periods_per_year) / (std_return * np.sqrt(periods_per_year)))
+
+
+def sortino_ratio(values, periods_per_year=BARS_PER_YEAR_5M):
+    """Annualized Sortino ratio (downside deviation of returns below zero)."""
+    if len(values) < MIN_RATIO_SAMPLES:
+        return 0.0
+    returns = simple_returns(values)
+    downside = np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2))
+    if downside <= 0:
+        return 0.0
+    return float((np.mean(returns) * periods_per_year) / (downside * np.sqrt(periods_per_year)))
+
+
+def annual_return(values, periods_per_year=BARS_PER_YEAR_5M):
+    """Compound annual growth rate of the curve, in percent."""
+    values = _as_curve(values)
+    if len(values) < 2 or values[0] <= 0 or values[-1] <= 0:
+        return 0.0
+    years = (len(values) - 1) / periods_per_year
+    return float(((values[-1] / values[0]) ** (1.0 / years) - 1.0) * 100.0)
+
+
+def calmar_ratio(values, periods_per_year=BARS_PER_YEAR_5M):
+    """Annual return divided by the maximum drawdown (both in percent)."""
+    max_dd = max_drawdown(values)
+    if max_dd <= 0:
+        return 0.0
+    return annual_return(values, periods_per_year) / max_dd
+
+
+def recovery_factor(values):
+    """Net profit divided by the largest drawdown in account currency."""
+    values = _as_curve(values)
+    max_dd = max_drawdown_amount(values)
+    if max_dd <= 0:
+        return 0.0
+    return float((values[-1] - values[0]) / max_dd)
+
+
+def rolling_sharpe(values, window, periods_per_year=BARS_PER_YEAR_5M):
+    """Sharpe ratio over a trailing window of ``window`` returns.
+
+    Returns an array aligned with ``values`` (NaN until a full window of
+    returns is available, and where the window has no variance).
+    """
+    values = _as_curve(values)
+    out = np.full(len(values), np.nan)
+    returns = simple_returns(values)
+    if window < 2 or len(returns) < window:
+        return out
+
+    csum = np.concatenate(([0.0], np.cumsum(returns)))
+    csum_sq = np.concatenate(([0.0], np.cumsum(returns ** 2)))
+    mean = (csum[window:] - csum[:-window]) / window
+    var = np.maximum((csum_sq[window:] - csum_sq[:-window]) / window - mean ** 2, 0.0)
+    std = np.sqrt(var)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(std > 0, (mean * periods_per_year) / (std * np.sqrt(periods_per_year)), np.nan)
+    out[window:] = ratio
+    return out
+
+
+def rolling_max_drawdown(values, window):
+    """Maximum drawdown (percent) within each trailing window of samples.
+
+    Returns an array aligned with ``values`` (NaN until the first full
+    window). Windows are processed in chunks to bound memory use.
+    """
+    values = _as_curve(values)
+    out = np.full(len(values), np.nan)
+    if window < 1 or len(values) < window:
+        return out
+
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    chunk = max(1, _ROLLING_CHUNK_ELEMENTS // window)
+    for start in range(0, len(windows), chunk):
+        block = windows[start:start + chunk]
+        peaks = np.maximum.accumulate(block, axis=1)
+        out[window - 1 + start:window - 1 + start + len(block)] = ((peaks - block) / peaks * 100.0).max(axis=1)
+    return out
+
+
+def equity_metrics(values, periods_per_year=BARS_PER_YEAR_5M):
+    """All summary metrics of an equity curve as a plain dict."""
+    values = _as_curve(values)
+    return {
+        'max_drawdown_pct': max_drawdown(values),
+        'max_drawdown_duration': max_drawdown_duration(values),
+        'sharpe_ratio': sharpe_ratio(values, periods_per_year),
+        'sortino_ratio': sortino_ratio(values, periods_per_year),
+        'annual_return_pct': annual_return(values, periods_per_year),
+        'calmar_ratio': calmar_ratio(values, periods_per_year),
+        'recovery_factor': recovery_factor(values),
+    }
+
+
+def periods_per_year_from_index(timestamps):
+    """Annualization factor for a curve sampled at the median spacing of ``timestamps``.
+
+    5-minute spacing gives BARS_PER_YEAR_5M; hourly gives a twelfth of it.
+    """
+    timestamps = np.asarray(timestamps, dtype='datetime64[us]')
+    if len(timestamps) < 2:
+        return BARS_PER_YEAR_5M
+    step_us = float(np.median(np.diff(timestamps).astype(np.int64)))
+    if step_us <= 0:
+        return BARS_PER_YEAR_5M
+    return BARS_PER_YEAR_5M * (300e6 / step_us)
+
+
+def align_equity_curves(curves, freq=None):
+    """Outer-join per-asset equity curves on their timestamps.
+
+    Each asset is carried forward between its own samples and after its
+    last one, and holds its first value (the allocated cash) before its
+    first sample, so the row sums are the combined portfolio value at
+    every timestamp seen by any feed.
+
+    Args:
+        curves: Mapping of asset -> (timestamps, values) arrays
+        freq: Optional pandas offset alias to resample to (e.g. '1h', '1D');
+            None keeps the union of all bar timestamps
+
+    Returns:
+        pandas.DataFrame: One column per asset, indexed by timestamp
+    """
+    import pandas as pd
+
+    columns = {}
+    for asset, (timestamps, values) in curves.items():
+        if len(values) == 0:
+            continue
+        index = pd.DatetimeIndex(np.asarray(timestamps, dtype='datetime64[us]'))
+        series = pd.Series(_as_curve(values), index=index)
+        # A feed can repeat a timestamp (e.g. a resampled boundary); keep the latest value
+        columns[asset] = series[~index.duplicated(keep='last')]
+
+    if not columns:
+        return pd.DataFrame(dtype=np.float64)
+
+    frame = pd.concat(columns, axis=1, join='outer').sort_index()
+    if freq is not None:
+        frame = frame.resample(freq).last()
+    return frame.ffill().bfill()
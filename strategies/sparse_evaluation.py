@@ -0,0 +1,69 @@
+"""Sparse event-driven evaluation of the SunriseOgle entry logic.
+
+While the strategy is flat, has no pending orders and is SCANNING for a
+Phase-1 signal, ``next()`` can only change state on a bar where one of the
+confirm-EMA crossovers fires. With ``sparse_evaluation=True`` those
+candidate bars are precomputed once from the indicator arrays, and on every
+other bar an idle strategy returns right after recording its equity, so:
+
+- armed setups, open windows, pending orders and open positions are still
+  followed bar by bar (the strategy is not idle)
+- the equity curve is still recorded on every bar
+- trades are identical, as the candidate mask is a superset of the bars
+  where ``_phase1_scan_for_signal`` can return a signal
+
+The candidate mask needs the indicator lines computed over the whole feed
+before the first ``next()`` (Backtrader's default preload + runonce mode);
+otherwise every bar is evaluated. Skipped and evaluated bar counts are
+printed after ``stop()`` and available from ``sparse_evaluation_report()``.
+"""
+
+
+class SparseEvaluationMixin:
+    """Mixin placed before ``bt.Strategy``; expects a ``sparse_evaluation``
+    param and two methods on the strategy:
+
+    - ``sparse_candidate_mask()``: NumPy bool array over the feed, True on
+      bars where a signal can fire (None when it cannot be built)
+    - ``sparse_idle()``: True when a bar without a signal cannot change state
+    """
+
+    def start(self):
+        self._sparse_mask = None
+        self._sparse_bars = 0
+        self._sparse_skipped = 0
+        super().start()
+
+    def _stop(self):
+        # After the strategy's own stop(), which does not chain to super()
+        super()._stop()
+        if self.p.sparse_evaluation:
+            report = self.sparse_evaluation_report()
+            print(f"⚡ SPARSE EVALUATION: {report['evaluated_bars']:,} of {report['bars']:,} bars evaluated "
+                  f"({report['skipped_pct']:.1f}% skipped)")
+
+    def _sparse_skip_bar(self):
+        """True when ``next()`` can return without evaluating this bar"""
+        self._sparse_bars += 1
+        mask = self._sparse_mask
+        if mask is None:
+            mask = self.sparse_candidate_mask()
+            # Keep a plain list: indexing it is much cheaper than a NumPy array
+            self._sparse_mask = mask = mask.tolist() if mask is not None else False
+        if not mask or mask[len(self.data) - 1] or not self.sparse_idle():
+            return False
+        self._sparse_skipped += 1
+        return True
+
+    def sparse_evaluation_report(self):
+        """Bar counts of the run (None when sparse evaluation is off)"""
+        if not self.p.sparse_evaluation:
+            return None
+        bars = self._sparse_bars
+        return {
+            'bars': bars,
+            'evaluated_bars': bars - self._sparse_skipped,
+            'skipped_bars': self._sparse_skipped,
+            'skipped_pct': self._sparse_skipped / bars * 100.0 if bars else 0.0,
+            'candidate_bars': sum(self._sparse_mask) if self._sparse_mask else None,
+        }
@@ -0,0 +1,128 @@
+"""Persistent SQLite index of archived trade journals.
+
+Re-reading a large report archive on every statistics run gets slow, so
+the journals are ingested once into a SQLite database (standard library
+only) together with a manifest of the ingested files. ``sync()`` compares
+the manifest with the directory and only parses journals that are new or
+whose mtime/size changed; journals that disappeared are dropped from the
+index, so it always mirrors the directory. ``trades()`` then serves
+the stored trades without touching the journal files.
+
+The index is rebuilt from scratch when JOURNAL_SCHEMA changes.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+
+from trade_journal import (DATETIME_COLUMNS, JOURNAL_SCHEMA, apply_journal_schema, find_trade_journals,
+                           read_trade_journal)
+
+INDEX_FILENAME = '.trade_index.sqlite'
+
+_SCHEMA_KEY = hashlib.sha1(repr(sorted(JOURNAL_SCHEMA.items())).encode()).hexdigest()
+_COLUMNS = list(JOURNAL_SCHEMA)
+
+
+class TradeIndex:
+    """Trades of every journal below a reports directory, kept in SQLite.
+
+    Args:
+        reports_dir: Directory holding the journals (scanned recursively)
+        path: Database file (default: <reports_dir>/.trade_index.sqlite)
+    """
+
+    def __init__(self, reports_dir, path=None):
+        self.reports_dir = Path(reports_dir)
+        self.path = Path(path) if path else self.reports_dir / INDEX_FILENAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._create()
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _create(self):
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+            if row is None or row[0] != _SCHEMA_KEY:
+                self._conn.execute("DROP TABLE IF EXISTS manifest")
+                self._conn.execute("DROP TABLE IF EXISTS trades")
+                self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema', ?)", (_SCHEMA_KEY,))
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS manifest "
+                "(run TEXT PRIMARY KEY, path TEXT, mtime_ns INTEGER, size INTEGER, trades INTEGER)")
+            columns = ', '.join(f'"{name}"' for name in _COLUMNS)
+            self._conn.execute(f"CREATE TABLE IF NOT EXISTS trades (run TEXT, {columns})")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS trades_run ON trades (run)")
+
+    def rebuild(self):
+        """Forget everything ingested so far (the next sync() re-reads every journal)."""
+        with self._conn:
+            self._conn.execute("DELETE FROM manifest")
+            self._conn.execute("DELETE FROM trades")
+
+    def sync(self):
+        """Ingest new and changed journals, drop the ones that were removed.
+
+        Returns:
+            dict: Counts of 'added', 'updated', 'removed' and 'unchanged' journals
+        """
+        known = {run: (path, mtime_ns, size) for run, path, mtime_ns, size
+                 in self._conn.execute("SELECT run, path, mtime_ns, size FROM manifest")}
+        counts = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+
+        with self._conn:
+            journals = find_trade_journals(self.reports_dir, recursive=True)
+            for run, path in journals.items():
+                stat = path.stat()
+                entry = (str(path), stat.st_mtime_ns, stat.st_size)
+                if known.get(run) == entry:
+                    counts['unchanged'] += 1
+                    continue
+                counts['updated' if run in known else 'added'] += 1
+                self._ingest(run, read_trade_journal(path), entry)
+
+            for run in known.keys() - journals.keys():
+                self._conn.execute("DELETE FROM trades WHERE run = ?", (run,))
+                self._conn.execute("DELETE FROM manifest WHERE run = ?", (run,))
+                counts['removed'] += 1
+        return counts
+
+    def _ingest(self, run, frame, entry):
+        """Replace the stored trades of one journal"""
+        import pandas as pd
+
+        self._conn.execute("DELETE FROM trades WHERE run = ?", (run,))
+        frame = frame.astype(object)
+        for column in DATETIME_COLUMNS:
+            # ISO text keeps the stored values readable and sortable
+            frame[column] = [None if pd.isna(value) else value.isoformat(sep=' ') for value in frame[column]]
+        frame = frame.where(frame.notna(), None)
+        placeholders = ', '.join('?' * (len(_COLUMNS) + 1))
+        self._conn.executemany(f"INSERT INTO trades VALUES ({placeholders})",
+                               ((run, *row) for row in frame[_COLUMNS].itertuples(index=False, name=None)))
+        self._conn.execute("INSERT OR REPLACE INTO manifest VALUES (?, ?, ?, ?, ?)", (run, *entry, len(frame)))
+
+    def trades(self, closed_only=True):
+        """Stored trades as a typed DataFrame (JOURNAL_SCHEMA columns).
+
+        Args:
+            closed_only: Only trades with an entry time and a P&L
+        """
+        import pandas as pd
+
+        columns = ', '.join(f'"{name}"' for name in _COLUMNS)
+        where = ' WHERE entry_time IS NOT NULL AND pnl IS NOT NULL' if closed_only else ''
+        frame = pd.read_sql_query(f"SELECT {columns} FROM trades{where} ORDER BY run, rowid", self._conn)
+        return apply_journal_schema(frame)
+
+    def journal_count(self):
+        return self._conn.execute("SELECT COUNT(*) FROM manifest").fetchone()[0]
@@ -0,0 +1,316 @@
+"""Structured trade journal for SunriseOgle strategies.
+
+Trades are kept in memory as typed records while the backtest runs and
+written in one go when the strategy stops, as CSV, JSONL and/or Parquet
+(Parquet needs pyarrow or fastparquet). The human-readable text report is
+rendered from the same records instead of being written line by line.
+
+Downstream statistics load the journals with ``load_trade_journals()``
+rather than parsing the text report.
+"""
+
+import math
+from pathlib import Path
+
+JOURNAL_FORMATS = ('csv', 'jsonl', 'parquet')
+
+# Column -> pandas dtype, in output order
+JOURNAL_SCHEMA = {
+    'asset': 'string',
+    'trade_id': 'int64',
+    'direction': 'string',
+    'entry_time': 'datetime64[ns]',
+    'entry_price': 'float64',
+    'size': 'float64',
+    'stop_level': 'float64',
+    'take_level': 'float64',
+    'current_atr': 'float64',
+    'atr_increment': 'float64',
+    'real_atr_increment': 'float64',
+    'current_angle': 'float64',
+    'periods_before_entry': 'int64',
+    'pullback_state': 'string',
+    'exit_time': 'datetime64[ns]',
+    'exit_price': 'float64',
+    'pnl': 'float64',
+    'pips': 'float64',
+    'exit_reason': 'string',
+    'duration_minutes': 'float64',
+    'duration_bars': 'Int64',
+    # Filter settings at entry time, used by the text renderer
+    'atr_increment_filter': 'boolean',
+    'atr_decrement_filter': 'boolean',
+    'angle_filter': 'boolean',
+    'angle_min': 'float64',
+    'angle_max': 'float64',
+}
+DATETIME_COLUMNS = ('entry_time', 'exit_time')
+
+
+class TradeJournal:
+    """In-memory trade records for one strategy run.
+
+    Args:
+        asset: Asset name stored on every record
+        base_path: Output path without extension (one file per format)
+        records: Optional list to fill (lets callers keep a reference)
+    """
+
+    def __init__(self, asset, base_path, records=None):
+        self.asset = asset
+        self.base_path = Path(base_path)
+        self.records = records if records is not None else []
+
+    def record_entry(self, **fields):
+        """Append a new open trade and return its record."""
+        record = {'asset': self.asset, 'trade_id': len(self.records) + 1}
+        record.update(fields)
+        self.records.append(record)
+        return record
+
+    def record_exit(self, exit_time, exit_price, pnl, exit_reason):
+        """Close the most recent trade; returns its record (None if no entry)."""
+        if not self.records:
+            return None
+        trade = self.records[-1]
+
+        if 'entry_time' in trade:
+            duration_minutes = (exit_time - trade['entry_time']).total_seconds() / 60
+            duration_bars = int(duration_minutes / 5)  # 5-minute bars
+        else:
+            duration_minutes = 0
+            duration_bars = 0
+
+        # Pips against the midpoint of the protective levels
+        pips = 0.0
+        entry_estimate = None
+        if trade.get('stop_level') is not None and trade.get('take_level') is not None:
+            entry_estimate = (trade['stop_level'] + trade['take_level']) / 2
+        if entry_estimate and exit_price:
+            if trade.get('direction') == 'LONG':
+                pips = (exit_price - entry_estimate) / 0.0001
+            else:
+                pips = (entry_estimate - exit_price) / 0.0001
+
+        trade.update({
+            'exit_time': exit_time,
+            'exit_price': exit_price,
+            'pnl': pnl,
+            'pips': pips,
+            'exit_reason': exit_reason,
+            'duration_minutes': duration_minutes,
+            'duration_bars': duration_bars,
+        })
+        return trade
+
+    def to_frame(self):
+        """Records as a typed pandas DataFrame (JOURNAL_SCHEMA columns)."""
+        return journal_frame(self.records)
+
+    def write(self, formats=('csv',), text_header=None):
+        """Write the journal in the requested formats.
+
+        Args:
+            formats: Iterable of JOURNAL_FORMATS entries
+            text_header: When not None, also render the text report with
+                this header (string) to ``<base_path>.txt``
+
+        Returns:
+            list: Paths written
+        """
+        self.base_path.parent.mkdir(parents=True, exist_ok=True)
+        written = []
+
+        formats = tuple(formats)
+        unknown = set(formats) - set(JOURNAL_FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown trade journal format(s): {', '.join(sorted(unknown))}")
+
+        if formats:
+            frame = self.to_frame()
+            for fmt in formats:
+                path = self.base_path.with_suffix(f'.{fmt}')
+                if fmt == 'csv':
+                    frame.to_csv(path, index=False, date_format='%Y-%m-%d %H:%M:%S')
+                elif fmt == 'jsonl':
+                    frame.to_json(path, orient='records', lines=True, date_format='iso', double_precision=15)
+                else:
+                    try:
+                        frame.to_parquet(path, index=False)
+                    except ImportError as e:
+                        print(f"Parquet trade journal skipped: {str(e).splitlines()[0]}")
+                        continue
+                written.append(path)
+
+        if text_header is not None:
+            path = self.base_path.with_suffix('.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(render_text_report(self.records, text_header))
+            written.append(path)
+
+        return written
+
+
+def journal_frame(records):
+    """Build a typed DataFrame from journal records."""
+    import pandas as pd
+
+    return apply_journal_schema(pd.DataFrame(list(records), columns=list(JOURNAL_SCHEMA)))
+
+
+def apply_journal_schema(frame):
+    """Select JOURNAL_SCHEMA columns (adding missing ones) and cast them."""
+    import pandas as pd
+
+    frame = frame.reindex(columns=list(JOURNAL_SCHEMA))
+    for column in DATETIME_COLUMNS:
+        frame[column] = pd.to_datetime(frame[column])
+    return frame.astype({k: v for k, v in JOURNAL_SCHEMA.items() if k not in DATETIME_COLUMNS})
+
+
+def _render_entry(number, trade):
+    lines = [
+        f"ENTRY #{number}",
+        f"Time: {trade['entry_time'].strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Direction: {trade['direction']}",
+        f"ATR Current: {trade['current_atr']:.6f}",
+    ]
+
+    increment = trade.get('atr_increment')
+    if increment is None or (isinstance(increment, float) and math.isnan(increment)):
+        lines.append("ATR Change: N/A")
+    elif increment >= 0:
+        label = 'Filtered' if trade.get('atr_increment_filter') else 'No Filter'
+        lines.append(f"ATR Increment: {increment:+.6f} ({label})")
+    elif trade.get('atr_decrement_filter'):
+        lines.append(f"ATR Decrement: {abs(increment):.6f} (Filtered)")
+    else:
+        lines.append(f"ATR Change: {increment:+.6f} (Decrement Filter OFF)")
+
+    angle = trade['current_angle']
+    lines.append(f"Angle Current: {angle:.2f}°")
+    if trade.get('angle_filter'):
+        lo, hi = trade['angle_min'], trade['angle_max']
+        lines.append(f"Angle Filter: ENABLED | Range: {lo:.1f}°-{hi:.1f}° | Valid: {lo <= angle <= hi}")
+    else:
+        lines.append("Angle Filter: DISABLED")
+
+    lines.append(f"Bars to Entry: {trade['periods_before_entry']}")
+    pullback_state = trade.get('pullback_state', 'NORMAL')
+    if pullback_state != 'NORMAL':
+        lines.append(f"Pullback State: {pullback_state}")
+    lines.append("-" * 50)
+    return "\n".join(lines) + "\n\n"
+
+
+def _render_exit(number, trade):
+    lines = [
+        f"EXIT #{number}",
+        f"Time: {trade['exit_time'].strftime('%Y-%m-%d %H:%M:%S')}",
+        f"Exit Reason: {trade['exit_reason']}",
+        f"P&L: {trade['pnl']:.2f}",
+    ]
+    if abs(trade['pips']) > 0.1:  # Only show pips if meaningful
+        lines.append(f"Pips: {trade['pips']:.1f}")
+    lines.append(f"Duration: {trade['duration_bars']} bars ({trade['duration_minutes']:.0f} min)")
+    lines.append("=" * 80)
+    return "\n".join(lines) + "\n\n"
+
+
+def render_text_report(records, header=''):
+    """Render journal records as the human-readable trade report.
+
+    Args:
+        records: Journal records (TradeJournal.records)
+        header: Report header (asset, configuration) written first
+
+    Returns:
+        str: Full report text
+    """
+    parts = [header]
+    for number, trade in enumerate(records, start=1):
+        parts.append(_render_entry(number, trade))
+        if 'exit_time' in trade:
+            parts.append(_render_exit(number, trade))
+
+    total_trades = len(records)
+    winning = [t['pnl'] for t in records if t.get('pnl', 0) > 0]
+    losing = [t['pnl'] for t in records if t.get('pnl', 0) < 0]
+    total_pnl = sum(t.get('pnl', 0) for t in records)
+    win_rate = (len(winning) / total_trades * 100) if total_trades > 0 else 0
+
+    summary = [
+        "",
+        "=" * 80,
+        "SUMMARY",
+        "=" * 80,
+        f"Total Trades: {total_trades}",
+        f"Winning Trades: {len(winning)}",
+        f"Losing Trades: {len(losing)}",
+        f"Win Rate: {win_rate:.2f}%",
+        f"Total P&L: {total_pnl:.2f}",
+    ]
+    if winning:
+        summary.append(f"Average Win: {sum(winning) / len(winning):.2f}")
+    if losing:
+        summary.append(f"Average Loss: {sum(losing) / len(losing):.2f}")
+    summary.append("=" * 80)
+    parts.append("\n".join(summary) + "\n")
+    return "".join(parts)
+
+
+def find_trade_journals(directory, recursive=False):
+    """One journal file per run in a directory.
+
+    Journals are matched as ``<ASSET>_trades_<run>.<fmt>``; when the same
+    run was written in several formats only one copy is kept (Parquet,
+    then CSV, then JSONL).
+
+    Args:
+        directory: Directory to scan
+        recursive: Also scan subdirectories (e.g. temp_reports/<run id>/)
+
+    Returns:
+        dict: Run key (path without suffix, relative to ``directory``) -> path
+    """
+    directory = Path(directory)
+    runs = {}
+    if directory.exists():
+        pattern = '**/*_trades_*' if recursive else '*_trades_*'
+        # Later formats overwrite earlier ones for the same run
+        for fmt in ('jsonl', 'csv', 'parquet'):
+            for path in directory.glob(f'{pattern}.{fmt}'):
+                runs[path.relative_to(directory).with_suffix('').as_posix()] = path
+    return dict(sorted(runs.items()))
+
+
+def read_trade_journal(path):
+    """Load one journal file into a typed DataFrame (JOURNAL_SCHEMA columns)."""
+    import pandas as pd
+
+    path = Path(path)
+    if path.suffix == '.parquet':
+        frame = pd.read_parquet(path)
+    elif path.suffix == '.csv':
+        frame = pd.read_csv(path)
+    else:
+        frame = pd.read_json(path, orient='records', lines=True, convert_dates=False)
+    if 'asset' not in frame or frame['asset'].isna().all():
+        frame['asset'] = path.stem.split('_trades_')[0]
+    return apply_journal_schema(frame)
+
+
+def load_trade_journals(directory, recursive=False):
+    """Load every trade journal in a directory into one typed DataFrame.
+
+    See find_trade_journals() for the file matching.
+
+    Returns:
+        pandas.DataFrame: JOURNAL_SCHEMA columns (empty if nothing found)
+    """
+    import pandas as pd
+
+    frames = [read_trade_journal(path) for path in find_trade_journals(directory, recursive).values()]
+    if not frames:
+        return journal_frame([])
+    return apply_journal_schema(pd.concat(frames, ignore_index=True))
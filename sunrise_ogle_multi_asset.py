@@ -2,13 +2,15 @@
 ==========================================================
 Hexa Cerebro Implementation using SunriseOgle strategies
 
-This system runs six separate cerebro instances with the following assets:
-1. EURUSD using sunrise_ogle_eurusd.py strategy  
-2. USDCHF using sunrise_ogle_usdchf.py strategy
-3. XAUUSD using sunrise_ogle_xauusd.py strategy
-4. XAGUSD using sunrise_ogle_xagusd.py strategy
-5. GBPUSD using sunrise_ogle_gbpusd.py strategy
-6. AUDUSD using sunrise_ogle_audusd.py strategy
+This system runs six separate cerebro instances with the following assets,
+each using the shared SunriseOgle engine (strategies/sunrise_ogle_engine.py)
+with its profile from strategies/sunrise_ogle_profiles.json:
+1. EURUSD
+2. USDCHF
+3. XAUUSD
+4. XAGUSD
+5. GBPUSD
+6. AUDUSD
 
 Each asset runs independently with its own optimized parameters,
 with equal 16.67% portfolio allocation per asset, then results are 
@@ -33,12 +35,12 @@ import backtrader as bt
 from pathlib import Path
 import sys
 import math
+import argparse
+import gc
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime as dt, timedelta
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 import numpy as np
-import pandas as pd
-from collections import defaultdict
 import calendar
 
 # Import individual strategies
@@ -46,13 +48,17 @@ BASE_DIR = Path(__file__).resolve().parent
 STRATEGIES_DIR = BASE_DIR / 'strategies'
 sys.path.append(str(STRATEGIES_DIR))
 
-# Import individual strategy classes from strategies folder
-from sunrise_ogle_eurusd import SunriseOgle as SunriseOgleEURUSD
-from sunrise_ogle_usdchf import SunriseOgle as SunriseOgleUSDCHF
-from sunrise_ogle_xauusd import SunriseOgle as SunriseOgleXAUUSD
-from sunrise_ogle_xagusd import SunriseOgle as SunriseOgleXAGUSD
-from sunrise_ogle_gbpusd import SunriseOgle as SunriseOgleGBPUSD
-from sunrise_ogle_audusd import SunriseOgle as SunriseOgleAUDUSD
+# Shared strategy engine; per-asset parameters come from sunrise_ogle_profiles.json
+from sunrise_ogle_engine import profile_strategy
+
+from data_cache import load_ohlcv_cache, IndexedCSVData, NumpyOHLCVData
+from indicator_cache import clear_indicator_cache
+from checkpoint import history_fingerprint, load_checkpoint, save_checkpoint
+from monte_carlo import monte_carlo_report
+from trade_journal import journal_frame, load_trade_journals
+from monthly_stats import cube_matrix, monthly_cube, yearly_summary
+from portfolio_metrics import (BARS_PER_YEAR_5M, align_equity_curves, equity_metrics,
+                               periods_per_year_from_index)
 
 # =============================================================
 # CONFIGURATION PARAMETERS
@@ -63,6 +69,17 @@ FROMDATE = '2020-07-10'
 TODATE = '2025-07-25'                 
 STARTING_CASH = 100000  # Adjusted for 6 assets at 16.67% each to achieve $100K total
 ENABLE_PLOT = True                    
+HEADLESS = False  # Batch mode (cron/CI): no charts or heatmaps, matplotlib is never imported
+USE_DATA_CACHE = True  # Serve CSV feeds from a binary .npy cache (rebuilt when a CSV changes)
+USE_PRECOMPUTED_INDICATORS = False  # Compute EMA/ATR once over the whole array (identical values)
+SPARSE_EVALUATION = False  # Skip idle scanning bars without a candidate EMA crossover (identical trades)
+PHASE_TIMING = False  # Time the strategy's next() phases; JSON per asset in the run's report directory
+ARCHIVE_TRADE_REPORTS = True  # Write trade journals to temp_reports/<run id>/ (statistics use the in-memory trades)
+CHECKPOINT_DIR = None  # Save end-of-run checkpoints here and extend them when TODATE moves forward
+MONTE_CARLO_PATHS = 0  # Resampled trade sequences for drawdown/ruin confidence intervals (0 = off)
+MONTE_CARLO_METHOD = 'bootstrap'  # 'bootstrap' (with replacement) or 'shuffle' (reorder actual trades)
+MONTE_CARLO_SEED = 42
+PORTFOLIO_EQUITY_FREQ = None  # Resample the combined equity curve (e.g. '1h'); None = every bar timestamp
 
 # === ASSET ALLOCATION ===
 # Optimized for Ray Dalio's 4 Economic Environments
@@ -77,70 +94,91 @@ COMMODITY_ALLOCATION = 0.15         # Moderate allocation for commodity-sensitiv
 
 # === TEMP REPORTS DIRECTORY ===
 TEMP_REPORTS_DIR = BASE_DIR / 'temp_reports'
+DATA_DIR = BASE_DIR / 'data'
 
 # === ASSET CONFIGURATION ===
 ASSETS = {
     'EURUSD': {
-        'data_file': 'EURUSD_5m_5Yea.csv',  # Fixed to match sunrise_ogle_long_only.py
-        'strategy_class': SunriseOgleEURUSD,  # Using sunrise_ogle_long_only.py (newest, cleanest LONG-only)
+        'data_file': 'EURUSD_5m_5Yea.csv',
+        'strategy_class': profile_strategy('EURUSD'),  # LONG-only profile
         'forex_instrument': 'EURUSD',
         'allocation': STANDARD_ALLOCATION  # 16% - Balanced developed market exposure
     },
     'USDCHF': {
         'data_file': 'USDCHF_5m_5Yea.csv', 
-        'strategy_class': SunriseOgleUSDCHF,  # Using sunrise_ogle_usdchf.py
+        'strategy_class': profile_strategy('USDCHF'),
         'forex_instrument': 'USDCHF',
         'allocation': DEFLATION_HEDGE_ALLOCATION  # 20% - Enhanced deflation protection (CHF safe haven)
     },
     'XAUUSD': {
         'data_file': 'XAUUSD_5m_5Yea.csv',  # Gold data file
-        'strategy_class': SunriseOgleXAUUSD,  # Using sunrise_ogle_xauusd.py
+        'strategy_class': profile_strategy('XAUUSD'),
         'forex_instrument': 'XAUUSD',
         'allocation': INFLATION_HEDGE_ALLOCATION  # 18% - Strong inflation hedge
     },
     'XAGUSD': {
         'data_file': 'XAGUSD_5m_5Yea.csv',  # Silver data file
-        'strategy_class': SunriseOgleXAGUSD,  # Using sunrise_ogle_xagusd.py
+        'strategy_class': profile_strategy('XAGUSD'),
         'forex_instrument': 'XAGUSD',
         'allocation': COMMODITY_ALLOCATION  # 15% - Moderate commodity exposure
     },
     'GBPUSD': {
         'data_file': 'GBPUSD_5m_5Yea.csv',  # British Pound data file
-        'strategy_class': SunriseOgleGBPUSD,  # Using sunrise_ogle_gbpusd.py
+        'strategy_class': profile_strategy('GBPUSD'),
         'forex_instrument': 'GBPUSD',
         'allocation': STANDARD_ALLOCATION  # 16% - Balanced developed market exposure
     },
     'AUDUSD': {
         'data_file': 'AUDUSD_5m_5Yea.csv',  # Australian Dollar data file
-        'strategy_class': SunriseOgleAUDUSD,  # Using sunrise_ogle_audusd.py
+        'strategy_class': profile_strategy('AUDUSD'),
         'forex_instrument': 'AUDUSD',
         'allocation': COMMODITY_ALLOCATION  # 15% - Moderate commodity currency exposure
     }
 }
 
-def create_data_feed(data_file, fromdate=None, todate=None):
-    """Create Backtrader data feed from CSV file"""
-    data_path = BASE_DIR / 'data' / data_file
+def create_data_feed(data_file, fromdate=None, todate=None, use_cache=None, data_dir=None):
+    """Create Backtrader data feed from CSV file
+    
+    With the data cache enabled the CSV is converted once into a
+    memory-mapped .npy file and later runs skip CSV parsing entirely.
+    Without it, a fromdate/todate window is read through the CSV's offset
+    index, so short ranges only parse the rows they need.
+    ``data_dir`` overrides the directory holding the CSVs (default: DATA_DIR).
+    """
+    data_path = Path(data_dir or DATA_DIR) / data_file
     
     if not data_path.exists():
         raise FileNotFoundError(f"Data file not found: {data_path}")
     
-    feed_kwargs = {
-        'dataname': str(data_path),
-        'dtformat': '%Y%m%d',
-        'tmformat': '%H:%M:%S',
-        'datetime': 0,
-        'time': 1,
-        'open': 2,
-        'high': 3,
-        'low': 4,
-        'close': 5,
-        'volume': 6,
-        'timeframe': bt.TimeFrame.Minutes,
-        'compression': 5
-    }
+    if use_cache is None:
+        use_cache = USE_DATA_CACHE
+    
+    if use_cache:
+        feed_kwargs = {
+            'dataname': load_ohlcv_cache(data_path),
+            'filename': str(data_path),
+            'timeframe': bt.TimeFrame.Minutes,
+            'compression': 5
+        }
+    else:
+        feed_kwargs = {
+            'dataname': str(data_path),
+            'dtformat': '%Y%m%d',
+            'tmformat': '%H:%M:%S',
+            'datetime': 0,
+            'time': 1,
+            'open': 2,
+            'high': 3,
+            'low': 4,
+            'close': 5,
+            'volume': 6,
+            'timeframe': bt.TimeFrame.Minutes,
+            'compression': 5
+        }
     
     def parse_date(s):
+        if isinstance(s, dt):
+            return s
         try:
             return dt.strptime(s, '%Y-%m-%d')
         except:
@@ -154,44 +192,61 @@ def create_data_feed(data_file, fromdate=None, todate=None):
     if td:
         feed_kwargs['todate'] = td
         
-    return bt.feeds.GenericCSVData(**feed_kwargs)
+    if use_cache:
+        return NumpyOHLCVData(**feed_kwargs)
+    return IndexedCSVData(**feed_kwargs)
 
-def run_single_asset_backtest(asset_name, asset_config, fromdate, todate, starting_cash):
-    """Run backtest for a single asset using its individual strategy"""
+def run_single_asset_backtest(asset_name, asset_config, fromdate, todate, starting_cash, checkpoint_dir=None,
+                              phase_timing=None, data_dir=None, report_dir=None, run_id=None):
+    """Run backtest for a single asset using its individual strategy
+    
+    With ``checkpoint_dir`` the end-of-run state is saved there, and a later
+    run over the same history with a later ``todate`` resumes from it and
+    only processes the new bars (see _resume_checkpoint). ``phase_timing``
+    (None = PHASE_TIMING) exports the strategy's per-phase timings.
+    ``data_dir`` overrides the directory holding the CSVs (default: DATA_DIR).
+    ``report_dir``/``run_id`` place the strategy's reports in a run directory
+    (default: temp_reports/ in the working directory, timestamped names).
+    """
     print(f"\n[RUNNING] {asset_name} backtest...")
     
     # Create cerebro instance
     cerebro = bt.Cerebro(stdstats=False)
     
-    # Add data feed
+    # Set cash allocation for this asset
+    asset_cash = starting_cash * asset_config['allocation']
+    strategy_kwargs = _strategy_kwargs(asset_config, phase_timing, report_dir, run_id)
+    
+    data_path = Path(data_dir or DATA_DIR) / asset_config['data_file']
+    checkpoint_file = checkpoint_key = checkpoint = None
+    if checkpoint_dir:
+        checkpoint_file = Path(checkpoint_dir) / f"{asset_name}.ckpt"
+        checkpoint_key = _checkpoint_key(asset_name, asset_config, fromdate, asset_cash, strategy_kwargs)
+        checkpoint = _resume_checkpoint(checkpoint_file, checkpoint_key, data_path, fromdate, todate)
+        strategy_kwargs['checkpoint'] = True
+    
+    # Add data feed (from the checkpoint bar when resuming)
+    feed_fromdate = fromdate
+    if checkpoint is not None:
+        strategy_kwargs['resume_from'] = checkpoint['state']
+        feed_fromdate = bt.num2date(checkpoint['datenum']) - timedelta(minutes=1)
+        print(f"  Resuming from checkpoint at {bt.num2date(checkpoint['datenum']):%Y-%m-%d %H:%M}")
     data = create_data_feed(
         asset_config['data_file'], 
-        fromdate=fromdate, 
-        todate=todate
+        fromdate=feed_fromdate, 
+        todate=todate,
+        data_dir=data_dir
     )
     cerebro.adddata(data)
     
-    # Set cash allocation for this asset
-    asset_cash = starting_cash * asset_config['allocation']
     cerebro.broker.setcash(asset_cash)
     cerebro.broker.setcommission(leverage=30.0)
     
     # Add strategy with asset-specific configuration
-    strategy_kwargs = {
-        'plot_result': False,  # Disable individual plots for clean console output
-        'use_forex_position_calc': True,
-        'forex_instrument': asset_config['forex_instrument'],
-        'verbose_debug': False,  # Disable verbose debug output
-        'print_signals': False,  # Disable individual trade signal printing
-    }
-    
     cerebro.addstrategy(asset_config['strategy_class'], **strategy_kwargs)
     
     # Add analyzers for detailed performance metrics
-    cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
-    cerebro.addanalyzer(bt.analyzers.DrawDown, _name='drawdown')
-    cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name='sharpe')
-    cerebro.addanalyzer(bt.analyzers.Returns, _name='returns')
+    _add_analyzers(cerebro)
     
     # Run backtest
     initial_value = cerebro.broker.getvalue()
@@ -200,7 +255,85 @@ def run_single_asset_backtest(asset_name, asset_config, fromdate, todate, starti
     results = cerebro.run()
     strategy_result = results[0]
     
+    state = getattr(strategy_result, 'checkpoint_state', None)
+    if checkpoint_file is not None and state is not None:
+        save_checkpoint(checkpoint_file, {
+            'key': checkpoint_key,
+            'datenum': state['datenum'],
+            'fingerprint': _history_fingerprint(data_path, fromdate, state['datenum']),
+            'state': state,
+        })
+    
     final_value = cerebro.broker.getvalue()
+    return _collect_backtest_result(asset_name, cerebro, strategy_result, initial_value, final_value, data)
+
+def _checkpoint_key(asset_name, asset_config, fromdate, asset_cash, strategy_kwargs):
+    """Everything besides the bars that a checkpoint's state depends on"""
+    params = dict(asset_config['strategy_class'].params._getitems())
+    params.update(strategy_kwargs)
+    for name in ('phase_timing', 'report_dir', 'run_id', 'write_trade_reports'):
+        params.pop(name)  # Instrumentation and report output only
+    return {
+        'asset': asset_name,
+        'data_file': asset_config['data_file'],
+        'fromdate': fromdate,
+        'cash': asset_cash,
+        'params': repr(sorted(params.items())),
+    }
+
+def _history_fingerprint(data_path, fromdate, datenum):
+    """Fingerprint of the bars from ``fromdate`` up to and including ``datenum``"""
+    records = load_ohlcv_cache(data_path)
+    datenums = records['datenum']
+    start = np.searchsorted(datenums, bt.date2num(dt.strptime(fromdate, '%Y-%m-%d'))) if fromdate else 0
+    end = np.searchsorted(datenums, datenum, side='right')
+    return history_fingerprint(records[start:end])
+
+def _resume_checkpoint(checkpoint_file, checkpoint_key, data_path, fromdate, todate):
+    """Return the saved checkpoint if this run can resume from it, else None
+    
+    A checkpoint is used only when the run configuration is unchanged, its
+    bar lies before ``todate`` and the bars up to it are still the same
+    (an edited or replaced data file forces a full run).
+    """
+    checkpoint = load_checkpoint(checkpoint_file)
+    if checkpoint is None or checkpoint['key'] != checkpoint_key:
+        return None
+    if todate and checkpoint['datenum'] >= bt.date2num(dt.strptime(todate, '%Y-%m-%d')):
+        return None
+    if checkpoint['fingerprint'] != _history_fingerprint(data_path, fromdate, checkpoint['datenum']):
+        return None
+    return checkpoint
+
+def _strategy_kwargs(asset_config, phase_timing=None, report_dir=None, run_id=None):
+    """Strategy parameters shared by the per-asset and portfolio modes"""
+    return {
+        'plot_result': False,  # Disable individual plots for clean console output
+        'use_forex_position_calc': True,
+        'forex_instrument': asset_config['forex_instrument'],
+        'verbose_debug': False,  # Disable verbose debug output
+        'print_signals': False,  # Disable individual trade signal printing
+        'use_precomputed_indicators': USE_PRECOMPUTED_INDICATORS,
+        'sparse_evaluation': SPARSE_EVALUATION,
+        'phase_timing': PHASE_TIMING if phase_timing is None else phase_timing,
+        'report_dir': str(report_dir) if report_dir else None,
+        'run_id': run_id,
+        'write_trade_reports': ARCHIVE_TRADE_REPORTS,
+    }
+
+def new_run_id():
+    """Unique run identifier: start time plus a random suffix (runs started in the same second never collide)"""
+    return f"{dt.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:6]}"
+
+def _add_analyzers(cerebro):
+    """Analyzers for detailed performance metrics (added to every strategy)"""
+    cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
+    cerebro.addanalyzer(bt.analyzers.DrawDown, _name='drawdown')
+    cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name='sharpe')
+    cerebro.addanalyzer(bt.analyzers.Returns, _name='returns')
+
+def _collect_backtest_result(asset_name, cerebro, strategy_result, initial_value, final_value, data):
+    """Build the per-asset result dict from a finished strategy"""
     total_return = final_value - initial_value
     return_pct = (total_return / initial_value) * 100
     
@@ -212,22 +345,14 @@ def run_single_asset_backtest(asset_name, asset_config, fromdate, todate, starti
     drawdown_analyzer = strategy_result.analyzers.drawdown.get_analysis()
     sharpe_analyzer = strategy_result.analyzers.sharpe.get_analysis()
     
-    # Calculate custom Sharpe ratio using the same method as individual strategy
-    custom_sharpe = 0.0
-    if hasattr(strategy_result, '_portfolio_values') and len(strategy_result._portfolio_values) > 10:
-        import numpy as np
-        returns = []
-        for i in range(1, len(strategy_result._portfolio_values)):
-            ret = (strategy_result._portfolio_values[i] - strategy_result._portfolio_values[i-1]) / strategy_result._portfolio_values[i-1]
-            returns.append(ret)
-        
-        if len(returns) > 0:
-            returns_array = np.array(returns)
-            mean_return = np.mean(returns_array)
-            std_return = np.std(returns_array)
-            # Annualized Sharpe (assuming 5-minute data, 252 trading days)
-            periods_per_year = 252 * 24 * 12  # 5-minute periods per year
-            custom_sharpe = (mean_return * periods_per_year) / (std_return * np.sqrt(periods_per_year)) if std_return > 0 else 0.0
+    # Risk metrics from the strategy's equity curve (computed once in stop())
+    risk_metrics = getattr(strategy_result, 'risk_metrics', None)
+    if risk_metrics is None:
+        equity = getattr(strategy_result, '_equity', None)
+        if equity is not None:
+            risk_metrics = equity_metrics(equity.values, equity.periods_per_year(BARS_PER_YEAR_5M))
+        else:
+            risk_metrics = equity_metrics([])
     
     # Calculate Profit Factor (Gross Profit / Gross Loss)
     profit_factor = 0.0
@@ -253,14 +378,216 @@ def run_single_asset_backtest(asset_name, asset_config, fromdate, todate, starti
         'return_pct': return_pct,
         'trade_analysis': trade_analyzer,
         'drawdown_analysis': drawdown_analyzer,
-        'sharpe_ratio': custom_sharpe,  # Use custom calculation like individual strategy
+        'sharpe_ratio': risk_metrics['sharpe_ratio'],  # Same calculation as the individual strategy
+        'risk_metrics': dict(risk_metrics),
         'backtrader_sharpe': sharpe_analyzer.get('sharperatio', 0),  # Keep for reference
         'profit_factor': profit_factor,
         'data': data
     }
 
-def aggregate_portfolio_results(results_list):
-    """Aggregate results from multiple asset backtests"""
+def run_portfolio_backtest(asset_names, fromdate, todate, starting_cash, phase_timing=None, report_dir=None,
+                           run_id=None):
+    """Run all assets in ONE Cerebro sharing a single broker
+    
+    Every feed is added under its asset name and one strategy instance per
+    asset is bound to it with the ``dataname`` param. Cash and margin are
+    shared and position sizing compounds on the whole portfolio value
+    (each asset sizes against its allocation share of it).
+    
+    Args:
+        asset_names: Assets (keys of ASSETS) to backtest
+        fromdate: Start date string (YYYY-MM-DD)
+        todate: End date string (YYYY-MM-DD)
+        starting_cash: Total portfolio cash
+        phase_timing: Export per-phase strategy timings (None = PHASE_TIMING)
+        report_dir: Run directory for the strategies' reports (see run_single_asset_backtest)
+        run_id: Run identifier used in the report file names
+        
+    Returns:
+        list: Per-asset results in ASSETS order, same shape as
+        run_single_asset_backtest() (values are each asset's allocated
+        cash plus its own P&L)
+    """
+    print(f"\n[RUNNING] Portfolio backtest ({len(asset_names)} feeds, shared broker)...")
+    
+    cerebro = bt.Cerebro(stdstats=False)
+    feeds = {}
+    for asset_name in asset_names:
+        feeds[asset_name] = create_data_feed(ASSETS[asset_name]['data_file'], fromdate=fromdate, todate=todate)
+        cerebro.adddata(feeds[asset_name], name=asset_name)
+    
+    cerebro.broker.setcash(starting_cash)
+    cerebro.broker.setcommission(leverage=30.0)
+    
+    for asset_name in asset_names:
+        asset_config = ASSETS[asset_name]
+        cerebro.addstrategy(
+            asset_config['strategy_class'],
+            dataname=asset_name,
+            equity_allocation=asset_config['allocation'],
+            **_strategy_kwargs(asset_config, phase_timing, report_dir, run_id)
+        )
+    _add_analyzers(cerebro)
+    
+    print(f"  Initial Value: ${cerebro.broker.getvalue():,.2f}")
+    strategies = cerebro.run()
+    print(f"  Final Portfolio Value: ${cerebro.broker.getvalue():,.2f}")
+    
+    results = []
+    for asset_name, strategy_result in zip(asset_names, strategies):
+        print(f"\n[RESULT] {asset_name}")
+        initial_value = starting_cash * ASSETS[asset_name]['allocation']
+        results.append(_collect_backtest_result(
+            asset_name, cerebro, strategy_result,
+            initial_value, strategy_result.strategy_value(), feeds[asset_name]
+        ))
+    return results
+
+def _to_plain_dict(analysis):
+    """Recursively convert Backtrader AutoOrderedDict analysis into plain dicts"""
+    if isinstance(analysis, dict):
+        return {key: _to_plain_dict(value) for key, value in analysis.items()}
+    return analysis
+
+def summarize_backtest_result(result):
+    """Reduce a live backtest result to a picklable summary
+    
+    Keeps everything aggregation, monthly statistics and charting need
+    (equity curve, trade list, analyzer dicts, headline metrics) and drops
+    the live cerebro, strategy and data objects. Once nothing else refers
+    to the live result, release_backtest_engine() frees its memory.
+    """
+    strategy = result['strategy']
+    
+    equity = getattr(strategy, '_equity', None)
+    
+    return {
+        'asset': result['asset'],
+        'initial_value': result['initial_value'],
+        'final_value': result['final_value'],
+        'total_return': result['total_return'],
+        'return_pct': result['return_pct'],
+        'trade_analysis': _to_plain_dict(result['trade_analysis']),
+        'drawdown_analysis': _to_plain_dict(result['drawdown_analysis']),
+        'sharpe_ratio': result['sharpe_ratio'],
+        'risk_metrics': result['risk_metrics'],
+        'backtrader_sharpe': result['backtrader_sharpe'],
+        'profit_factor': result['profit_factor'],
+        'equity_timestamps': equity.timestamps if equity is not None else np.array([], dtype='datetime64[us]'),
+        'equity_values': equity.values.copy() if equity is not None else np.array([], dtype=np.float64),
+        'trades': list(getattr(strategy, 'trade_reports', [])),
+        'bars': len(result['data']),
+    }
+
+def release_backtest_engine():
+    """Free the memory of finished backtests whose results were summarized
+    
+    Backtrader's lines, indicators and observers reference each other in
+    cycles, so a dropped Cerebro is only reclaimed by the cyclic garbage
+    collector. Cached indicator series are keyed by feed content and are
+    not reused by the next asset either.
+    """
+    clear_indicator_cache()
+    gc.collect()
+
+def get_equity_curve(result):
+    """(timestamps, values) of an asset's equity curve, or None if not tracked
+
+    Works with both live results and worker summaries.
+    """
+    if 'equity_values' in result:
+        return result['equity_timestamps'], result['equity_values']
+    equity = getattr(result.get('strategy'), '_equity', None)
+    if equity is None:
+        return None
+    return equity.timestamps, equity.values
+
+def build_portfolio_equity(results_list, freq=None):
+    """Combined portfolio equity, time-aligned across assets
+
+    Per-asset curves are outer-joined on timestamp and forward-filled
+    (feeds trade different sessions), then summed.
+
+    Args:
+        results_list: Backtest results or summaries
+        freq: Optional resampling frequency (pandas alias, e.g. '1h')
+
+    Returns:
+        pandas.DataFrame: One column per asset plus 'TOTAL', indexed by timestamp
+    """
+    curves = {}
+    for result in results_list:
+        curve = get_equity_curve(result)
+        if curve is not None:
+            curves[result['asset']] = curve
+
+    frame = align_equity_curves(curves, freq=freq)
+    frame['TOTAL'] = frame.sum(axis=1)
+    return frame
+
+def _run_asset_worker(asset_name, fromdate, todate, starting_cash, checkpoint_dir=None, phase_timing=None,
+                      report_dir=None, run_id=None):
+    """Process-pool entry point: run one asset and return its picklable summary"""
+    result = run_single_asset_backtest(
+        asset_name,
+        ASSETS[asset_name],
+        fromdate,
+        todate,
+        starting_cash,
+        checkpoint_dir,
+        phase_timing,
+        report_dir=report_dir,
+        run_id=run_id
+    )
+    return summarize_backtest_result(result)
+
+def run_parallel_backtests(asset_names, fromdate, todate, starting_cash, workers, checkpoint_dir=None,
+                           phase_timing=None, report_dir=None, run_id=None):
+    """Run each asset's Cerebro in a separate process
+    
+    Args:
+        asset_names: Assets (keys of ASSETS) to backtest
+        fromdate: Start date string (YYYY-MM-DD)
+        todate: End date string (YYYY-MM-DD)
+        starting_cash: Total portfolio cash (split by asset allocation)
+        workers: Maximum number of worker processes
+        checkpoint_dir: Optional checkpoint directory (see run_single_asset_backtest)
+        phase_timing: Export per-phase strategy timings (None = PHASE_TIMING)
+        report_dir: Run directory for the strategies' reports (see run_single_asset_backtest)
+        run_id: Run identifier used in the report file names
+        
+    Returns:
+        list: Result summaries in ASSETS order (failed assets are skipped)
+    """
+    summaries = {}
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_run_asset_worker, asset_name, fromdate, todate, starting_cash,
+                            checkpoint_dir, phase_timing, report_dir, run_id): asset_name
+            for asset_name in asset_names
+        }
+        for future in as_completed(futures):
+            asset_name = futures[future]
+            try:
+                summaries[asset_name] = future.result()
+                print(f"[DONE] {asset_name} backtest finished in worker process")
+            except Exception as e:
+                print(f"[ERROR] Error running {asset_name} backtest: {e}")
+    
+    # Keep deterministic ASSETS ordering regardless of completion order
+    return [summaries[asset_name] for asset_name in asset_names if asset_name in summaries]
+
+def aggregate_portfolio_results(results_list, portfolio_equity=None):
+    """Aggregate results from multiple asset backtests
+    
+    Args:
+        results_list: Backtest results or summaries
+        portfolio_equity: Output of build_portfolio_equity() (built if None)
+    """
+    if portfolio_equity is None:
+        portfolio_equity = build_portfolio_equity(results_list, freq=PORTFOLIO_EQUITY_FREQ)
+    
     print(f"\n" + "="*80)
     print(f"HEXA CEREBRO PORTFOLIO AGGREGATION")
     print(f"="*80)
@@ -328,30 +655,23 @@ def aggregate_portfolio_results(results_list):
     print(f"\nRISK METRICS:")
     for result in results_list:
         asset = result['asset']
-        dd_analysis = result['drawdown_analysis']
-        sharpe = result['sharpe_ratio']
+        metrics = result['risk_metrics']
         profit_factor = result.get('profit_factor', 0)
-        
-        # Fix drawdown calculation - Backtrader returns percentage values directly
-        max_dd_raw = dd_analysis.get('max', {}).get('drawdown', 0) if dd_analysis else 0
-        
-        # Backtrader DrawDown analyzer returns percentage values directly (0-100 scale)
-        # But they seem to be returned as fractions, so we need to check the range
-        if abs(max_dd_raw) <= 1.0:
-            # Value is a decimal fraction (0.05 = 5%), convert to percentage
-            max_dd_pct = abs(max_dd_raw) * 100
-        else:
-            # Value is already a percentage, just take absolute value
-            max_dd_pct = abs(max_dd_raw)
-        
-        # Cap at reasonable maximum for safety
-        max_dd_pct = min(max_dd_pct, 99.9)
-        
+
+        # Drawdown in percent of the running peak, from the equity curve
         pf_str = f"{profit_factor:.2f}" if profit_factor != float('inf') else "∞"
-        print(f"  {asset:<8}: Max DD: {max_dd_pct:>5.2f}% | Sharpe: {sharpe:>6.3f} | PF: {pf_str}")
-    
-    # Add portfolio-level PF summary
-    print(f"  {'PORTFOLIO':<8}: Portfolio PF: {portfolio_pf_str}")
+        print(f"  {asset:<8}: Max DD: {metrics['max_drawdown_pct']:>5.2f}% | Sharpe: {metrics['sharpe_ratio']:>6.3f} | "
+              f"Sortino: {metrics['sortino_ratio']:>6.3f} | Calmar: {metrics['calmar_ratio']:>5.2f} | "
+              f"Recovery: {metrics['recovery_factor']:>5.2f} | PF: {pf_str}")
+    
+    # Portfolio-level metrics from the time-aligned combined equity curve
+    portfolio_metrics = equity_metrics(
+        portfolio_equity['TOTAL'].to_numpy(),
+        periods_per_year_from_index(portfolio_equity.index.to_numpy()),
+    )
+    print(f"  {'PORTFOLIO':<8}: Max DD: {portfolio_metrics['max_drawdown_pct']:>5.2f}% | Sharpe: {portfolio_metrics['sharpe_ratio']:>6.3f} | "
+          f"Sortino: {portfolio_metrics['sortino_ratio']:>6.3f} | Calmar: {portfolio_metrics['calmar_ratio']:>5.2f} | "
+          f"Recovery: {portfolio_metrics['recovery_factor']:>5.2f} | PF: {portfolio_pf_str}")
     
     print(f"="*80)
     print(f"\n📊 FOR DETAILED ANALYSIS INCLUDING:")
@@ -359,7 +679,6 @@ def aggregate_portfolio_results(results_list):
     print(f"   • Ernest P. Chan quantitative metrics")
     print(f"   • Ray Dalio All-Weather portfolio analysis")
     print(f"   • Correlation matrices and diversification benefits")
-    print(f"   • Advanced risk metrics (Sortino, Calmar, Recovery Factor)")
     print(f"   • Complete trade statistics and optimization roadmap")
     print(f"\n   👉 See: MULTI_ASSET_PERFORMANCE_ANALYSIS.md")
     print(f"="*80)
@@ -371,13 +690,66 @@ def aggregate_portfolio_results(results_list):
         'total_return_pct': total_return_pct,
         'total_trades': total_trades,
         'portfolio_win_rate': portfolio_win_rate,
-        'portfolio_pf': portfolio_pf
+        'portfolio_pf': portfolio_pf,
+        'portfolio_metrics': portfolio_metrics
     }
 
-def create_portfolio_chart(results_list):
-    """Create two separate interactive portfolio performance charts with mouse hover functionality"""
+def _trade_records(result):
+    """Trade records of a live result or summary"""
+    return result['trades'] if 'trades' in result else getattr(result['strategy'], 'trade_reports', [])
+
+def _closed_trade_pnls(result):
+    """Closed-trade P&L values of an asset, in exit order"""
+    trades = _trade_records(result)
+    closed = [t for t in trades if t.get('pnl') is not None and t.get('exit_time') is not None]
+    return [t['pnl'] for t in sorted(closed, key=lambda t: t['exit_time'])], closed
+
+def print_monte_carlo_report(results_list, paths=None, method=None, seed=None):
+    """Print Monte Carlo confidence intervals for each asset and the portfolio
+    
+    Each asset's closed trades are resampled into ``paths`` sequences
+    (monte_carlo.py); the portfolio row pools every asset's trades against
+    the total starting cash.
+    
+    Returns:
+        dict: asset (and 'PORTFOLIO') -> monte_carlo_report() dict
+    """
+    paths = MONTE_CARLO_PATHS if paths is None else paths
+    method = method or MONTE_CARLO_METHOD
+    seed = MONTE_CARLO_SEED if seed is None else seed
+    
+    runs = []
+    all_closed = []
+    for result in results_list:
+        pnls, closed = _closed_trade_pnls(result)
+        runs.append((result['asset'], pnls, result['initial_value']))
+        all_closed.extend(closed)
+    all_closed.sort(key=lambda t: t['exit_time'])
+    runs.append(('PORTFOLIO', [t['pnl'] for t in all_closed], sum(r['initial_value'] for r in results_list)))
+    
+    print(f"\nMONTE CARLO ({paths:,} {method} paths, seed {seed}):")
+    print(f"  {'Asset':<9} {'Trades':>6} | {'Return % p5/p50/p95':>24} | {'Max DD % p50/p95':>17} | {'P(loss)':>7} | {'Ruin':>6}")
+    reports = {}
+    for asset, pnls, cash in runs:
+        report = monte_carlo_report(pnls, cash, paths=paths, method=method, seed=seed)
+        reports[asset] = report
+        ret, dd = report['return_pct'], report['max_drawdown_pct']
+        print(f"  {asset:<9} {report['trades']:>6} | {ret['p5']:>+7.2f} {ret['p50']:>+7.2f} {ret['p95']:>+8.2f} | "
+              f"{dd['p50']:>7.2f} {dd['p95']:>9.2f} | {report['probability_of_loss']:>6.1%} | {report['risk_of_ruin']:>5.1%}")
+    return reports
+
+def create_portfolio_chart(results_list, portfolio_equity=None):
+    """Create two separate interactive portfolio performance charts with mouse hover functionality
+    
+    Args:
+        results_list: Backtest results or summaries
+        portfolio_equity: Output of build_portfolio_equity() (built if None)
+    """
     if not ENABLE_PLOT:
         return
+    
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
         
     print(f"\nCreating interactive portfolio performance charts...")
     
@@ -387,24 +759,16 @@ def create_portfolio_chart(results_list):
         
         for result in results_list:
             asset = result['asset']
-            strategy = result['strategy']
             
-            # Get portfolio values and timestamps from strategy
-            if hasattr(strategy, '_portfolio_values') and hasattr(strategy, '_timestamps'):
-                timestamps = strategy._timestamps
-                portfolio_values = strategy._portfolio_values
+            # Get portfolio values and timestamps from the summary (worker
+            # processes) or directly from the live strategy
+            curve = get_equity_curve(result)
+            if curve is not None:
+                timestamps, portfolio_values = curve
                 
                 if len(timestamps) > 0 and len(portfolio_values) > 0:
-                    # Convert timestamps to datetime objects if needed
-                    dates = []
-                    for ts in timestamps:
-                        if isinstance(ts, dt):
-                            dates.append(ts)
-                        elif hasattr(ts, 'datetime'):
-                            dates.append(ts.datetime())
-                        else:
-                            # Assume it's a numeric timestamp that needs conversion
-                            dates.append(bt.num2date(ts))
+                    # datetime64 arrays plot directly, no per-point conversion
+                    dates = np.asarray(timestamps, dtype='datetime64[us]')
                     
                     portfolio_data[asset] = {
                         'timestamps': dates,
@@ -421,17 +785,14 @@ def create_portfolio_chart(results_list):
             print("  No portfolio data available for charting")
             return
         
-        # Calculate combined portfolio data
-        combined_total = []
-        combined_timestamps = []
+        # Combined portfolio: asset curves aligned on timestamp (forward-filled), not by index
+        combined_total = np.array([])
+        combined_timestamps = np.array([], dtype='datetime64[us]')
         if len(portfolio_data) >= 2:
-            assets = list(portfolio_data.keys())
-            min_length = min(len(portfolio_data[asset]['values']) for asset in assets)
-            combined_timestamps = portfolio_data[assets[0]]['timestamps'][:min_length]
-            
-            for i in range(min_length):
-                total_val = sum(portfolio_data[asset]['values'][i] for asset in assets)
-                combined_total.append(total_val)
+            if portfolio_equity is None:
+                portfolio_equity = build_portfolio_equity(results_list, freq=PORTFOLIO_EQUITY_FREQ)
+            combined_timestamps = portfolio_equity.index.to_numpy()
+            combined_total = portfolio_equity['TOTAL'].to_numpy()
         
         colors = {'EURUSD': '#2E86AB', 'USDCHF': '#A23B72', 'XAUUSD': '#F18F01', 'XAGUSD': '#C73E1D', 'GBPUSD': '#5A7C3E'}
         
@@ -441,10 +802,10 @@ def create_portfolio_chart(results_list):
         print(f"  [CHART 1] Combined Portfolio Performance")
         fig1, ax1 = plt.subplots(figsize=(16, 8))
         
-        if combined_total and combined_timestamps:
+        if len(combined_total) and len(combined_timestamps):
             # Calculate combined performance for title
             combined_initial = sum(data['initial_value'] for data in portfolio_data.values())
-            combined_final = combined_total[-1] if combined_total else combined_initial
+            combined_final = combined_total[-1]
             combined_pnl_pct = ((combined_final - combined_initial) / combined_initial) * 100
             
             # Plot combined portfolio
@@ -504,7 +865,7 @@ def create_portfolio_chart(results_list):
         # Calculate performance data for title
         asset_performance = {}
         for asset, data in portfolio_data.items():
-            if data['values']:
+            if len(data['values']):
                 initial = data['initial_value']
                 final = data['values'][-1]
                 pnl_pct = ((final - initial) / initial) * 100
@@ -528,7 +889,7 @@ def create_portfolio_chart(results_list):
             values = data['values']
             
             # Calculate performance for legend
-            if values:
+            if len(values):
                 initial = data['initial_value']
                 final = values[-1]
                 pnl_pct = ((final - initial) / initial) * 100
@@ -617,7 +978,12 @@ def create_simple_individual_charts(results_list):
     
     for result in results_list:
         asset = result['asset']
-        cerebro = result['cerebro']
+        cerebro = result.get('cerebro')
+        
+        if cerebro is None:
+            # Worker-process summaries do not carry a live Cerebro
+            print(f"  Skipping chart for {asset} (no live Cerebro in result summary)")
+            continue
         
         print(f"  Opening chart for {asset}...")
         try:
@@ -631,57 +997,74 @@ def create_simple_individual_charts(results_list):
         except Exception as e:
             print(f"    Warning: Could not create chart for {asset}: {e}")
 
-def generate_monthly_statistics(results_list):
-    """Generate monthly entry and profitability statistics from trade reports
+def _closed_only(trades):
+    return trades[trades['entry_time'].notna() & trades['pnl'].notna()].reset_index(drop=True)
+
+def load_closed_trades(reports_dir=None):
+    """Load closed trades from the strategies' structured trade journals
+    
+    Args:
+        reports_dir: Journal directory, e.g. an archived run directory
+            (default: TEMP_REPORTS_DIR)
+        
+    Returns:
+        pd.DataFrame: One row per closed trade (asset, entry_time, exit_time, pnl, ...)
+    """
+    return _closed_only(load_trade_journals(reports_dir or TEMP_REPORTS_DIR))
+
+def closed_trades_frame(results_list):
+    """Closed trades of this run's results, straight from their in-memory records
     
-    SIMPLE APPROACH: Parse the trade report files that are already generated.
-    This avoids complex backtrader internals and provides data for future analysis.
+    Same columns as load_closed_trades(), without reading any journal.
+    """
+    return _closed_only(journal_frame(trade for result in results_list for trade in _trade_records(result)))
+
+def _analytics_trades(results_list, reports_dir):
+    """Closed trades for the analytics: in memory, or archived journals when ``reports_dir`` is given"""
+    if reports_dir is not None:
+        return load_closed_trades(reports_dir), f"trade journals in {reports_dir}"
+    return closed_trades_frame(results_list), "in-memory trade records"
+
+def build_monthly_cube(results_list, reports_dir=None):
+    """Monthly statistics cube shared by the console tables and the heatmaps
+    
+    Args:
+        results_list: Backtest results or summaries
+        reports_dir: Use the journals archived in this directory instead of
+            the trades in memory (e.g. temp_reports/<run id>)
+    
+    Returns:
+        dict: 'cube' (monthly_stats.monthly_cube() of the closed trades, None
+        without trades), 'trades' (closed trade count) and 'source'
+    """
+    trades, source = _analytics_trades(results_list, reports_dir)
+    cube = monthly_cube(trades, STARTING_CASH) if not trades.empty else None
+    return {'cube': cube, 'trades': len(trades), 'source': source}
+
+def generate_monthly_statistics(results_list, reports_dir=None, monthly=None):
+    """Generate monthly entry and profitability statistics from the trade records
+    
+    SIMPLE APPROACH: Use the structured trade records the strategies keep
+    (the same records their journals are written from), handed over in
+    memory with the results. This avoids complex backtrader internals and
+    never picks up reports of other runs.
+    
+    Args:
+        results_list: Backtest results or summaries
+        reports_dir: Read the journals archived in this directory instead
+            (e.g. temp_reports/<run id>)
+        monthly: Output of build_monthly_cube() (built if None)
     """
     print(f"\n" + "="*100)
-    print(f"MONTHLY STATISTICS ANALYSIS (from trade reports)")
+    print(f"MONTHLY STATISTICS ANALYSIS (from trade records)")
     print(f"="*100)
     
-    # SIMPLE APPROACH: Parse trade report files instead of backtrader internals
-    all_trades = []
-    
-    # Parse all trade report files from temp_reports directory
-    if TEMP_REPORTS_DIR.exists():
-        for report_file in TEMP_REPORTS_DIR.glob('*_trades_*.txt'):
-            asset_name = report_file.stem.split('_trades_')[0]
-            
-            try:
-                with open(report_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    entries = content.split('ENTRY #')
-                    
-                    for entry in entries[1:]:  # Skip header
-                        try:
-                            lines = entry.split('\n')
-                            trade_data = {'asset': asset_name}
-                            
-                            for line in lines:
-                                if line.startswith('Time:'):
-                                    time_str = line.split('Time:')[1].strip()
-                                    trade_data['entry_time'] = pd.to_datetime(time_str)
-                                elif line.startswith('Exit Time:'):
-                                    time_str = line.split('Exit Time:')[1].strip()
-                                    trade_data['exit_time'] = pd.to_datetime(time_str)
-                                elif line.startswith('PnL:'):
-                                    pnl_str = line.split('PnL:')[1].strip().replace('$', '').replace(',', '')
-                                    trade_data['pnl'] = float(pnl_str)
-                            
-                            if 'entry_time' in trade_data and 'pnl' in trade_data:
-                                all_trades.append(trade_data)
-                        except:
-                            continue
-                            
-            except Exception as e:
-                print(f"[WARNING] Could not parse {report_file.name}: {e}")
-                continue
+    if monthly is None:
+        monthly = build_monthly_cube(results_list, reports_dir)
+    cube, source = monthly['cube'], monthly['source']
     
-    if not all_trades:
-        print("[INFO] No trade report files found or trades to analyze")
-        print(f"[INFO] Trade reports should be in: {TEMP_REPORTS_DIR}")
+    if cube is None:
+        print(f"[INFO] No closed trades to analyze ({source})")
         print(f"\n[INFO] Showing aggregate statistics from Backtrader analyzers:")
         
         for result in results_list:
@@ -698,13 +1081,9 @@ def generate_monthly_statistics(results_list):
         print(f"="*100)
         return
     
-    # Convert to DataFrame for analysis
-    df = pd.DataFrame(all_trades)
-    df['year_month'] = df['entry_time'].dt.to_period('M')
-    df['year'] = df['entry_time'].dt.year
-    df['month'] = df['entry_time'].dt.month
-    df['date'] = df['entry_time'].dt.date
-    df['is_winner'] = df['pnl'] > 0
+    # One row per month (counts, P&L, returns on the accumulated balance)
+    years = yearly_summary(cube, STARTING_CASH)
+    month_names = [calendar.month_abbr[month] for month in cube['month']]
     
     # =================================================================
     # TABLE 1: MONTHLY ENTRY STATISTICS
@@ -713,34 +1092,8 @@ def generate_monthly_statistics(results_list):
     print(f"{'Year':<6} {'Month':<10} {'Total':>8} {'Winners':>8} {'Losers':>8} {'Max/Day':>8}")
     print(f"-" * 60)
     
-    monthly_entries = df.groupby('year_month').agg({
-        'pnl': 'count',
-        'is_winner': ['sum', lambda x: (~x).sum()],
-        'date': lambda x: x.value_counts().max()
-    }).reset_index()
-    
-    monthly_entries.columns = ['year_month', 'total', 'winners', 'losers', 'max_daily']
-    monthly_entries['year'] = monthly_entries['year_month'].dt.year
-    monthly_entries['month'] = monthly_entries['year_month'].dt.month
-    
-    yearly_totals = defaultdict(lambda: {'total': 0, 'winners': 0, 'losers': 0, 'max_daily': 0})
-    
-    for _, row in monthly_entries.iterrows():
-        year = row['year']
-        month = row['month']
-        month_name = calendar.month_abbr[month]
-        
-        total = int(row['total'])
-        winners = int(row['winners'])
-        losers = int(row['losers'])
-        max_daily = int(row['max_daily'])
-        
-        yearly_totals[year]['total'] += total
-        yearly_totals[year]['winners'] += winners
-        yearly_totals[year]['losers'] += losers
-        yearly_totals[year]['max_daily'] = max(yearly_totals[year]['max_daily'], max_daily)
-        
-        print(f"{year:<6} {month_name:<10} {total:>8} {winners:>8} {losers:>8} {max_daily:>8}")
+    for row, month_name in zip(cube.itertuples(), month_names):
+        print(f"{row.year:<6} {month_name:<10} {row.total:>8} {row.winners:>8} {row.losers:>8} {row.max_daily:>8}")
     
     # Print yearly totals with win rate
     print(f"-" * 60)
@@ -748,11 +1101,9 @@ def generate_monthly_statistics(results_list):
     print(f"-" * 60)
     print(f"{'Year':<6} {'Total':>8} {'Winners':>8} {'Losers':>8} {'Win Rate':>10} {'Max/Day':>8}")
     print(f"-" * 60)
-    for year in sorted(yearly_totals.keys()):
-        data = yearly_totals[year]
-        win_rate = (data['winners'] / data['total'] * 100) if data['total'] > 0 else 0
-        print(f"{year:<6} {data['total']:>8} {data['winners']:>8} "
-              f"{data['losers']:>8} {win_rate:>9.1f}% {data['max_daily']:>8}")
+    for year, data in years.iterrows():
+        print(f"{year:<6} {int(data['total']):>8} {int(data['winners']):>8} "
+              f"{int(data['losers']):>8} {data['win_rate']:>9.1f}% {int(data['max_daily']):>8}")
     
     # =================================================================
     # TABLE 2: MONTHLY PROFITABILITY (%)
@@ -761,25 +1112,9 @@ def generate_monthly_statistics(results_list):
     print(f"{'Year':<6} {'Month':<10} {'PnL ($)':>12} {'Return (%)':>12} {'Cumulative':>12}")
     print(f"-" * 60)
     
-    monthly_pnl = df.groupby('year_month')['pnl'].sum().reset_index()
-    monthly_pnl['year'] = monthly_pnl['year_month'].dt.year
-    monthly_pnl['month'] = monthly_pnl['year_month'].dt.month
-    
-    cumulative_balance = STARTING_CASH
-    yearly_returns = defaultdict(float)
-    
-    for _, row in monthly_pnl.iterrows():
-        year = row['year']
-        month = row['month']
-        month_name = calendar.month_abbr[month]
-        monthly_profit = row['pnl']
-        
-        monthly_return = (monthly_profit / cumulative_balance) * 100 if cumulative_balance > 0 else 0
-        cumulative_balance += monthly_profit
-        yearly_returns[year] += monthly_return
-        
-        print(f"{year:<6} {month_name:<10} ${monthly_profit:>10,.2f} {monthly_return:>11.2f}% "
-              f"${cumulative_balance:>10,.2f}")
+    for row, month_name in zip(cube.itertuples(), month_names):
+        print(f"{row.year:<6} {month_name:<10} ${row.pnl:>10,.2f} {row.return_pct:>11.2f}% "
+              f"${row.balance:>10,.2f}")
     
     # Print yearly totals with CAGR
     print(f"-" * 60)
@@ -788,34 +1123,17 @@ def generate_monthly_statistics(results_list):
     print(f"{'Year':<6} {'Return (%)':>12} {'CAGR (%)':>12} {'Final Balance':>14}")
     print(f"-" * 60)
     
-    year_balances = {}
-    cumulative_balance = STARTING_CASH
-    
-    for _, row in monthly_pnl.iterrows():
-        year = row['year']
-        monthly_profit = row['pnl']
-        cumulative_balance += monthly_profit
-        year_balances[year] = cumulative_balance
-    
-    for year in sorted(yearly_returns.keys()):
-        year_return = yearly_returns[year]
-        year_final = year_balances.get(year, cumulative_balance)
-        
-        # Calculate CAGR for full years only
-        if year < max(yearly_returns.keys()):
-            year_start = year_balances.get(year-1, STARTING_CASH) if year > min(yearly_returns.keys()) else STARTING_CASH
-            year_cagr = ((year_final / year_start) ** (1.0) - 1) * 100
-        else:
-            year_cagr = year_return  # Partial year, use simple return
-        
-        print(f"{year:<6} {year_return:>11.2f}% {year_cagr:>11.2f}% ${year_final:>12,.2f}")
+    last_year = years.index.max()
+    for year, data in years.iterrows():
+        # Growth over the previous year's balance for full years only
+        year_cagr = data['growth_pct'] if year < last_year else data['return_pct']  # Partial year, use simple return
+        print(f"{year:<6} {data['return_pct']:>11.2f}% {year_cagr:>11.2f}% ${data['balance']:>12,.2f}")
     
     print(f"="*100)
-    print(f"[INFO] Monthly statistics generated from {len(all_trades)} trades across {len(results_list)} assets")
-    print(f"[INFO] Data source: Trade report files in {TEMP_REPORTS_DIR}")
-    print(f"[INFO] Trade reports saved for future analysis")
+    print(f"[INFO] Monthly statistics generated from {monthly['trades']} trades across {len(results_list)} assets")
+    print(f"[INFO] Data source: {source}")
 
-def generate_monthly_heatmaps(results_list):
+def generate_monthly_heatmaps(results_list, reports_dir=None, monthly=None):
     """Generate heatmap visualizations for monthly statistics
     
     Creates two heatmap images similar to MT5 analytics:
@@ -823,171 +1141,66 @@ def generate_monthly_heatmaps(results_list):
     2. Monthly Profitability (%) relative to accumulated balance
     
     This is a NEW function that doesn't affect existing functionality.
+    Trades come from the results in memory, or from the journals archived
+    in ``reports_dir`` when given (same as generate_monthly_statistics);
+    ``monthly`` is the output of build_monthly_cube() (built if None).
     """
+    import matplotlib.pyplot as plt
+    
     print(f"\n" + "="*100)
     print(f"GENERATING MONTHLY HEATMAP VISUALIZATIONS")
     print(f"="*100)
     
-    # Parse trade reports (same as generate_monthly_statistics)
-    all_trades = []
-    
-    if TEMP_REPORTS_DIR.exists():
-        for report_file in TEMP_REPORTS_DIR.glob('*_trades_*.txt'):
-            asset_name = report_file.stem.split('_trades_')[0]
-            
-            try:
-                with open(report_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    entries = content.split('ENTRY #')
-                    
-                    for entry in entries[1:]:
-                        try:
-                            lines = entry.split('\n')
-                            trade_data = {'asset': asset_name}
-                            
-                            for line in lines:
-                                if line.startswith('Time:'):
-                                    time_str = line.split('Time:')[1].strip()
-                                    trade_data['entry_time'] = pd.to_datetime(time_str)
-                                elif line.startswith('P&L:'):
-                                    pnl_str = line.split('P&L:')[1].strip().replace('$', '').replace(',', '')
-                                    trade_data['pnl'] = float(pnl_str)
-                            
-                            if 'entry_time' in trade_data and 'pnl' in trade_data:
-                                all_trades.append(trade_data)
-                        except:
-                            continue
-            except Exception as e:
-                print(f"[WARNING] Could not parse {report_file.name}: {e}")
-                continue
+    # Same monthly cube as generate_monthly_statistics
+    if monthly is None:
+        monthly = build_monthly_cube(results_list, reports_dir)
+    cube = monthly['cube']
     
-    if not all_trades:
+    if cube is None:
         print("[INFO] No trade data available for heatmap generation")
         print(f"[INFO] Skipping heatmap visualization")
         return
     
-    # Convert to DataFrame
-    df = pd.DataFrame(all_trades)
-    df['year_month'] = df['entry_time'].dt.to_period('M')
-    df['year'] = df['entry_time'].dt.year
-    df['month'] = df['entry_time'].dt.month
-    df['date'] = df['entry_time'].dt.date
-    df['is_winner'] = df['pnl'] > 0
+    # Year x month matrices, all read from the cube
+    years = list(cube['year'].unique())
     
-    # Prepare data for heatmaps
-    years = sorted(df['year'].unique())
-    months = range(1, 13)
+    # Month labels
+    month_labels = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
+                    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
     
     # =================================================================
     # HEATMAP 1: MONTHLY ENTRY STATISTICS
     # =================================================================
     print(f"\n[CREATING] Heatmap 1: Monthly Entry Statistics...")
     
-    # Create matrices for heatmap data
-    total_matrix = pd.DataFrame(0, index=years, columns=months)
-    winners_matrix = pd.DataFrame(0, index=years, columns=months)
-    losers_matrix = pd.DataFrame(0, index=years, columns=months)
-    max_daily_matrix = pd.DataFrame(0, index=years, columns=months)
-    
-    # Fill matrices with data
-    for year in years:
-        for month in months:
-            mask = (df['year'] == year) & (df['month'] == month)
-            month_data = df[mask]
-            
-            if len(month_data) > 0:
-                total_matrix.loc[year, month] = len(month_data)
-                winners_matrix.loc[year, month] = month_data['is_winner'].sum()
-                losers_matrix.loc[year, month] = (~month_data['is_winner']).sum()
-                
-                # Max entries per day
-                daily_counts = month_data['date'].value_counts()
-                max_daily_matrix.loc[year, month] = daily_counts.max() if len(daily_counts) > 0 else 0
-    
-    # Calculate yearly totals
-    total_yearly = total_matrix.sum(axis=1)
-    winners_yearly = winners_matrix.sum(axis=1)
-    losers_yearly = losers_matrix.sum(axis=1)
-    max_daily_yearly = max_daily_matrix.max(axis=1)
-    
     # Create figure with subplots
     fig, axes = plt.subplots(1, 4, figsize=(24, 6))
     fig.suptitle('Monthly Entry Statistics: Totals, Winners, Losers, and Max Daily Entries', 
                  fontsize=16, fontweight='bold')
     
-    # Month labels
-    month_labels = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                    'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    
-    # Heatmap 1: Total Entries
-    im1 = axes[0].imshow(total_matrix.values, cmap='Greens', aspect='auto')
-    axes[0].set_title('Total Entries', fontweight='bold')
-    axes[0].set_xticks(range(12))
-    axes[0].set_xticklabels(month_labels, rotation=45)
-    axes[0].set_yticks(range(len(years)))
-    axes[0].set_yticklabels(years)
-    axes[0].set_xlabel('Month')
-    axes[0].set_ylabel('Year')
-    
-    # Add text annotations
-    for i, year in enumerate(years):
-        for j, month in enumerate(months):
-            value = int(total_matrix.loc[year, month])
-            if value > 0:
-                axes[0].text(j, i, str(value), ha='center', va='center', color='black', fontsize=9)
-    
-    plt.colorbar(im1, ax=axes[0], label='Entries')
-    
-    # Heatmap 2: Winners
-    im2 = axes[1].imshow(winners_matrix.values, cmap='Blues', aspect='auto')
-    axes[1].set_title('Winning Entries', fontweight='bold')
-    axes[1].set_xticks(range(12))
-    axes[1].set_xticklabels(month_labels, rotation=45)
-    axes[1].set_yticks(range(len(years)))
-    axes[1].set_yticklabels(years)
-    axes[1].set_xlabel('Month')
-    
-    for i, year in enumerate(years):
-        for j, month in enumerate(months):
-            value = int(winners_matrix.loc[year, month])
-            if value > 0:
-                axes[1].text(j, i, str(value), ha='center', va='center', color='black', fontsize=9)
-    
-    plt.colorbar(im2, ax=axes[1], label='Winners')
-    
-    # Heatmap 3: Losers
-    im3 = axes[2].imshow(losers_matrix.values, cmap='Reds', aspect='auto')
-    axes[2].set_title('Losing Entries', fontweight='bold')
-    axes[2].set_xticks(range(12))
-    axes[2].set_xticklabels(month_labels, rotation=45)
-    axes[2].set_yticks(range(len(years)))
-    axes[2].set_yticklabels(years)
-    axes[2].set_xlabel('Month')
-    
-    for i, year in enumerate(years):
-        for j, month in enumerate(months):
-            value = int(losers_matrix.loc[year, month])
-            if value > 0:
-                axes[2].text(j, i, str(value), ha='center', va='center', color='black', fontsize=9)
-    
-    plt.colorbar(im3, ax=axes[2], label='Losers')
-    
-    # Heatmap 4: Max Daily Entries
-    im4 = axes[3].imshow(max_daily_matrix.values, cmap='Oranges', aspect='auto')
-    axes[3].set_title('Max Daily Entries', fontweight='bold')
-    axes[3].set_xticks(range(12))
-    axes[3].set_xticklabels(month_labels, rotation=45)
-    axes[3].set_yticks(range(len(years)))
-    axes[3].set_yticklabels(years)
-    axes[3].set_xlabel('Month')
-    
-    for i, year in enumerate(years):
-        for j, month in enumerate(months):
-            value = int(max_daily_matrix.loc[year, month])
-            if value > 0:
-                axes[3].text(j, i, str(value), ha='center', va='center', color='black', fontsize=9)
-    
-    plt.colorbar(im4, ax=axes[3], label='Max/Day')
+    panels = [
+        ('total', 'Total Entries', 'Greens', 'Entries'),
+        ('winners', 'Winning Entries', 'Blues', 'Winners'),
+        ('losers', 'Losing Entries', 'Reds', 'Losers'),
+        ('max_daily', 'Max Daily Entries', 'Oranges', 'Max/Day'),
+    ]
+    for ax, (column, title, cmap, label) in zip(axes, panels):
+        matrix = cube_matrix(cube, column).to_numpy()
+        im = ax.imshow(matrix, cmap=cmap, aspect='auto')
+        ax.set_title(title, fontweight='bold')
+        ax.set_xticks(range(12))
+        ax.set_xticklabels(month_labels, rotation=45)
+        ax.set_yticks(range(len(years)))
+        ax.set_yticklabels(years)
+        ax.set_xlabel('Month')
+        if ax is axes[0]:
+            ax.set_ylabel('Year')
+        
+        # Add text annotations
+        for i, j in zip(*np.nonzero(matrix > 0)):
+            ax.text(j, i, str(int(matrix[i, j])), ha='center', va='center', color='black', fontsize=9)
+        
+        plt.colorbar(im, ax=ax, label=label)
     
     plt.tight_layout()
     
@@ -1002,24 +1215,8 @@ def generate_monthly_heatmaps(results_list):
     # =================================================================
     print(f"[CREATING] Heatmap 2: Monthly Profitability (%)...")
     
-    # Calculate monthly profitability
-    profitability_matrix = pd.DataFrame(0.0, index=years, columns=months)
-    
-    cumulative_balance = STARTING_CASH
-    
-    for year in years:
-        for month in months:
-            mask = (df['year'] == year) & (df['month'] == month)
-            month_data = df[mask]
-            
-            if len(month_data) > 0:
-                monthly_pnl = month_data['pnl'].sum()
-                monthly_return = (monthly_pnl / cumulative_balance) * 100 if cumulative_balance > 0 else 0
-                profitability_matrix.loc[year, month] = monthly_return
-                cumulative_balance += monthly_pnl
-    
-    # Calculate yearly totals
-    yearly_returns = profitability_matrix.sum(axis=1)
+    # Monthly returns relative to the accumulated balance
+    profitability_matrix = cube_matrix(cube, 'return_pct')
     
     # Create figure
     fig, ax = plt.subplots(figsize=(16, 6))
@@ -1037,14 +1234,13 @@ def generate_monthly_heatmaps(results_list):
     ax.set_xlabel('Month', fontweight='bold')
     ax.set_ylabel('Year', fontweight='bold')
     
-    # Add text annotations
-    for i, year in enumerate(years):
-        for j, month in enumerate(months):
-            value = profitability_matrix.loc[year, month]
-            if abs(value) > 0.01:  # Only show non-zero values
-                text_color = 'white' if abs(value) > 2.5 else 'black'
-                ax.text(j, i, f'{value:.2f}%', ha='center', va='center', 
-                       color=text_color, fontsize=9, fontweight='bold')
+    # Add text annotations (only non-zero values)
+    values = profitability_matrix.to_numpy()
+    for i, j in zip(*np.nonzero(np.abs(values) > 0.01)):
+        value = values[i, j]
+        text_color = 'white' if abs(value) > 2.5 else 'black'
+        ax.text(j, i, f'{value:.2f}%', ha='center', va='center', 
+               color=text_color, fontsize=9, fontweight='bold')
     
     plt.colorbar(im, ax=ax, label='Return (%)')
     plt.tight_layout()
@@ -1058,50 +1254,131 @@ def generate_monthly_heatmaps(results_list):
     print(f"\n[SUCCESS] Heatmap visualizations generated successfully!")
     print(f"[INFO] Files saved in: {BASE_DIR}")
 
-def run_sequential_backtest():
-    """Main function to run sequential multi-asset backtest
-    
-    NOTE: Despite the historical name 'triple cerebro', this runs backtests 
-    SEQUENTIALLY, not in parallel. Each asset is tested one after another.
+def run_sequential_backtest(workers=1, portfolio_mode=False, assets=None, headless=None,
+                            checkpoint_dir=None, monte_carlo_paths=None, phase_timing=None, run_id=None):
+    """Main function to run the multi-asset backtest
+    
+    NOTE: Despite the historical name, with workers > 1 each asset's Cerebro
+    runs in its own process. With workers=1 assets are tested one after
+    another in this process, each asset's engine being released as soon as
+    its result is summarized. Either way only result summaries
+    (summarize_backtest_result) are returned.
+    
+    Args:
+        workers: Number of worker processes (1 = sequential, in-process)
+        portfolio_mode: Run every asset in one Cerebro with a shared broker
+            (run_portfolio_backtest); ``workers`` is ignored
+        assets: Subset of ASSETS keys to run (None = all, in ASSETS order)
+        headless: Skip charts and heatmaps so matplotlib is never imported
+            (None = HEADLESS)
+        checkpoint_dir: Save per-asset checkpoints and resume from them when
+            TODATE moves forward (None = CHECKPOINT_DIR); not used in portfolio mode
+        monte_carlo_paths: Monte Carlo paths per asset, 0 = off (None = MONTE_CARLO_PATHS)
+        phase_timing: Export per-phase strategy timings as JSON (None = PHASE_TIMING)
+        run_id: Run identifier (None = new_run_id()); the run's reports go to
+            TEMP_REPORTS_DIR/<run_id> and it is returned as portfolio_summary['run_id']
     """
+    asset_names = [name for name in ASSETS if assets is None or name in assets]
+    if headless is None:
+        headless = HEADLESS
+    if checkpoint_dir is None:
+        checkpoint_dir = CHECKPOINT_DIR
+    if monte_carlo_paths is None:
+        monte_carlo_paths = MONTE_CARLO_PATHS
+    run_id = run_id or new_run_id()
+    report_dir = TEMP_REPORTS_DIR / run_id
+    
     print(f"HEXA ASSET SEQUENTIAL BACKTEST")
+    print(f"Run ID: {run_id}")
     print(f"Period: {FROMDATE} to {TODATE}")
     print(f"Starting Cash: ${STARTING_CASH:,.2f}")
-    print(f"Assets: {', '.join(ASSETS.keys())}")
-    print(f"Mode: Sequential execution (one asset at a time)")
+    print(f"Assets: {', '.join(asset_names)}")
+    if portfolio_mode:
+        print(f"Mode: Portfolio (one Cerebro, shared broker)")
+        if checkpoint_dir:
+            print(f"[INFO] Checkpoints are per asset; running the full history in portfolio mode")
+    elif workers > 1:
+        print(f"Mode: Process pool execution ({workers} workers)")
+    else:
+        print(f"Mode: Sequential execution (one asset at a time)")
     
-    # Run individual asset backtests SEQUENTIALLY
     all_results = []
     
-    for asset_name, asset_config in ASSETS.items():
-        try:
-            result = run_single_asset_backtest(
-                asset_name, 
-                asset_config, 
-                FROMDATE, 
-                TODATE, 
-                STARTING_CASH
-            )
-            all_results.append(result)
-        except Exception as e:
-            print(f"[ERROR] Error running {asset_name} backtest: {e}")
-            continue
+    if portfolio_mode:
+        # All feeds in ONE cerebro with a shared broker
+        all_results = [summarize_backtest_result(result) for result in run_portfolio_backtest(
+            asset_names,
+            FROMDATE,
+            TODATE,
+            STARTING_CASH,
+            phase_timing,
+            report_dir,
+            run_id
+        )]
+        release_backtest_engine()
+    elif workers > 1:
+        # Run individual asset backtests in PARALLEL worker processes
+        all_results = run_parallel_backtests(
+            asset_names,
+            FROMDATE,
+            TODATE,
+            STARTING_CASH,
+            workers,
+            checkpoint_dir,
+            phase_timing,
+            report_dir,
+            run_id
+        )
+    else:
+        # Run individual asset backtests SEQUENTIALLY
+        for asset_name in asset_names:
+            try:
+                result = run_single_asset_backtest(
+                    asset_name, 
+                    ASSETS[asset_name], 
+                    FROMDATE, 
+                    TODATE, 
+                    STARTING_CASH,
+                    checkpoint_dir,
+                    phase_timing,
+                    report_dir=report_dir,
+                    run_id=run_id
+                )
+                # Keep only the summary so each asset's engine is freed before the next one
+                all_results.append(summarize_backtest_result(result))
+                del result
+            except Exception as e:
+                print(f"[ERROR] Error running {asset_name} backtest: {e}")
+                continue
+            finally:
+                release_backtest_engine()
     
     if not all_results:
         print("[ERROR] No successful backtests completed!")
         return
     
+    # Combined equity curve, time-aligned across assets (shared by aggregation and charts)
+    portfolio_equity = build_portfolio_equity(all_results, freq=PORTFOLIO_EQUITY_FREQ)
+    
     # Aggregate portfolio results
-    portfolio_summary = aggregate_portfolio_results(all_results)
+    portfolio_summary = aggregate_portfolio_results(all_results, portfolio_equity)
+    portfolio_summary['run_id'] = run_id
+    portfolio_summary['report_dir'] = report_dir
     
-    # Generate monthly statistics
-    generate_monthly_statistics(all_results)
+    # Confidence intervals from resampled trade sequences
+    if monte_carlo_paths:
+        portfolio_summary['monte_carlo'] = print_monte_carlo_report(all_results, monte_carlo_paths)
     
-    # Generate monthly heatmap visualizations
-    generate_monthly_heatmaps(all_results)
+    # Generate monthly statistics (from the trades in memory)
+    monthly = build_monthly_cube(all_results)
+    generate_monthly_statistics(all_results, monthly=monthly)
     
-    # Create portfolio performance chart
-    create_portfolio_chart(all_results)
+    if not headless:
+        # Generate monthly heatmap visualizations (same monthly cube)
+        generate_monthly_heatmaps(all_results, monthly=monthly)
+        
+        # Create portfolio performance chart
+        create_portfolio_chart(all_results, portfolio_equity)
     
     return portfolio_summary, all_results
 
@@ -1111,8 +1388,12 @@ def cleanup_auxiliary_files():
     import glob
     
     cleanup_patterns = [
-        # Temporary trade reports - use global TEMP_REPORTS_DIR
+        # Temporary trade reports and journals - use global TEMP_REPORTS_DIR
+        # (run directories are removed below)
         str(TEMP_REPORTS_DIR / '*.txt'),
+        str(TEMP_REPORTS_DIR / '*.csv'),
+        str(TEMP_REPORTS_DIR / '*.jsonl'),
+        str(TEMP_REPORTS_DIR / '*.parquet'),
         # Python cache files
         str(BASE_DIR / '__pycache__'),
         # Chart files
@@ -1148,6 +1429,14 @@ def cleanup_auxiliary_files():
                 except Exception as e:
                     pass  # Ignore errors for files in use
     
+    # Run directories (temp_reports/<run id>/)
+    if TEMP_REPORTS_DIR.exists():
+        for run_dir in TEMP_REPORTS_DIR.iterdir():
+            if run_dir.is_dir():
+                shutil.rmtree(run_dir, ignore_errors=True)
+                print(f"  Removed run directory: {run_dir.name}")
+                cleaned_count += 1
+    
     # Clean up temp_reports directory if empty
     if TEMP_REPORTS_DIR.exists() and not any(TEMP_REPORTS_DIR.iterdir()):
         TEMP_REPORTS_DIR.rmdir()
@@ -1159,11 +1448,45 @@ def cleanup_auxiliary_files():
     else:
         print(f"🧹 No auxiliary files found to clean")
 
+def parse_args(argv=None):
+    """Parse command line options for the multi-asset runner"""
+    parser = argparse.ArgumentParser(description='Hexa-asset SunriseOgle portfolio backtest')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Run each asset in a separate process (default: 1 = sequential)')
+    parser.add_argument('--portfolio', action='store_true',
+                        help='Run all assets in one Cerebro with a shared broker')
+    parser.add_argument('--assets', nargs='+', type=str.upper, choices=list(ASSETS), metavar='ASSET',
+                        help=f"Only run these assets (default: all of {', '.join(ASSETS)})")
+    parser.add_argument('--headless', action='store_true', default=HEADLESS,
+                        help='Batch mode for cron/CI: no charts or heatmaps (matplotlib is not imported)')
+    parser.add_argument('--monte-carlo', type=int, default=MONTE_CARLO_PATHS, metavar='PATHS',
+                        help='Resample each asset\'s trades into PATHS sequences for drawdown/ruin '
+                             'confidence intervals (default: off)')
+    parser.add_argument('--phase-timing', action='store_true', default=PHASE_TIMING,
+                        help='Time the strategy\'s next() phases and write one JSON per asset to the run directory')
+    parser.add_argument('--checkpoint-dir', default=CHECKPOINT_DIR, metavar='DIR',
+                        help='Save per-asset checkpoints and only process new bars when TODATE moves forward')
+    parser.add_argument('--run-id', metavar='ID',
+                        help='Run identifier; reports go to temp_reports/<ID>/ (default: start time plus a random suffix)')
+    return parser.parse_args(argv)
+
 if __name__ == '__main__':
+    args = parse_args()
     try:
-        portfolio_summary, individual_results = run_sequential_backtest()
+        portfolio_summary, individual_results = run_sequential_backtest(
+            workers=args.workers,
+            portfolio_mode=args.portfolio,
+            assets=args.assets,
+            headless=args.headless,
+            checkpoint_dir=args.checkpoint_dir,
+            monte_carlo_paths=args.monte_carlo,
+            phase_timing=args.phase_timing,
+            run_id=args.run_id,
+        )
         print(f"\n[SUCCESS] Sequential backtest completed successfully!")
         print(f"All {len(individual_results)} assets processed")
+        if ARCHIVE_TRADE_REPORTS:
+            print(f"Reports archived in: {portfolio_summary['report_dir']}")
         
         # Keep external reports - don't cleanup
         # cleanup_auxiliary_files()
@@ -0,0 +1,288 @@
+"""Synthetic Multi-Asset OHLCV Generator
+Writes seeded, realistic intraday OHLCV files in the GenericCSVData layout
+create_data_feed expects (Date,Time,Open,High,Low,Close,Volume), so the
+runner, optimizer and benchmarks can be reproduced and load-tested without
+the proprietary data files.
+
+Price model, per symbol:
+- log returns with fat tails (Student-t, 5 degrees of freedom, unit variance)
+- regime-switching volatility: a Markov chain over calm / normal / stressed
+  regimes (volatility x0.5 / x1.0 / x2.2, mean regime length REGIME_MEAN_DAYS),
+  scaled so the long-run volatility matches the profile's annual_vol
+- intraday seasonality: quieter Asian session, busier London/New York overlap
+- weekend gaps: no bars from Friday 22:00 to Sunday 22:00 (UTC, FX hours),
+  and the first bar of the week opens with a gap
+- price scale and annual volatility from SYMBOL_PROFILES (FX ~1.1, gold
+  ~2000); extra symbols (SYN007, SYN008, ...) get seeded random profiles
+
+Files are generated in chunks of CHUNK_DAYS calendar days, so memory stays
+flat from 10 days up to 20 years x 50 symbols; symbols can be generated
+in parallel. The same seed always produces the same files.
+
+Usage:
+    python synthetic_data.py --years 5                     # data/<ASSET>_5m_5Yea.csv for the six runner assets
+    python synthetic_data.py --days 10 --timeframe 1 --output-dir /tmp/data
+    python synthetic_data.py --years 20 --symbols 50 --workers 8 --output-dir /tmp/load_test
+"""
+
+import argparse
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+BASE_DIR = Path(__file__).resolve().parent
+DEFAULT_OUTPUT_DIR = BASE_DIR / 'data'
+DEFAULT_START = '2020-07-06'
+DEFAULT_SEED = 42
+
+# Symbol -> start price and annualized volatility
+SYMBOL_PROFILES = {
+    'EURUSD': {'price': 1.10, 'annual_vol': 0.07},
+    'USDCHF': {'price': 0.90, 'annual_vol': 0.08},
+    'XAUUSD': {'price': 1900.0, 'annual_vol': 0.15},
+    'XAGUSD': {'price': 24.0, 'annual_vol': 0.28},
+    'GBPUSD': {'price': 1.30, 'annual_vol': 0.08},
+    'AUDUSD': {'price': 0.70, 'annual_vol': 0.10},
+}
+
+# Volatility regimes: multiplier and stationary probability
+REGIME_VOL = np.array([0.5, 1.0, 2.2])
+REGIME_PROB = np.array([0.3, 0.5, 0.2])
+REGIME_MEAN_DAYS = 10
+
+# Relative volatility per UTC hour (Asia, London, London/New York overlap, New York)
+HOURLY_VOL = np.array([0.7] * 7 + [1.2] * 5 + [1.5] * 4 + [1.0] * 6 + [0.7] * 2)
+
+WEEKEND_CLOSE_HOUR = 22  # Friday close and Sunday open, UTC
+WEEKEND_GAP_SCALE = 8.0  # Week-open gap sigma, in bar sigmas
+STUDENT_T_DF = 5
+CHUNK_DAYS = 30
+TRADING_MINUTES_PER_YEAR = 52 * 5 * 1440
+
+
+def symbol_names(count):
+    """The runner's assets first, then SYN007, SYN008, ... up to ``count``"""
+    names = list(SYMBOL_PROFILES)[:count]
+    return names + [f"SYN{i:03d}" for i in range(len(names) + 1, count + 1)]
+
+
+def symbol_profile(symbol, seed=DEFAULT_SEED):
+    """Start price and annual volatility of a symbol
+
+    Unknown symbols get a reproducible random profile: price log-uniform
+    between 0.5 and 5000, volatility between 5% and 35%.
+    """
+    if symbol in SYMBOL_PROFILES:
+        return dict(SYMBOL_PROFILES[symbol])
+    rng = np.random.default_rng([seed, 1, *symbol.encode()])
+    return {
+        'price': float(np.exp(rng.uniform(np.log(0.5), np.log(5000.0)))),
+        'annual_vol': float(rng.uniform(0.05, 0.35)),
+    }
+
+
+def price_decimals(price):
+    """Decimals written for a price scale (six significant digits, at least two)"""
+    return max(2, 6 - int(math.floor(math.log10(price))))
+
+
+def trading_grid(start, end, timeframe):
+    """Bar timestamps in [start, end) on the FX week (weekends removed)"""
+    grid = pd.date_range(start, end, freq=f'{timeframe}min', inclusive='left')
+    day, hour = grid.dayofweek, grid.hour
+    open_ = ((day < 4)
+             | ((day == 4) & (hour < WEEKEND_CLOSE_HOUR))
+             | ((day == 6) & (hour >= WEEKEND_CLOSE_HOUR)))
+    return grid[open_]
+
+
+class _SymbolGenerator:
+    """Chunked generator of one symbol's bars; carries the price and regime
+    state from one chunk to the next."""
+
+    def __init__(self, profile, timeframe, rng):
+        self.rng = rng
+        self.timeframe = timeframe
+        self.price = profile['price']
+        self.sigma = profile['annual_vol'] / math.sqrt(TRADING_MINUTES_PER_YEAR / timeframe)
+        self.switch_prob = timeframe / (REGIME_MEAN_DAYS * 1440)
+        self.regime = rng.choice(len(REGIME_VOL), p=REGIME_PROB)
+        self.last_time = None
+        self.base_volume = rng.uniform(200, 2000) * math.sqrt(timeframe / 5)
+        # Normalized so regimes and seasonality leave the long-run variance unchanged
+        self.regime_vol = REGIME_VOL / np.sqrt(REGIME_PROB @ REGIME_VOL ** 2)
+        self.hourly_vol = HOURLY_VOL / np.sqrt(np.mean(HOURLY_VOL ** 2))
+
+    def _regimes(self, n):
+        switches = np.flatnonzero(self.rng.random(n) < self.switch_prob)
+        draws = np.concatenate(([self.regime], self.rng.choice(len(REGIME_VOL), len(switches), p=REGIME_PROB)))
+        # Index of the latest switch at or before each bar (0 = carried-over regime)
+        latest = np.zeros(n, dtype=np.int64)
+        latest[switches] = np.arange(1, len(switches) + 1)
+        np.maximum.accumulate(latest, out=latest)
+        regimes = draws[latest]
+        self.regime = regimes[-1]
+        return regimes
+
+    def bars(self, times):
+        """OHLCV arrays for the given timestamps"""
+        n = len(times)
+        rng = self.rng
+        vol = self.sigma * self.regime_vol[self._regimes(n)] * self.hourly_vol[times.hour]
+        shocks = rng.standard_t(STUDENT_T_DF, n) * math.sqrt((STUDENT_T_DF - 2) / STUDENT_T_DF)
+
+        # Gap at the first bar after the weekend (or any break in the grid)
+        stamps = times.asi8
+        previous = np.concatenate(([stamps[0] if self.last_time is None else self.last_time], stamps[:-1]))
+        gaps = (stamps - previous) > 86400 * 10 ** 9
+        gap_returns = np.where(gaps, rng.normal(0.0, 1.0, n) * self.sigma * WEEKEND_GAP_SCALE, 0.0)
+        self.last_time = stamps[-1]
+
+        log_open = math.log(self.price) + np.cumsum(gap_returns + np.concatenate(([0.0], (vol * shocks)[:-1])))
+        log_close = log_open + vol * shocks
+        open_, close = np.exp(log_open), np.exp(log_close)
+        wicks = np.abs(rng.normal(0.0, 1.0, (2, n))) * vol * 0.5
+        high = np.maximum(open_, close) * np.exp(wicks[0])
+        low = np.minimum(open_, close) * np.exp(-wicks[1])
+        volume = np.rint(self.base_volume * (vol / self.sigma) * rng.lognormal(0.0, 0.4, n)).astype(np.int64)
+        self.price = close[-1]
+        return open_, high, low, close, np.maximum(volume, 1)
+
+
+def write_symbol(path, symbol, start=DEFAULT_START, end=None, bars=None, timeframe=5, seed=DEFAULT_SEED,
+                 profile=None):
+    """Write one symbol's synthetic OHLCV CSV
+
+    Args:
+        path: Output CSV path
+        symbol: Symbol name (selects the profile and the random stream)
+        start: First calendar day
+        end: End date, exclusive (give ``end`` or ``bars``)
+        bars: Number of bars to write instead of an end date
+        timeframe: Bar size in minutes (5 or 1)
+        seed: Random seed
+        profile: {'price', 'annual_vol'} override (default: symbol_profile())
+
+    Returns:
+        int: Bars written
+    """
+    if (end is None) == (bars is None):
+        raise ValueError("give exactly one of end or bars")
+    profile = profile or symbol_profile(symbol, seed)
+    generator = _SymbolGenerator(profile, timeframe, np.random.default_rng([seed, *symbol.encode()]))
+    float_format = f"%.{price_decimals(profile['price'])}f"
+    time_labels = np.array([f"{m // 60:02d}:{m % 60:02d}:00" for m in range(1440)])
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    chunk_start = pd.Timestamp(start)
+    end = pd.Timestamp(end) if end is not None else None
+    written = 0
+    with open(path, 'w', newline='') as f:
+        f.write('Date,Time,Open,High,Low,Close,Volume\n')
+        while (end is None or chunk_start < end) and (bars is None or written < bars):
+            chunk_end = chunk_start + pd.Timedelta(days=CHUNK_DAYS)
+            if end is not None:
+                chunk_end = min(chunk_end, end)
+            times = trading_grid(chunk_start, chunk_end, timeframe)
+            if bars is not None:
+                times = times[:bars - written]
+            chunk_start = chunk_end
+            if len(times) == 0:
+                continue
+            open_, high, low, close, volume = generator.bars(times)
+            pd.DataFrame({
+                'Date': times.year * 10000 + times.month * 100 + times.day,
+                'Time': time_labels[times.hour * 60 + times.minute],
+                'Open': open_,
+                'High': high,
+                'Low': low,
+                'Close': close,
+                'Volume': volume,
+            }).to_csv(f, header=False, index=False, float_format=float_format)
+            written += len(times)
+    return written
+
+
+def file_name(symbol, timeframe, years=None, days=None):
+    """Runner-style data file name, e.g. EURUSD_5m_5Yea.csv"""
+    span = f"{years}Yea" if years else f"{days}Day"
+    return f"{symbol}_{timeframe}m_{span}.csv"
+
+
+def _write_symbol_task(args):
+    path, symbol, start, end, timeframe, seed = args
+    t0 = time.perf_counter()
+    bars = write_symbol(path, symbol, start, end=end, timeframe=timeframe, seed=seed)
+    return symbol, path, bars, time.perf_counter() - t0
+
+
+def generate_dataset(symbols, output_dir=DEFAULT_OUTPUT_DIR, start=DEFAULT_START, years=None, days=None,
+                     timeframe=5, seed=DEFAULT_SEED, workers=1, overwrite=False):
+    """Write one CSV per symbol, optionally in parallel
+
+    Args:
+        symbols: Symbol names
+        output_dir: Directory for the CSVs
+        start: First calendar day
+        years: Span in years (or give ``days``)
+        days: Span in calendar days
+        timeframe: Bar size in minutes
+        seed: Random seed
+        workers: Worker processes (1 = in-process)
+        overwrite: Replace existing files (otherwise refuse)
+
+    Returns:
+        list: (symbol, path, bars, seconds) per symbol, in symbol order
+    """
+    start = pd.Timestamp(start)
+    end = start + (pd.DateOffset(years=years) if years else pd.Timedelta(days=days))
+    output_dir = Path(output_dir)
+    tasks = [(output_dir / file_name(symbol, timeframe, years, days), symbol, start, end, timeframe, seed)
+             for symbol in symbols]
+    existing = [str(task[0]) for task in tasks if task[0].exists()]
+    if existing and not overwrite:
+        raise FileExistsError(f"Refusing to overwrite {len(existing)} file(s), e.g. {existing[0]} (use --force)")
+
+    if workers <= 1:
+        return [_write_symbol_task(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_write_symbol_task, tasks))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Seeded synthetic OHLCV data for the SunriseOgle runner')
+    span = parser.add_mutually_exclusive_group(required=True)
+    span.add_argument('--years', type=int, help='Years of data per symbol')
+    span.add_argument('--days', type=int, help='Calendar days of data per symbol')
+    parser.add_argument('--symbols', default='6',
+                        help='Symbol count (runner assets first, then SYN007...) or a comma-separated list')
+    parser.add_argument('--timeframe', type=int, choices=[1, 5], default=5, help='Bar size in minutes (default: 5)')
+    parser.add_argument('--start', default=DEFAULT_START, help=f'First day (default: {DEFAULT_START})')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes (default: 1)')
+    parser.add_argument('--output-dir', default=str(DEFAULT_OUTPUT_DIR))
+    parser.add_argument('--force', action='store_true', help='Overwrite existing files')
+    args = parser.parse_args(argv)
+    args.symbols = (symbol_names(int(args.symbols)) if args.symbols.isdigit()
+                    else [s.strip().upper() for s in args.symbols.split(',') if s.strip()])
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    t0 = time.perf_counter()
+    try:
+        rows = generate_dataset(args.symbols, args.output_dir, args.start, args.years, args.days,
+                                args.timeframe, args.seed, args.workers, overwrite=args.force)
+    except FileExistsError as e:
+        sys.exit(f"[ERROR] {e}")
+    for symbol, path, bars, seconds in rows:
+        print(f"  {symbol:<8} {bars:>10,} bars  {seconds:>6.1f}s  {path}")
+    total = sum(row[2] for row in rows)
+    print(f"[DONE] {len(rows)} file(s), {total:,} bars in {time.perf_counter() - t0:.1f}s")
@@ -0,0 +1,460 @@
+"""SunriseOgle Walk-Forward Optimizer
+Splits FROMDATE..TODATE into folds of a rolling (or anchored) in-sample
+window followed by an out-of-sample slice. For every fold the search space
+is swept over the in-sample window, the best combination is tested on the
+next out-of-sample slice, and the out-of-sample slices are stitched into
+one equity curve per asset.
+
+All in-sample and out-of-sample runs of an asset share one process pool.
+Each worker loads the asset's price arrays once (through the binary data
+cache) and serves every fold from slices of them; the vector backend also
+reuses the fold's EMA/ATR series across combinations that share indicator
+lengths. Every slice is an independent run starting with the asset's
+allocated cash, exactly like a backtest with FROMDATE/TODATE set to it.
+
+Outputs in results/walk_forward/:
+- <ASSET>_folds.csv: fold windows, chosen parameters, in/out-of-sample metrics
+- <ASSET>_oos_equity.csv: stitched out-of-sample equity (compounded across folds)
+- <ASSET>_stability.csv: per-parameter stability of the chosen values
+
+The search space file has the same format as optimizer.py.
+
+Usage:
+    python walk_forward.py --space sweep.json --in-sample 12 --out-of-sample 3 --workers 8
+    python walk_forward.py --space sweep.json --asset EURUSD --anchored --random 200
+"""
+
+import argparse
+import calendar
+import csv
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime as dt, timedelta
+from pathlib import Path
+
+import numpy as np
+
+BASE_DIR = Path(__file__).resolve().parent
+sys.path.append(str(BASE_DIR / 'strategies'))
+
+import optimizer
+from equity_recorder import datenums_to_datetime64
+from portfolio_metrics import equity_metrics
+
+DEFAULT_OUTPUT_DIR = BASE_DIR / 'results' / 'walk_forward'
+RANK_METRICS = ['profit_factor', 'sharpe_ratio', 'max_drawdown_pct', 'net_pnl', 'trades']
+OOS_COLUMNS = ['trades', 'profit_factor', 'sharpe_ratio', 'max_drawdown_pct', 'net_pnl', 'return_pct', 'win_rate']
+
+# Indicator series kept per worker (fold x indicator lengths)
+_INDICATOR_CACHE_SIZE = 32
+
+# Per-process state populated by _init_worker()
+_WORKER = {}
+
+
+# =============================================================================
+# FOLDS
+# =============================================================================
+
+def _add_months(day, months):
+    month = day.month - 1 + months
+    year = day.year + month // 12
+    month = month % 12 + 1
+    return day.replace(year=year, month=month, day=min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def make_folds(fromdate, todate, in_sample_months, out_of_sample_months, anchored=False):
+    """Split a date range into walk-forward folds
+
+    Out-of-sample slices are consecutive and do not overlap; the in-sample
+    window ends where its slice starts. Rolling windows keep a fixed length,
+    anchored windows all start at ``fromdate``. The last slice is cut at
+    ``todate``.
+
+    Args:
+        fromdate: Start date string (YYYY-MM-DD)
+        todate: End date string (YYYY-MM-DD)
+        in_sample_months: In-sample window length in months
+        out_of_sample_months: Out-of-sample slice length in months
+        anchored: Grow the in-sample window from ``fromdate`` instead of rolling it
+
+    Returns:
+        list: Dicts with 'fold', 'is_start', 'is_end', 'oos_start', 'oos_end'
+        datetimes (ends inclusive, one second before the next boundary)
+    """
+    if in_sample_months < 1 or out_of_sample_months < 1:
+        raise ValueError("in-sample and out-of-sample lengths must be at least one month")
+    start = dt.strptime(fromdate, '%Y-%m-%d')
+    end = dt.strptime(todate, '%Y-%m-%d')
+    one_second = timedelta(seconds=1)
+
+    folds = []
+    oos_start = _add_months(start, in_sample_months)
+    while oos_start < end:
+        oos_stop = min(_add_months(oos_start, out_of_sample_months), end)
+        is_start = start if anchored else _add_months(oos_start, -in_sample_months)
+        folds.append({
+            'fold': len(folds) + 1,
+            'is_start': is_start,
+            'is_end': oos_start - one_second,
+            'oos_start': oos_start,
+            'oos_end': oos_stop - one_second,
+        })
+        oos_start = oos_stop
+    return folds
+
+
+# =============================================================================
+# WORKERS
+# =============================================================================
+
+def _init_worker(asset_name, fromdate, todate, starting_cash, backend):
+    """Process initializer: load the asset's data once for every fold"""
+    import sunrise_ogle_multi_asset as runner
+    import signal_engine
+
+    asset_config = runner.ASSETS[asset_name]
+    data_path = BASE_DIR / 'data' / asset_config['data_file']
+    _WORKER.clear()
+    _WORKER.update({
+        'asset': asset_name,
+        'asset_config': asset_config,
+        'cash': starting_cash * asset_config['allocation'],
+        'backend': backend,
+        'indicators': {},
+    })
+    if backend == 'vector':
+        _WORKER['prices'] = signal_engine.load_price_arrays(data_path, fromdate, todate)
+    else:
+        from data_cache import load_ohlcv_cache
+        _WORKER['records'] = load_ohlcv_cache(data_path)
+
+
+def _price_slice(start, end):
+    """Views of the worker's price arrays between two datetimes (inclusive)"""
+    from data_cache import date_range_slice
+
+    prices = _WORKER['prices']
+    rows = date_range_slice(prices['datenum'], start, end)
+    return {name: values[rows] for name, values in prices.items()}
+
+
+def _slice_indicators(start, end, prices, params):
+    """EMA/ATR series of a slice, shared by combinations with the same lengths"""
+    import signal_engine
+
+    w = _WORKER
+    engine_params = signal_engine.strategy_params(w['asset_config']['strategy_class'], **params)
+    lengths = tuple(engine_params[f'{name}_length'] for name in (
+        'ema_fast', 'ema_medium', 'ema_slow', 'ema_confirm', 'ema_filter_price', 'ema_exit', 'atr'))
+    key = (start, end, lengths)
+    cache = w['indicators']
+    if key not in cache:
+        if len(cache) >= _INDICATOR_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = signal_engine.compute_indicators(prices, engine_params)
+    return cache[key]
+
+
+def _run_slice(start, end, params):
+    w = _WORKER
+    if w['backend'] == 'vector':
+        prices = _price_slice(start, end)
+        indicators = _slice_indicators(start, end, prices, params)
+        return optimizer.run_vector(prices, w['asset_config'], w['cash'], params, indicators=indicators)
+    return optimizer.run_backtrader(w['records'], w['asset_config'], w['cash'], start, end, params)
+
+
+def _evaluate_in_sample(fold, cid, params, start, end):
+    """In-sample run of one combination, never raising"""
+    row = {'fold': fold, 'combo_id': cid, 'params': params}
+    try:
+        row.update(_run_slice(start, end, params)[0])
+        row['error'] = ''
+    except Exception as e:
+        row['error'] = f"{type(e).__name__}: {e}"
+    return row
+
+
+def _evaluate_out_of_sample(fold, params, start, end):
+    """Out-of-sample run of a fold's chosen combination (metrics and equity)"""
+    metrics, equity, datenums = _run_slice(start, end, params)
+    return fold, metrics, np.asarray(equity, dtype=np.float64), np.asarray(datenums, dtype=np.float64)
+
+
+def _run_tasks(fn, tasks, workers, init_args):
+    """Yield fn(*task) results, in-process or across a process pool"""
+    if workers == 1:
+        _init_worker(*init_args)
+        for task in tasks:
+            yield fn(*task)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=init_args) as executor:
+        yield from optimizer.bounded_map(executor, fn, tasks, workers * 4)
+
+
+# =============================================================================
+# SELECTION, STITCHING AND STABILITY
+# =============================================================================
+
+def select_best(rows, rank_by='profit_factor', min_trades=1):
+    """Best in-sample row of a fold (None when no row qualifies; ties keep the first)"""
+    candidates = [row for row in rows if not row['error'] and row['trades'] >= min_trades]
+    if not candidates:
+        return None
+    if rank_by == 'max_drawdown_pct':
+        return min(candidates, key=lambda row: row[rank_by])
+    return max(candidates, key=lambda row: row[rank_by])
+
+
+def stitch_equity(slices, cash):
+    """Chain out-of-sample equity slices into one compounded curve
+
+    Every slice starts from ``cash``; it is scaled so it starts from the
+    value the previous slice ended at.
+
+    Args:
+        slices: (fold, equity, datenums) tuples in fold order
+        cash: Starting cash of every slice
+
+    Returns:
+        tuple: (fold, equity, datenums) arrays of the stitched curve
+    """
+    folds, values, datenums = [], [], []
+    level = 1.0
+    for fold, equity, stamps in slices:
+        if len(equity) == 0:
+            continue
+        values.append(equity * level)
+        datenums.append(stamps)
+        folds.append(np.full(len(equity), fold))
+        level *= equity[-1] / cash
+    if not values:
+        empty = np.empty(0, dtype=np.float64)
+        return np.empty(0, dtype=np.int64), empty, empty
+    return np.concatenate(folds), np.concatenate(values), np.concatenate(datenums)
+
+
+def parameter_stability(chosen):
+    """Stability of the chosen value of every parameter across folds
+
+    Args:
+        chosen: Parameter dicts, one per fold that produced a selection
+
+    Returns:
+        list: One dict per parameter (values per fold, distinct values, most
+        common value and its share, fold-to-fold changes and, for numeric
+        parameters, mean, std and coefficient of variation)
+    """
+    report = []
+    for name in sorted({name for params in chosen for name in params}):
+        values = [params.get(name) for params in chosen]
+        mode, mode_count = Counter(map(repr, values)).most_common(1)[0]
+        row = {
+            'parameter': name,
+            'values': ' '.join(map(str, values)),
+            'distinct': len(set(map(repr, values))),
+            'most_common': next(v for v in values if repr(v) == mode),
+            'most_common_share': mode_count / len(values),
+            'changes': sum(a != b for a, b in zip(values, values[1:])),
+            'mean': '', 'std': '', 'cv': '',
+        }
+        if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+            mean, std = float(np.mean(values)), float(np.std(values))
+            row.update(mean=mean, std=std, cv=std / abs(mean) if mean else 0.0)
+        report.append(row)
+    return report
+
+
+def _write_rows(path, rows, columns):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+# =============================================================================
+# WALK-FORWARD
+# =============================================================================
+
+def run_walk_forward(asset_name, space, fromdate, todate, starting_cash, in_sample_months=12,
+                     out_of_sample_months=3, anchored=False, output_dir=DEFAULT_OUTPUT_DIR,
+                     backend='vector', samples=None, seed=0, rank_by='profit_factor',
+                     min_trades=10, workers=None):
+    """Run a walk-forward optimization for one asset
+
+    Args:
+        asset_name: Asset key from sunrise_ogle_multi_asset.ASSETS
+        space: Dict param -> spec for this asset (optimizer.py format)
+        fromdate: Start date string (YYYY-MM-DD)
+        todate: End date string (YYYY-MM-DD)
+        starting_cash: Total portfolio cash (split by asset allocation)
+        in_sample_months: In-sample window length
+        out_of_sample_months: Out-of-sample slice length (the fold step)
+        anchored: Grow the in-sample window from ``fromdate``
+        output_dir: Directory for the fold, equity and stability tables
+        backend: 'vector' (signal engine) or 'backtrader'
+        samples: None for grid search, otherwise number of random draws
+        seed: Random search seed
+        rank_by: In-sample metric that selects a fold's parameters
+        min_trades: Minimum in-sample trades for a combination to be selected
+        workers: Worker processes (default: CPU count, 1 = in-process)
+
+    Returns:
+        dict: 'folds' (fold rows), 'equity' (stitched out-of-sample curve),
+        'metrics' (equity_metrics of that curve) and 'stability'
+    """
+    import sunrise_ogle_multi_asset as runner
+
+    asset_config = runner.ASSETS[asset_name]
+    known = dict(asset_config['strategy_class'].params._getitems())
+    unknown = sorted(set(space) - set(known))
+    if unknown:
+        raise ValueError(f"{asset_name}: unknown strategy parameter(s): {', '.join(unknown)}")
+
+    folds = make_folds(fromdate, todate, in_sample_months, out_of_sample_months, anchored)
+    if not folds:
+        raise ValueError(f"{fromdate}..{todate} is too short for a {in_sample_months}-month in-sample window")
+    combos = optimizer.generate_combinations(space, samples=samples, seed=seed)
+    cash = starting_cash * asset_config['allocation']
+    workers = workers or os.cpu_count() or 1
+    init_args = (asset_name, folds[0]['is_start'], folds[-1]['oos_end'], starting_cash, backend)
+    print(f"[WALK-FORWARD] {asset_name} ({backend}): {len(folds)} folds x {len(combos)} combinations "
+          f"({in_sample_months}m {'anchored' if anchored else 'rolling'} in-sample, "
+          f"{out_of_sample_months}m out-of-sample)")
+
+    # In-sample sweeps of every fold share the pool
+    t0 = time.perf_counter()
+    tasks = [(f['fold'], optimizer.combo_id(c), c, f['is_start'], f['is_end']) for f in folds for c in combos]
+    in_sample = {f['fold']: [] for f in folds}
+    for n, row in enumerate(_run_tasks(_evaluate_in_sample, tasks, workers, init_args), 1):
+        in_sample[row['fold']].append(row)
+        if n % 500 == 0 or n == len(tasks):
+            print(f"  in-sample {n}/{len(tasks)} done ({n / max(time.perf_counter() - t0, 1e-9):.1f}/s)")
+
+    # Completion order varies with the pool; ties go to the earliest combination
+    order = {optimizer.combo_id(c): n for n, c in enumerate(combos)}
+    best = {fold: select_best(sorted(rows, key=lambda row: order[row['combo_id']]), rank_by, min_trades)
+            for fold, rows in in_sample.items()}
+
+    # Out-of-sample test of each fold's selection
+    tasks = [(f['fold'], best[f['fold']]['params'], f['oos_start'], f['oos_end'])
+             for f in folds if best[f['fold']] is not None]
+    out_of_sample = {fold: (metrics, equity, datenums)
+                     for fold, metrics, equity, datenums in _run_tasks(_evaluate_out_of_sample, tasks,
+                                                                        workers, init_args)}
+
+    fold_rows = []
+    for f in folds:
+        row = {key: (value.strftime('%Y-%m-%d %H:%M:%S') if isinstance(value, dt) else value)
+               for key, value in f.items()}
+        selection = best[f['fold']]
+        if selection is None:
+            row['note'] = f"no combination with {min_trades}+ in-sample trades"
+        else:
+            row.update(selection['params'])
+            row[f'is_{rank_by}'] = selection[rank_by]
+            row['is_trades'] = selection['trades']
+            row['is_return_pct'] = selection['return_pct']
+            row.update({f'oos_{name}': out_of_sample[f['fold']][0][name] for name in OOS_COLUMNS})
+        fold_rows.append(row)
+
+    slices = [(fold, equity, datenums) for fold, (_, equity, datenums) in sorted(out_of_sample.items())]
+    fold_index, equity, datenums = stitch_equity(slices, cash)
+    metrics = equity_metrics(equity)
+    stability = parameter_stability([best[f['fold']]['params'] for f in folds if best[f['fold']] is not None])
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    fold_columns = (['fold', 'is_start', 'is_end', 'oos_start', 'oos_end'] + sorted(space)
+                    + [f'is_{rank_by}', 'is_trades', 'is_return_pct']
+                    + [f'oos_{name}' for name in OOS_COLUMNS] + ['note'])
+    _write_rows(output_dir / f"{asset_name}_folds.csv", fold_rows, list(dict.fromkeys(fold_columns)))
+    _write_rows(output_dir / f"{asset_name}_stability.csv", stability,
+                ['parameter', 'values', 'distinct', 'most_common', 'most_common_share',
+                 'changes', 'mean', 'std', 'cv'])
+    timestamps = datenums_to_datetime64(datenums).astype('datetime64[s]').astype(str)
+    with open(output_dir / f"{asset_name}_oos_equity.csv", 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['timestamp', 'fold', 'value'])
+        writer.writerows(zip(timestamps.tolist(), fold_index.tolist(), np.round(equity, 6).tolist()))
+
+    return {'folds': fold_rows, 'equity': equity, 'metrics': metrics, 'stability': stability}
+
+
+def print_walk_forward(asset_name, result, cash):
+    """Print the fold table, out-of-sample summary and parameter stability"""
+    print(f"\n[FOLDS] {asset_name}")
+    for row in result['folds']:
+        window = f"  #{row['fold']:<3} OOS {row['oos_start'][:10]}..{row['oos_end'][:10]}"
+        if 'note' in row:
+            print(f"{window}  skipped: {row['note']}")
+        else:
+            print(f"{window}  trades {row['oos_trades']:>4}  PF {row['oos_profit_factor']:6.2f}  "
+                  f"return {row['oos_return_pct']:+7.2f}%")
+
+    equity = result['equity']
+    if len(equity):
+        metrics = result['metrics']
+        print(f"[OUT-OF-SAMPLE] {asset_name}: return {(equity[-1] / cash - 1) * 100:+.2f}% | "
+              f"Sharpe {metrics['sharpe_ratio']:.2f} | max DD {metrics['max_drawdown_pct']:.2f}%")
+
+    print(f"[STABILITY] {asset_name}")
+    for row in result['stability']:
+        spread = f"  cv {row['cv']:.2f}" if row['cv'] != '' else ''
+        print(f"  {row['parameter']:<36} {row['distinct']} distinct, {row['changes']} changes, "
+              f"most common {row['most_common']} ({row['most_common_share']:.0%}){spread}")
+
+
+def parse_args(argv=None):
+    """Parse command line options for the walk-forward optimizer"""
+    import sunrise_ogle_multi_asset as runner
+
+    parser = argparse.ArgumentParser(description='Parallel SunriseOgle walk-forward optimization')
+    parser.add_argument('--space', required=True, help='JSON search space file ({asset: {param: spec}})')
+    parser.add_argument('--asset', action='append', choices=list(runner.ASSETS.keys()),
+                        help='Asset to optimize (repeatable, default: every asset in the space file)')
+    parser.add_argument('--in-sample', type=int, default=12, metavar='MONTHS',
+                        help='In-sample window length in months (default: 12)')
+    parser.add_argument('--out-of-sample', type=int, default=3, metavar='MONTHS',
+                        help='Out-of-sample slice length in months (default: 3)')
+    parser.add_argument('--anchored', action='store_true',
+                        help='Grow the in-sample window from --fromdate instead of rolling it')
+    parser.add_argument('--random', type=int, metavar='N',
+                        help='Random search with N samples instead of the full grid')
+    parser.add_argument('--seed', type=int, default=0, help='Random search seed (default: 0)')
+    parser.add_argument('--backend', choices=optimizer.BACKENDS, default='vector')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count, 1 = in-process)')
+    parser.add_argument('--fromdate', default=runner.FROMDATE)
+    parser.add_argument('--todate', default=runner.TODATE)
+    parser.add_argument('--cash', type=float, default=runner.STARTING_CASH,
+                        help='Total portfolio cash, split by asset allocation')
+    parser.add_argument('--output-dir', default=str(DEFAULT_OUTPUT_DIR))
+    parser.add_argument('--rank-by', default='profit_factor', choices=RANK_METRICS)
+    parser.add_argument('--min-trades', type=int, default=10,
+                        help='Minimum in-sample trades for a combination to be selected (default: 10)')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    import sunrise_ogle_multi_asset as runner
+
+    args = parse_args()
+    search_space = optimizer.load_search_space(args.space)
+    assets = args.asset or list(search_space)
+    missing = [a for a in assets if a not in search_space]
+    if missing:
+        sys.exit(f"[ERROR] No search space for: {', '.join(missing)}")
+
+    for asset in assets:
+        result = run_walk_forward(asset, search_space[asset], args.fromdate, args.todate, args.cash,
+                                  in_sample_months=args.in_sample, out_of_sample_months=args.out_of_sample,
+                                  anchored=args.anchored, output_dir=args.output_dir,
+                                  backend=args.backend, samples=args.random, seed=args.seed,
+                                  rank_by=args.rank_by, min_trades=args.min_trades, workers=args.workers)
+        print_walk_forward(asset, result, args.cash * runner.ASSETS[asset]['allocation'])